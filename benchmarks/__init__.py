@@ -0,0 +1 @@
+"""Benchmark harness: synthetic sites and timed build/check scenarios."""
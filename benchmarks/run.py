@@ -0,0 +1,179 @@
+"""Benchmark scenarios over a synthetic site, with baseline comparison.
+
+Run from the repository root::
+
+    python -m benchmarks.run --posts 2000 --repeat 3
+    python -m benchmarks.run --save-baseline      # record benchmarks/baseline.json
+    python -m benchmarks.run --compare            # exit 1 on regressions
+
+Each measurement runs in a fresh (spawned) process so peak RSS is per scenario.
+Peak RSS needs the POSIX ``resource`` module; elsewhere it is not reported or
+compared. No baseline is committed (timings are machine-specific): record one
+with ``--save-baseline`` on the machine that will run ``--compare``.
+"""
+
+import argparse
+import json
+import multiprocessing
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.sitegen import SiteSpec, generate_site
+
+SCENARIOS = ("cold", "warm", "edit", "check")
+DEFAULT_BASELINE = Path(__file__).parent / "baseline.json"
+
+
+def prepare(scenario: str, root: Path) -> None:
+    """Bring the site into the state a scenario starts from (outside the timing)."""
+    if scenario == "cold":
+        for name in ("dist", ".pycobello"):
+            shutil.rmtree(root / name, ignore_errors=True)
+    elif scenario in ("warm", "edit"):
+        _build(root)
+    if scenario == "edit":
+        post = min((root / "content" / "posts").glob("*.md"))
+        post.write_text(post.read_text() + f"\nEdited at {time.time()}.\n")
+
+
+def _build(root: Path):
+    from pycobello.build.pipeline import run_pipeline
+    from pycobello.config.load import load_config
+
+    return run_pipeline(load_config(str(root)), project_root=root)
+
+
+def _measure(scenario: str, root: str, queue) -> None:
+    """Child process: time one scenario and report seconds and peak RSS."""
+    from pycobello.build.pipeline import run_pipeline  # noqa: F401 (import outside timing)
+    from pycobello.diagnostics.checks import run_checks
+
+    root_path = Path(root)
+    start = time.perf_counter()
+    if scenario == "check":
+        try:
+            run_checks(root)
+        except SystemExit:
+            pass
+    else:
+        _build(root_path)
+    seconds = time.perf_counter() - start
+    queue.put({"seconds": seconds, "peak_rss_mb": _peak_rss_mb()})
+
+
+def _peak_rss_mb() -> float | None:
+    """Peak resident set size of this process, or None without ``resource`` (Windows)."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        rss_kb //= 1024
+    return rss_kb / 1024
+
+
+def run_scenario(scenario: str, root: Path, repeat: int = 3) -> dict:
+    """Median seconds and max peak RSS over ``repeat`` fresh-process runs."""
+    ctx = multiprocessing.get_context("spawn")
+    runs = []
+    for _ in range(repeat):
+        prepare(scenario, root)
+        queue = ctx.Queue()
+        proc = ctx.Process(target=_measure, args=(scenario, str(root), queue))
+        proc.start()
+        runs.append(queue.get())
+        proc.join()
+    rss = [r["peak_rss_mb"] for r in runs if r["peak_rss_mb"] is not None]
+    return {
+        "seconds": statistics.median(r["seconds"] for r in runs),
+        "peak_rss_mb": max(rss) if rss else None,
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float = 0.2) -> list[str]:
+    """Regressions: scenarios slower (or using more memory) than baseline by > tolerance."""
+    problems = []
+    for scenario, current in results.items():
+        base = baseline.get(scenario)
+        if base is None:
+            continue
+        for metric in ("seconds", "peak_rss_mb"):
+            if current.get(metric) is None or base.get(metric) is None:
+                continue
+            if current[metric] > base[metric] * (1 + tolerance):
+                problems.append(
+                    f"{scenario}: {metric} {current[metric]:.3f} > baseline {base[metric]:.3f}"
+                )
+    return problems
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    defaults = SiteSpec()
+    parser.add_argument("--posts", type=int, default=defaults.posts)
+    parser.add_argument("--pages", type=int, default=defaults.pages)
+    parser.add_argument("--paragraphs", type=int, default=defaults.paragraphs)
+    parser.add_argument("--template-depth", type=int, default=defaults.template_depth)
+    parser.add_argument("--assets", type=int, default=defaults.assets)
+    parser.add_argument("--asset-bytes", type=int, default=defaults.asset_bytes)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--scenario", action="append", choices=SCENARIOS)
+    parser.add_argument("--site", type=Path, help="Reuse or create the site here.")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--compare", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args(argv)
+    if args.compare and not args.save_baseline and not args.baseline.is_file():
+        print(f"No baseline at {args.baseline}; record one with --save-baseline first.")
+        return 2
+
+    spec = SiteSpec(
+        posts=args.posts,
+        pages=args.pages,
+        paragraphs=args.paragraphs,
+        template_depth=args.template_depth,
+        assets=args.assets,
+        asset_bytes=args.asset_bytes,
+    )
+    tmp = None
+    if args.site is None:
+        tmp = tempfile.TemporaryDirectory(prefix="pycobello-bench-")
+        root = generate_site(Path(tmp.name), spec)
+    elif not (args.site / "pycobello.yml").exists():
+        root = generate_site(args.site, spec)
+    else:
+        root = args.site
+    try:
+        results = {}
+        for scenario in args.scenario or SCENARIOS:
+            results[scenario] = run_scenario(scenario, root, args.repeat)
+            r = results[scenario]
+            rss = "n/a" if r["peak_rss_mb"] is None else f"{r['peak_rss_mb']:.1f}"
+            print(f"{scenario:<6} {r['seconds'] * 1000:10.1f} ms  {rss:>8} MB")
+    finally:
+        if tmp is not None:
+            tmp.cleanup()
+
+    report = {"spec": vars(spec), "results": results}
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"Baseline written to {args.baseline}")
+    if args.compare:
+        baseline = json.loads(args.baseline.read_text())
+        if baseline.get("spec") != report["spec"]:
+            print("Warning: baseline was recorded for a different site spec.")
+        problems = compare(results, baseline.get("results", {}), args.tolerance)
+        for p in problems:
+            print(f"REGRESSION {p}")
+        return 1 if problems else 0
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
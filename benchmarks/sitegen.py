@@ -0,0 +1,111 @@
+"""Synthetic site generator for benchmarks, built on the ``pycobello init`` scaffold."""
+
+import os
+import random
+import time
+from dataclasses import dataclass
+from datetime import date, timedelta
+from pathlib import Path
+
+from pycobello.scaffold import create_scaffold
+
+WORDS = (
+    "static site generator build render template markdown cache index page post "
+    "python fast incremental theme asset link archive collection output content"
+).split()
+
+
+@dataclass
+class SiteSpec:
+    """Size of a synthetic site."""
+
+    posts: int = 1000
+    pages: int = 50
+    paragraphs: int = 8
+    template_depth: int = 3
+    assets: int = 100
+    asset_bytes: int = 16 * 1024
+    tags: int = 20
+    seed: int = 0
+
+
+def generate_site(root: Path, spec: SiteSpec) -> Path:
+    """Create a site under ``root`` (scaffold config and theme plus generated content)."""
+    root = Path(root)
+    root.mkdir(parents=True, exist_ok=True)
+    rng = random.Random(spec.seed)
+    _scaffold_quietly(root)
+    (root / "content" / "posts").mkdir(parents=True, exist_ok=True)
+    for sample in (root / "content").rglob("*.md"):
+        sample.unlink()
+    cfg = root / "pycobello.yml"
+    cfg.write_text(cfg.read_text().replace("taxonomies: []", "taxonomies:\n  - tags"))
+
+    start = date(2015, 1, 1)
+    slugs = [f"post-{i:06d}" for i in range(spec.posts)]
+    for i, slug in enumerate(slugs):
+        day = start + timedelta(days=i)
+        tags = sorted({f"tag-{rng.randrange(max(spec.tags, 1))}" for _ in range(3)})
+        links = [f"/blog/{rng.choice(slugs)}/" for _ in range(2)]
+        (root / "content" / "posts" / f"{day.isoformat()}-{slug}.md").write_text(
+            f"---\ntitle: Post {i}\nslug: {slug}\ndate: {day.isoformat()}\ntags: {tags}\n---\n\n"
+            + _body(rng, spec.paragraphs, links),
+            encoding="utf-8",
+        )
+    pages_dir = root / "content" / "pages"
+    pages_dir.mkdir(parents=True, exist_ok=True)
+    for i in range(spec.pages):
+        (pages_dir / f"page-{i:04d}.md").write_text(
+            f"---\ntitle: Page {i}\n---\n\n" + _body(rng, spec.paragraphs, []),
+            encoding="utf-8",
+        )
+
+    _write_template_chain(root / "theme" / "templates", spec.template_depth)
+    assets = root / "static" / "assets"
+    assets.mkdir(parents=True, exist_ok=True)
+    for i in range(spec.assets):
+        (assets / f"asset-{i:05d}.bin").write_bytes(rng.randbytes(spec.asset_bytes))
+    # Fixed, old mtimes: like a checkout that has not been touched since.
+    stamp = time.time() - 3600
+    for path in root.rglob("*"):
+        os.utime(path, (stamp, stamp))
+    return root
+
+
+def _scaffold_quietly(root: Path) -> None:
+    import contextlib
+    import io
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        create_scaffold(str(root))
+
+
+def _body(rng: random.Random, paragraphs: int, links: list[str]) -> str:
+    parts = []
+    for p in range(paragraphs):
+        words = " ".join(rng.choice(WORDS) for _ in range(60))
+        parts.append(words.capitalize() + ".")
+        if p % 3 == 1:
+            parts.append("\n".join(f"- {rng.choice(WORDS)} item" for _ in range(4)))
+        if p % 4 == 2:
+            parts.append("```python\nfor i in range(10):\n    print(i)\n```")
+    parts += [f"See [related]({link})." for link in links]
+    return "\n\n".join(parts) + "\n"
+
+
+def _write_template_chain(templates: Path, depth: int) -> None:
+    """Nest ``depth`` partials (each including the next) into base.html's body."""
+    if depth <= 0:
+        return
+    partials = templates / "partials"
+    partials.mkdir(parents=True, exist_ok=True)
+    for level in range(1, depth + 1):
+        inner = f'{{% include "partials/level{level + 1}.html" %}}' if level < depth else ""
+        (partials / f"level{level}.html").write_text(
+            f'<div class="level{level}">{{{{ site.title }}}}{inner}</div>\n', encoding="utf-8"
+        )
+    base = templates / "base.html"
+    base.write_text(
+        base.read_text().replace("</body>", '{% include "partials/level1.html" %}\n</body>'),
+        encoding="utf-8",
+    )
@@ -1,35 +1,149 @@
-"""Copy static assets (theme/static + static/). Step 6."""
+"""Static asset sync (theme/static overlaid by static/). Step 6."""
 
+import os
 import shutil
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 
+from pycobello.build.writer import prune_empty_dirs
 
-def copy_assets(
-    theme_static: Path,
-    user_static: Path,
+FICLONE = 0x40049409  # Linux ioctl: share extents (reflink) on btrfs, XFS, ...
+
+
+@dataclass
+class AssetSync:
+    """Outcome of a sync: copied/removed destinations and the new cache entries."""
+
+    copied: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    entries: dict[str, dict] = field(default_factory=dict)
+
+
+def resolve_overlay(source_dirs: list[Path]) -> dict[str, tuple[Path, os.stat_result]]:
+    """Relative path -> (source file, stat); later directories win."""
+    resolved: dict[str, tuple[Path, os.stat_result]] = {}
+    for src_dir in source_dirs:
+        if src_dir.is_dir():
+            _scan(src_dir, "", resolved)
+    return resolved
+
+
+def _scan(directory: Path, prefix: str, out: dict) -> None:
+    with os.scandir(directory) as it:
+        for entry in it:
+            rel = f"{prefix}{entry.name}"
+            if entry.is_dir():
+                _scan(Path(entry.path), f"{rel}/", out)
+            elif entry.is_file():
+                out[rel] = (Path(entry.path), entry.stat())
+
+
+def sync_assets(
+    source_dirs: list[Path],
     output_static: Path,
-) -> list[str]:
-    """Copy theme/static then static/ to output/static. Return list of copied paths."""
-    copied: list[str] = []
+    cached: Mapping | None = None,
+    hardlink: bool = False,
+    workers: int | None = None,
+) -> AssetSync:
+    """Make ``output_static`` mirror the overlay of ``source_dirs``.
+
+    Each destination is written at most once, only when it no longer matches its
+    source's size and mtime, via a temp file and rename, on a thread pool. Files
+    are hardlinked when ``hardlink`` is set, else reflinked or copied in-kernel
+    where supported. Destinations recorded in ``cached`` (the previous sync's
+    entries) whose source is gone are deleted.
+    """
+    cached = {} if cached is None else cached
+    result = AssetSync()
+    todo: list[tuple[Path, Path]] = []
     output_static.mkdir(parents=True, exist_ok=True)
-    for src_dir in (theme_static, user_static):
-        if not src_dir.is_dir():
+    for rel, (src, st) in sorted(resolve_overlay(source_dirs).items()):
+        entry = {"src": str(src), "mtime_ns": st.st_mtime_ns, "size": st.st_size}
+        result.entries[rel] = entry
+        dst = output_static / rel
+        if not _is_current(dst, st, hardlink):
+            todo.append((src, dst))
+    for rel in cached.keys() - result.entries.keys():
+        dst = output_static / rel
+        try:
+            dst.unlink()
+        except OSError:
             continue
-        for src in src_dir.rglob("*"):
-            if src.is_file():
-                rel = src.relative_to(src_dir)
-                dst = output_static / rel
-                if _should_copy(src, dst):
-                    dst.parent.mkdir(parents=True, exist_ok=True)
-                    shutil.copy2(src, dst)
-                    copied.append(str(dst))
-    return copied
-
-
-def _should_copy(src: Path, dst: Path) -> bool:
-    """Copy if dst missing or mtime/size differ."""
-    if not dst.exists():
-        return True
-    stat_s = src.stat()
-    stat_d = dst.stat()
-    return stat_s.st_mtime != stat_d.st_mtime or stat_s.st_size != stat_d.st_size
+        result.removed.append(str(dst))
+        prune_empty_dirs(dst.parent, output_static)
+
+    for parent in {dst.parent for _, dst in todo}:
+        parent.mkdir(parents=True, exist_ok=True)
+    if len(todo) > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(lambda pair: _install(*pair, hardlink), todo))
+    else:
+        for src, dst in todo:
+            _install(src, dst, hardlink)
+    result.copied = [str(dst) for _, dst in todo]
+    return result
+
+
+def _is_current(dst: Path, st: os.stat_result, hardlink: bool) -> bool:
+    """Destination matches the source (size and mtime; same inode for hardlinks)."""
+    try:
+        dst_st = dst.stat()
+    except OSError:
+        return False
+    if hardlink:
+        return dst_st.st_ino == st.st_ino and dst_st.st_dev == st.st_dev
+    return dst_st.st_size == st.st_size and dst_st.st_mtime_ns == st.st_mtime_ns
+
+
+def _install(src: Path, dst: Path, hardlink: bool) -> None:
+    tmp = dst.with_name(f".{dst.name}.{os.getpid()}.tmp")
+    try:
+        if hardlink:
+            try:
+                os.link(src, tmp)
+            except OSError:
+                _copy(src, tmp)
+        else:
+            _copy(src, tmp)
+        os.replace(tmp, dst)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _copy(src: Path, dst: Path) -> None:
+    """Reflink, else ``copy_file_range``, else a regular copy; then copy mtime/mode."""
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        if not (_reflink(fsrc, fdst) or _copy_file_range(fsrc, fdst)):
+            shutil.copyfileobj(fsrc, fdst, 1024 * 1024)
+    shutil.copystat(src, dst)
+
+
+def _reflink(fsrc, fdst) -> bool:
+    try:
+        import fcntl
+
+        fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+    except (ImportError, OSError):
+        return False
+    return True
+
+
+def _copy_file_range(fsrc, fdst) -> bool:
+    if not hasattr(os, "copy_file_range"):
+        return False
+    size = os.fstat(fsrc.fileno()).st_size
+    copied = 0
+    try:
+        while copied < size:
+            n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), size - copied)
+            if n == 0:
+                break
+            copied += n
+    except OSError:
+        if copied:
+            raise
+        return False
+    return copied == size
@@ -1,9 +1,17 @@
-"""Cache manifest (JSON) read/write and hashing. Step 7."""
+"""Build cache (SQLite, ``.pycobello/cache.db``) and content hashing. Step 7."""
 
 import hashlib
 import json
+import os
+import sqlite3
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import dataclass
 from pathlib import Path
 
+from pycobello.log import LOG
+
+HASH_BACKENDS = ("auto", "sha256", "blake2b", "xxhash")
+
 
 def content_sha256(content: bytes | str) -> str:
     """SHA256 hex digest of content."""
@@ -12,19 +20,302 @@ def content_sha256(content: bytes | str) -> str:
     return hashlib.sha256(content).hexdigest()
 
 
-def file_sha256(path: Path) -> str:
-    """SHA256 of file contents."""
-    return content_sha256(path.read_bytes())
+def _blake2b(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _xxhash() -> Callable[[bytes], str] | None:
+    try:
+        import xxhash
+    except ImportError:
+        return None
+    return xxhash.xxh3_128_hexdigest
+
+
+_digest: Callable[[bytes], str] = content_sha256
+
+
+def use_hash_backend(name: str) -> str:
+    """Select the fingerprint function used by ``content_hash``; return its name.
+
+    ``auto`` and ``xxhash`` use xxh3-128 when the ``xxhash`` package is installed,
+    otherwise SHA-256 (hardware-accelerated on most CPUs). The choice is
+    process-wide state: pool workers started with ``spawn`` do not inherit it, so
+    digests that are compared with the cache are computed in the main process.
+    """
+    global _digest
+    if name not in HASH_BACKENDS:
+        raise ValueError(f"Unknown hash backend {name!r}; use one of {', '.join(HASH_BACKENDS)}")
+    if name in ("auto", "xxhash"):
+        fast = _xxhash()
+        if fast is not None:
+            _digest = fast
+            return "xxhash"
+        if name == "xxhash":
+            LOG.warning("xxhash is not installed; using sha256 (pip install pycobello[fast-hash])")
+        name = "sha256"
+    _digest = _blake2b if name == "blake2b" else content_sha256
+    return name
+
+
+def content_hash(content: bytes | str) -> str:
+    """Fingerprint of content with the selected backend (hex digest)."""
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    return _digest(content)
+
+
+SCHEMA_VERSION = 7
+
+
+@dataclass(frozen=True)
+class TableSpec:
+    """Layout of one cache table: a key column and its value columns.
+
+    ``scalar`` tables map a key to a single value instead of a dict. Keys with
+    ``path_key`` and values in ``path_columns`` are absolute paths, stored relative
+    to the project root; ``json_columns`` hold nested data.
+    """
+
+    name: str
+    key: str
+    columns: tuple[str, ...]
+    json_columns: tuple[str, ...] = ()
+    path_columns: tuple[str, ...] = ()
+    path_key: bool = False
+    scalar: bool = False
+
+
+TABLES = {
+    spec.name: spec
+    for spec in (
+        TableSpec("files", "path", ("mtime", "size", "hash"), path_key=True),
+        TableSpec("headers", "path", ("mtime_ns", "size", "fm", "offset"), path_key=True),
+        TableSpec("templates", "name", ("mtime", "size", "hash")),
+        TableSpec(
+            "outputs",
+            "path",
+            ("hash", "deps", "templates", "collections", "collections_level"),
+            json_columns=("templates",),
+        ),
+        TableSpec("source_to_output", "source", ("output",), path_key=True, scalar=True),
+        TableSpec("assets", "path", ("src", "mtime_ns", "size"), path_columns=("src",)),
+        TableSpec(
+            "link_sources",
+            "path",
+            ("mtime", "size", "url_path", "broken"),
+            json_columns=("broken",),
+            path_key=True,
+        ),
+        TableSpec("external_links", "url", ("status", "error", "checked_at")),
+        TableSpec("search_docs", "path", ("id", "hash", "url", "title"), path_key=True),
+    )
+}
+
+# Tables that are not key -> value mappings (see pycobello.build.linkgraph and .search).
+EXTRA_SCHEMA = (
+    "CREATE TABLE links (source TEXT NOT NULL, href TEXT NOT NULL, target TEXT NOT NULL)",
+    "CREATE INDEX links_source ON links (source)",
+    "CREATE INDEX links_target ON links (target)",
+    "CREATE TABLE search_postings "
+    "(prefix TEXT NOT NULL, term TEXT NOT NULL, doc INTEGER NOT NULL, weight INTEGER NOT NULL)",
+    "CREATE INDEX search_postings_prefix ON search_postings (prefix)",
+    "CREATE INDEX search_postings_doc ON search_postings (doc)",
+)
+
+
+class CacheTable(Mapping):
+    """Read-only mapping over one table; rows are fetched when looked up."""
+
+    def __init__(self, cache: "BuildCache", spec: TableSpec) -> None:
+        self._cache = cache
+        self.spec = spec
+        self._read: dict[str, object] = {}
+        cols = ", ".join(spec.columns)
+        self._select = f"SELECT {cols} FROM {spec.name} WHERE {spec.key} = ?"
+
+    def __getitem__(self, key: str):
+        row = self._cache.conn.execute(self._select, (self._cache.rel(key, self.spec.path_key),))
+        found = row.fetchone()
+        if found is None:
+            raise KeyError(key)
+        value = self._decode(found)
+        self._read[key] = value
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        spec = self.spec
+        for (key,) in self._cache.conn.execute(f"SELECT {spec.key} FROM {spec.name}"):
+            yield self._cache.absolute(key, spec.path_key)
+
+    def __len__(self) -> int:
+        return self._cache.conn.execute(f"SELECT COUNT(*) FROM {self.spec.name}").fetchone()[0]
+
+    def load_all(self) -> dict:
+        """Every row in one query, for callers that need the whole table."""
+        spec = self.spec
+        query = f"SELECT {spec.key}, {', '.join(spec.columns)} FROM {spec.name}"
+        for key, *row in self._cache.conn.execute(query):
+            self._read[self._cache.absolute(key, spec.path_key)] = self._decode(tuple(row))
+        return dict(self._read)
+
+    def _decode(self, row: tuple):
+        spec = self.spec
+        values = {}
+        for col, v in zip(spec.columns, row, strict=True):
+            if v is None:
+                continue
+            if col in spec.json_columns:
+                v = json.loads(v)
+            elif col in spec.path_columns:
+                v = self._cache.absolute(v, True)
+            values[col] = v
+        return values[spec.columns[0]] if spec.scalar else values
+
+    def _encode(self, key: str, value) -> tuple:
+        spec = self.spec
+        values = {spec.columns[0]: value} if spec.scalar else value
+        row = [self._cache.rel(key, spec.path_key)]
+        for col in spec.columns:
+            v = values.get(col)
+            if v is not None and col in spec.json_columns:
+                v = json.dumps(v, sort_keys=True, separators=(",", ":"))
+            elif v is not None and col in spec.path_columns:
+                v = self._cache.rel(v, True)
+            row.append(v)
+        return tuple(row)
+
+    def replace(self, new: Mapping) -> int:
+        """Make the table hold exactly ``new``; return the number of rows changed.
+
+        Rows read earlier with an equal value are not written; keys missing from
+        ``new`` are deleted, so entries of deleted sources are collected here.
+        """
+        changed = self.delete([k for k in self if k not in new])
+        changed += self.upsert(
+            {
+                k: v
+                for k, v in new.items()
+                if self._read.get(k, _MISSING) != _without_none(v, self.spec.scalar)
+            }
+        )
+        self._read = {}
+        return changed
+
+    def upsert(self, rows: Mapping) -> int:
+        """Insert or update ``rows`` (unchanged rows are left as they are)."""
+        spec = self.spec
+        cols = (spec.key, *spec.columns)
+        changed = " OR ".join(f"{c} IS NOT excluded.{c}" for c in spec.columns)
+        self._cache.conn.executemany(
+            f"INSERT INTO {spec.name} ({', '.join(cols)}) VALUES ({', '.join('?' * len(cols))})"
+            f" ON CONFLICT({spec.key}) DO UPDATE SET "
+            + ", ".join(f"{c} = excluded.{c}" for c in spec.columns)
+            + f" WHERE {changed}",
+            [self._encode(k, v) for k, v in rows.items()],
+        )
+        return len(rows)
+
+    def delete(self, keys: list[str]) -> int:
+        spec = self.spec
+        self._cache.conn.executemany(
+            f"DELETE FROM {spec.name} WHERE {spec.key} = ?",
+            [(self._cache.rel(k, spec.path_key),) for k in keys],
+        )
+        return len(keys)
+
+
+_MISSING = object()
+
+
+def _without_none(value, scalar: bool):
+    if scalar or not isinstance(value, dict):
+        return value
+    return {k: v for k, v in value.items() if v is not None}
+
+
+class BuildCache:
+    """What the last build saw and produced, in ``.pycobello/cache.db``.
+
+    Each mapping (``files``, ``headers``, ``templates``, ``outputs``, ``source_to_output``,
+    ``assets``, ``link_sources``, ``external_links``, ``search_docs``) is a
+    table read row by row, so a build only loads the entries it looks up. ``save`` replaces all tables in one transaction,
+    writing changed rows only. A cache from another schema version, or one that
+    cannot be read, is discarded.
+    """
+
+    def __init__(self, path: Path, project_root: Path) -> None:
+        self.path = Path(path)
+        self.root = Path(project_root)
+        self._prefix = os.path.join(str(self.root), "")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            self.conn = self._connect()
+        except sqlite3.DatabaseError:
+            LOG.warning("Discarding unreadable build cache %s", self.path)
+            for suffix in ("", "-wal", "-shm"):
+                Path(f"{self.path}{suffix}").unlink(missing_ok=True)
+            self.conn = self._connect()
+        self.tables = {name: CacheTable(self, spec) for name, spec in TABLES.items()}
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path)
+        try:
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != SCHEMA_VERSION:
+                with conn:
+                    for (name,) in conn.execute(
+                        "SELECT name FROM sqlite_master WHERE type = 'table'"
+                    ).fetchall():
+                        conn.execute(f"DROP TABLE {name}")
+                conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+                conn.execute("VACUUM")
+                with conn:
+                    conn.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)")
+                    for spec in TABLES.values():
+                        cols = ", ".join((f"{spec.key} TEXT PRIMARY KEY", *spec.columns))
+                        conn.execute(f"CREATE TABLE {spec.name} ({cols})")
+                    for statement in EXTRA_SCHEMA:
+                        conn.execute(statement)
+                    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        except BaseException:
+            conn.close()
+            raise
+        return conn
+
+    def __getitem__(self, name: str) -> CacheTable:
+        return self.tables[name]
+
+    def rel(self, path: str, is_path: bool = True) -> str:
+        """Project-relative posix form of ``path`` (unchanged outside the project)."""
+        # String prefixes, not pathlib: this runs for every row read or written.
+        if not is_path or not path.startswith(self._prefix):
+            return path
+        return path[len(self._prefix) :].replace(os.sep, "/")
 
+    def absolute(self, path: str, is_path: bool = True) -> str:
+        if not is_path or os.path.isabs(path):
+            return path
+        return self._prefix + path.replace("/", os.sep)
 
-def load_cache(cache_path: Path) -> dict:
-    """Load cache.json; return empty dict if missing."""
-    if not cache_path.is_file():
-        return {"files": {}, "outputs": {}, "source_to_output": {}}
-    return json.loads(cache_path.read_text())
+    def meta(self, key: str) -> str | None:
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
 
+    def save(self, meta: dict[str, str] | None = None, **tables: Mapping) -> int:
+        """Replace the given tables (and meta values) atomically; return rows changed."""
+        changed = 0
+        with self.conn:
+            for key, value in (meta or {}).items():
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value)
+                )
+            for name, new in tables.items():
+                changed += self.tables[name].replace(new)
+        self.conn.execute("PRAGMA incremental_vacuum")
+        return changed
 
-def save_cache(cache_path: Path, data: dict) -> None:
-    """Write cache.json."""
-    cache_path.parent.mkdir(parents=True, exist_ok=True)
-    cache_path.write_text(json.dumps(data, indent=2))
+    def close(self) -> None:
+        self.conn.close()
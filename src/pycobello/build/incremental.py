@@ -0,0 +1,91 @@
+"""Fingerprints for incremental builds (config, templates, sources, collections)."""
+
+import dataclasses
+import json
+from collections.abc import Mapping
+from pathlib import Path
+
+from pycobello.build.cache import content_hash
+
+
+def config_fingerprint(config) -> str:
+    """Hash of the effective settings plus pycobello version."""
+    from pycobello import __version__
+
+    data = dataclasses.asdict(config)
+    return content_hash(json.dumps([__version__, data], sort_keys=True, default=str))
+
+
+def template_fingerprints(templates_dir: Path, cached: Mapping | None = None) -> dict[str, dict]:
+    """Map template name (relative posix path) -> source fingerprint for every template."""
+    cached = {} if cached is None else cached
+    result: dict[str, dict] = {}
+    if templates_dir.is_dir():
+        for path in sorted(templates_dir.rglob("*")):
+            if path.is_file():
+                name = path.relative_to(templates_dir).as_posix()
+                entry = source_fingerprint(path, cached.get(name))
+                if entry is not None:
+                    result[name] = entry
+    return result
+
+
+def templates_unchanged(recorded: dict | None, current: dict[str, dict]) -> bool:
+    """True if every template an output loaded still has the recorded hash."""
+    if recorded is None:
+        return False
+    return all((current.get(name) or {}).get("hash") == digest for name, digest in recorded.items())
+
+
+def source_fingerprint(path: Path, cached: dict | None) -> dict | None:
+    """Return {"mtime", "size", "hash"} for path; reuse the cached hash if stat matches."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    if (
+        cached
+        and cached.get("mtime") == st.st_mtime
+        and cached.get("size") == st.st_size
+        and "hash" in cached
+    ):
+        return cached
+    try:
+        digest = content_hash(path.read_bytes())
+    except OSError:
+        return None
+    return {"mtime": st.st_mtime, "size": st.st_size, "hash": digest}
+
+
+def collections_fingerprint(items) -> str:
+    """Hash of item metadata (path, url, front matter) — changes when listings change."""
+    rows = sorted(
+        (str(i.source_path), i.url_path, json.dumps(i.front_matter, sort_keys=True, default=str))
+        for i in items
+    )
+    return content_hash(json.dumps(rows))
+
+
+def listing_fingerprint(listing, source_hash) -> str:
+    """What a listing page depends on besides config and templates.
+
+    A ``ListingPage`` depends on its template, position and its items' metadata
+    and sources (``source_hash(item)``); a ``TermListPage`` on its template and
+    terms. Shared by the build and the live preview.
+    """
+    from pycobello.render.taxonomy import TermListPage, taxonomy_ctx
+
+    if isinstance(listing, TermListPage):
+        return deps_fingerprint(listing.template, json.dumps(taxonomy_ctx(listing), sort_keys=True))
+    return deps_fingerprint(
+        listing.template,
+        str(listing.number),
+        str(listing.total),
+        collections_fingerprint(listing.items),
+        *(source_hash(i) for i in listing.items),
+    )
+
+
+def deps_fingerprint(*parts: str | None) -> str:
+    """Combine dependency hashes into one value stored per output."""
+    return content_hash("\n".join(p or "" for p in parts))
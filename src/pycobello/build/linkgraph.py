@@ -0,0 +1,199 @@
+"""Persistent graph of internal links between content files (in the build cache)."""
+
+import json
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+
+from pycobello.build.cache import BuildCache
+from pycobello.content.model import ContentItem
+from pycobello.diagnostics.links import (
+    broken_link_errors,
+    broken_links,
+    extract_links,
+    known_urls,
+)
+
+# Below this many files to (re)parse, a process pool costs more than it saves.
+MIN_PARALLEL_FILES = 64
+
+
+@dataclass
+class GraphUpdate:
+    """What ``LinkGraph.update`` changed."""
+
+    parsed: list[ContentItem] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    # URLs whose inbound links (or the sources they come from) changed.
+    affected: set[str] = field(default_factory=set)
+
+
+class LinkGraph:
+    """Source -> (href, target) edges, indexed by target, in the build cache.
+
+    Edges live in the ``links`` table; ``link_sources`` holds each source's
+    fingerprint (mtime, size, URL) and its broken hrefs once checked. ``update``
+    parses only sources whose fingerprint changed, and forgets the broken hrefs
+    of sources linking to a URL that appeared or disappeared, so ``check``
+    re-examines exactly those.
+    """
+
+    def __init__(self, cache: BuildCache) -> None:
+        self.cache = cache
+        self.sources = cache["link_sources"]
+        self.rows: dict[str, dict] = {}
+
+    def update(self, items: list[ContentItem], jobs: int = 1, store=None) -> GraphUpdate:
+        """Bring the graph in line with ``items``.
+
+        Changed sources are parsed across a process pool when ``jobs`` allows; with
+        a fragment ``store`` their rendered bodies are stored from the same parse.
+        """
+        from pycobello.content.markdown import markdown_signature
+
+        signature = markdown_signature()
+        valid = self.cache.meta("links_markdown") == signature
+        previous = self.sources.load_all() if valid else {}
+        result = GraphUpdate()
+        rows: dict[str, dict] = {}
+        for item in items:
+            key = str(item.source_path)
+            row = previous.get(key)
+            if (
+                row is None
+                or item.mtime is None
+                or (row.get("mtime"), row.get("size"), row.get("url_path"))
+                != (item.mtime, item.size, item.url_path)
+            ):
+                result.parsed.append(item)
+            else:
+                rows[key] = row
+        current = {str(i.source_path) for i in items}
+        result.removed = [key for key in previous if key not in current]
+        changed_urls = known_urls(items) ^ known_urls_of(previous.values())
+        extracted = _extract_all(result.parsed, jobs, store)
+
+        conn = self.cache.conn
+        rel = self.cache.rel
+        with conn:
+            if not valid:
+                conn.execute("DELETE FROM links")
+            gone = [rel(str(i.source_path)) for i in result.parsed] + [
+                rel(k) for k in result.removed
+            ]
+            for source in gone:
+                rows_gone = conn.execute("SELECT target FROM links WHERE source = ?", (source,))
+                result.affected.update(t for (t,) in rows_gone)
+            conn.executemany("DELETE FROM links WHERE source = ?", ((s,) for s in gone))
+            for item, links in zip(result.parsed, extracted, strict=True):
+                key = str(item.source_path)
+                rows[key] = {"mtime": item.mtime, "size": item.size, "url_path": item.url_path}
+                conn.executemany(
+                    "INSERT INTO links (source, href, target) VALUES (?, ?, ?)",
+                    ((rel(key), href, target) for href, target in links),
+                )
+                result.affected.update(target for _, target in links)
+            recheck = self._sources_linking_to(changed_urls)
+            for key in recheck:
+                if key in rows:
+                    rows[key] = {k: v for k, v in rows[key].items() if k != "broken"}
+            self.sources.replace(rows)
+            conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('links_markdown', ?)",
+                (signature,),
+            )
+        result.affected |= changed_urls
+        self.rows = rows
+        return result
+
+    def _sources_linking_to(self, urls) -> set[str]:
+        sources: set[str] = set()
+        for url in urls:
+            found = self.cache.conn.execute(
+                "SELECT DISTINCT source FROM links WHERE target = ?", (url,)
+            )
+            sources.update(self.cache.absolute(s) for (s,) in found)
+        return sources
+
+    def links_of(self, source: str) -> list[list[str]]:
+        """[href, target] for each link in ``source``, in document order."""
+        found = self.cache.conn.execute(
+            "SELECT href, target FROM links WHERE source = ? ORDER BY rowid",
+            (self.cache.rel(source),),
+        )
+        return [[href, target] for href, target in found]
+
+    def inbound(self) -> dict[str, list[str]]:
+        """Target URL -> sources linking to it (each once)."""
+        result: dict[str, dict[str, None]] = {}
+        for source, target in self.cache.conn.execute(
+            "SELECT source, target FROM links ORDER BY rowid"
+        ):
+            result.setdefault(target, {})[self.cache.absolute(source)] = None
+        return {target: list(sources) for target, sources in result.items()}
+
+    def check(self, items: list[ContentItem]) -> list[str]:
+        """Broken-link errors for ``items`` (after ``update``); only unchecked sources are resolved."""
+        known = known_urls(items)
+        errors: list[str] = []
+        checked: list[tuple[str, str]] = []
+        for item in items:
+            key = str(item.source_path)
+            row = self.rows[key]
+            broken = row.get("broken")
+            if broken is None:
+                broken = row["broken"] = broken_links(self.links_of(key), known)
+                checked.append((json.dumps(broken), self.cache.rel(key)))
+            errors.extend(broken_link_errors(item.source_path, broken))
+        with self.cache.conn:
+            self.cache.conn.executemany(
+                "UPDATE link_sources SET broken = ? WHERE path = ?", checked
+            )
+        return errors
+
+
+def backlinks_for(
+    items: list[ContentItem], inbound: dict[str, list[str]]
+) -> dict[str, list[ContentItem]]:
+    """Source path -> the other items linking to it, in discovery order."""
+    by_source = {str(i.source_path): i for i in items}
+    order = {key: n for n, key in enumerate(by_source)}
+    result: dict[str, list[ContentItem]] = {}
+    for item in items:
+        url = item.url_path
+        sources = {*inbound.get(url.rstrip("/") or "/", ()), *inbound.get(url, ())}
+        sources.discard(str(item.source_path))
+        linking = sorted((s for s in sources if s in by_source), key=order.__getitem__)
+        if linking:
+            result[str(item.source_path)] = [by_source[s] for s in linking]
+    return result
+
+
+def known_urls_of(rows) -> set[str]:
+    """``known_urls`` as recorded in ``link_sources`` rows."""
+    urls: set[str] = set()
+    for row in rows:
+        url_path = row.get("url_path") or "/"
+        urls.add(url_path.rstrip("/") or "/")
+        urls.add(url_path)
+    return urls
+
+
+def _extract_all(items: list[ContentItem], jobs: int, store) -> list[list[list[str]]]:
+    from pycobello.build.renderer import resolve_jobs
+
+    extract = partial(_extract, store=store)
+    workers = min(resolve_jobs(jobs), len(items))
+    if workers <= 1 or len(items) < MIN_PARALLEL_FILES:
+        return [extract(item) for item in items]
+    chunksize = max(1, len(items) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(extract, items, chunksize=chunksize))
+
+
+def _extract(item: ContentItem, store=None) -> list[list[str]]:
+    try:
+        body = item.load_body()
+    except (OSError, UnicodeDecodeError):
+        return []
+    return extract_links(body, item.url_path, store)
@@ -0,0 +1,268 @@
+"""In-memory site for the dev server: pages render on request and are invalidated per change."""
+
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from pycobello.build.cache import BuildCache, content_sha256
+from pycobello.build.incremental import collections_fingerprint, listing_fingerprint
+from pycobello.build.linkgraph import LinkGraph, backlinks_for
+from pycobello.build.renderer import (
+    BodyRenderer,
+    RenderTask,
+    backlink_ctx,
+    open_fragment_store,
+    render_item,
+    template_for,
+)
+from pycobello.content.discovery import discover
+from pycobello.content.index import HeaderIndex
+from pycobello.content.model import ContentItem
+from pycobello.render.collections import CollectionsView, group_items
+from pycobello.render.context import build_context, site_context
+from pycobello.render.jinja import create_env, render_template
+from pycobello.render.pagination import (
+    ListingPage,
+    listing_output_path,
+    listing_pages,
+    paginator_ctx,
+)
+from pycobello.render.routing import output_path_for_item
+from pycobello.render.taxonomy import (
+    TermListPage,
+    build_taxonomies,
+    taxonomy_ctx,
+    term_list_pages,
+)
+
+INDEX = "index.html"
+
+
+@dataclass
+class RenderedPage:
+    """A rendered page and what it depended on."""
+
+    content: bytes
+    source: str | None
+    templates: set[str] = field(default_factory=set)
+    collections_level: int = 2
+    etag: str = ""
+    # Listing pages: their ``listing_fingerprint`` when rendered.
+    deps: str | None = None
+
+    def __post_init__(self) -> None:
+        if not self.etag:
+            self.etag = content_sha256(self.content)
+
+
+class LiveSite:
+    """Parsed site, Jinja environment and rendered pages held in memory.
+
+    ``page(path)`` renders lazily and caches; ``apply_changes`` takes changed file
+    paths (e.g. from watchfiles) and drops only the pages they affect. Safe to
+    call from several server threads.
+    """
+
+    def __init__(self, project_root: str | Path, config_path: str | None = None) -> None:
+        self.root = Path(project_root).resolve()
+        self.config_name = config_path
+        self._lock = threading.RLock()
+        self.reload()
+
+    def reload(self) -> None:
+        """(Re)load config, plugins, items and the Jinja environment; drop all pages."""
+        from pycobello.config.load import config_file, load_config
+        from pycobello.plugins.manager import load_plugins
+
+        with self._lock:
+            self.config = config = load_config(str(self.root), self.config_name)
+            load_plugins(config.plugins.enabled)
+            self.content_dir = self.root / config.build.content_dir
+            self.theme_dir = self.root / config.build.theme_dir
+            self.templates_dir = self.theme_dir / "templates"
+            self.static_dirs = (self.root / config.build.static_dir, self.theme_dir / "static")
+            self.config_path = config_file(self.root, self.config_name)
+            self.cache_dir = self.root / ".pycobello"
+            self.site = site_context(config)
+            self.bodies = BodyRenderer(open_fragment_store(config, self.cache_dir))
+            self._pages: dict[str, RenderedPage] = {}
+            self.errors: list[str] = []
+            self.env = None
+            self._discover()
+            self.env = create_env(self.templates_dir, self.site, self.collections)
+
+    def _discover(self) -> None:
+        config = self.config
+        coll_dict = {"posts": config.collections.posts, "pages": config.collections.pages}
+        cache = BuildCache(self.cache_dir / "cache.db", self.root)
+        try:
+            index = HeaderIndex(cache)
+            found = discover(self.content_dir, coll_dict, ignore=config.build.ignore, index=index)
+            index.save()
+            self.errors = [f"{path}: {msg}" for path, msg in found.errors]
+            self.items = found.items
+            graph = LinkGraph(cache)
+            self.links_affected = graph.update(self.items, store=self.bodies.store).affected
+            self.backlinks = backlinks_for(self.items, graph.inbound())
+        finally:
+            cache.close()
+        self.meta_fp = collections_fingerprint(self.items)
+        self.routes: dict[str, ContentItem] = {}
+        for item in self.items:
+            out = output_path_for_item(Path(), item.url_path, clean_urls=config.build.clean_urls)
+            self.routes[out.as_posix()] = item
+        grouped = group_items(self.items)
+        self.collections = CollectionsView(grouped, self.bodies)
+        taxonomies = build_taxonomies(config, grouped)
+        self.listings: dict[str, ListingPage | TermListPage] = {}
+        for listing in [
+            *listing_pages(config, grouped, taxonomies),
+            *term_list_pages(config, taxonomies),
+        ]:
+            out = listing_output_path(Path(), listing.url_path, config.build.clean_urls)
+            self.listings[out.as_posix()] = listing
+        if self.env is not None:
+            self.env.globals["collections"] = self.collections
+
+    def page(self, url_path: str) -> RenderedPage | None:
+        """Rendered page for a request path, or None if no content item maps to it."""
+        key = self.route_key(url_path)
+        with self._lock:
+            cached = self._pages.get(key)
+            if cached is not None:
+                return cached
+            if key in self.listings:
+                page = self._render_listing(self.listings[key])
+            elif key == INDEX:
+                page = self._render_index()
+            elif key in self.routes:
+                page = self._render_item(self.routes[key])
+            else:
+                return None
+            self._pages[key] = page
+            return page
+
+    def static_file(self, url_path: str) -> Path | None:
+        """Filesystem path for /static/... (user static overrides theme static)."""
+        parts = [p for p in url_path.split("?")[0].split("/") if p]
+        if len(parts) < 2 or parts[0] != "static" or ".." in parts:
+            return None
+        for base in self.static_dirs:
+            candidate = base.joinpath(*parts[1:])
+            if candidate.is_file():
+                return candidate
+        return None
+
+    def route_key(self, url_path: str) -> str:
+        """Request path -> output-relative path (``blog/hello/index.html``)."""
+        path = url_path.split("?")[0].split("#")[0].strip("/")
+        if not path:
+            return INDEX
+        if path.endswith(".html"):
+            return path
+        if self.config.build.clean_urls:
+            return f"{path}/{INDEX}"
+        return f"{path}.html"
+
+    def _render_index(self) -> RenderedPage:
+        loaded: set[str] = set()
+        self.collections.access.level = 0
+        content = render_template(
+            self.env, INDEX, build_context(self.site, self.collections), loaded
+        )
+        return RenderedPage(
+            content=content.encode("utf-8"),
+            source=None,
+            templates=loaded,
+            collections_level=self.collections.access.level,
+        )
+
+    def _render_listing(self, listing: ListingPage | TermListPage) -> RenderedPage:
+        loaded: set[str] = set()
+        self.collections.access.level = 0
+        if isinstance(listing, TermListPage):
+            ctx = build_context(self.site, self.collections, taxonomy=taxonomy_ctx(listing))
+        else:
+            ctx = build_context(
+                self.site, self.collections, paginator=paginator_ctx(listing, self.bodies)
+            )
+        content = render_template(self.env, listing.template, ctx, loaded)
+        return RenderedPage(
+            content=content.encode("utf-8"),
+            source=None,
+            templates=loaded,
+            collections_level=self.collections.access.level,
+            deps=self._listing_deps(listing),
+        )
+
+    def _listing_deps(self, listing: ListingPage | TermListPage) -> str:
+        # Items are not hashed here: their stat stands in for the source hash.
+        return listing_fingerprint(listing, lambda i: f"{i.mtime}:{i.size}")
+
+    def _render_item(self, item: ContentItem) -> RenderedPage:
+        task = RenderTask(
+            item=item,
+            template_name=template_for(item, self.config),
+            backlinks=[backlink_ctx(i) for i in self.backlinks.get(str(item.source_path), ())],
+        )
+        outcome = render_item(self.env, task, self.site, self.collections)
+        if outcome.error is not None:
+            raise RuntimeError(outcome.error)
+        return RenderedPage(
+            content=outcome.content.encode("utf-8"),
+            source=str(item.source_path),
+            templates=outcome.loaded,
+            collections_level=outcome.collections_level,
+        )
+
+    def apply_changes(self, paths) -> int:
+        """Invalidate pages affected by changed files. Return number of pages dropped."""
+        paths = [Path(p).resolve() for p in paths]
+        with self._lock:
+            before = len(self._pages)
+            if any(p == self.config_path for p in paths):
+                self.reload()
+                return before
+            templates = {
+                p.relative_to(self.templates_dir).as_posix()
+                for p in paths
+                if p.is_relative_to(self.templates_dir)
+            }
+            sources = {str(p) for p in paths if p.suffix == ".md" and p.is_relative_to(self.root)}
+            if not templates and not sources:
+                return 0
+            if templates:
+                self._pages = {
+                    k: v for k, v in self._pages.items() if not (v.templates & templates)
+                }
+            if sources:
+                self._content_changed(sources)
+            return before - len(self._pages)
+
+    def _content_changed(self, sources: set[str]) -> None:
+        old_meta = self.meta_fp
+        old_routes = {str(i.source_path): k for k, i in self.routes.items()}
+        self.bodies.forget(sources)
+        self._discover()
+        meta_changed = self.meta_fp != old_meta
+        dropped_keys = {old_routes[s] for s in sources if s in old_routes}
+
+        def stale(key: str, page: RenderedPage) -> bool:
+            if page.source in sources or key in dropped_keys:
+                return True
+            if page.deps is not None:
+                # A listing page: stale if its slice (or the term list) changed.
+                listing = self.listings.get(key)
+                if listing is None or self._listing_deps(listing) != page.deps:
+                    return True
+            item = self.routes.get(key)
+            if item is not None and (
+                item.url_path in self.links_affected
+                or (item.url_path.rstrip("/") or "/") in self.links_affected
+            ):
+                return True
+            if page.collections_level >= 2:
+                return True
+            return page.collections_level == 1 and meta_changed
+
+        self._pages = {k: v for k, v in self._pages.items() if not stale(k, v)}
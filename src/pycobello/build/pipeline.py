@@ -1,43 +1,105 @@
 """Build pipeline: discovery -> parse -> render -> write. Steps 5–7."""
 
-from datetime import date
+import json
+import shutil
+import time
 from pathlib import Path
 
-from pycobello.build.assets import copy_assets
-from pycobello.build.cache import file_sha256, load_cache, save_cache
+from pycobello.build.assets import sync_assets
+from pycobello.build.cache import BuildCache, use_hash_backend
+from pycobello.build.incremental import (
+    collections_fingerprint,
+    config_fingerprint,
+    deps_fingerprint,
+    listing_fingerprint,
+    source_fingerprint,
+    template_fingerprints,
+    templates_unchanged,
+)
+from pycobello.build.linkgraph import LinkGraph, backlinks_for
+from pycobello.build.profile import Profiler, RenderTiming
+from pycobello.build.renderer import (
+    BodyRenderer,
+    RenderTask,
+    backlink_ctx,
+    open_fragment_store,
+    render_items,
+    template_for,
+)
 from pycobello.build.result import BuildResult
-from pycobello.build.writer import write_if_changed
+from pycobello.build.search import SearchIndex
+from pycobello.build.staging import prepare_staging, swap_into_place
+from pycobello.build.stamp import build_stamp, is_racy, read_stamp, write_stamp
+from pycobello.build.writer import OutputWriter, fsync_dir, prune_outputs
 from pycobello.config.models import PyCobelloSettings
 from pycobello.content.discovery import discover_items
-from pycobello.content.markdown import markdown_to_html
-from pycobello.render.context import build_context
+from pycobello.content.index import HeaderIndex
+from pycobello.render.collections import CollectionsView, group_items
+from pycobello.render.context import build_context, site_context
 from pycobello.render.jinja import create_env, render_template
+from pycobello.render.pagination import listing_output_path, listing_pages, paginator_ctx
 from pycobello.render.routing import output_path_for_item
+from pycobello.render.taxonomy import (
+    build_taxonomies,
+    taxonomy_ctx,
+    term_list_pages,
+)
 
 
 def run_pipeline(
     config: PyCobelloSettings,
     project_root: str | Path = ".",
     clean: bool = False,
+    incremental: bool = True,
+    jobs: int = 1,
+    profiler: Profiler | None = None,
 ) -> BuildResult:
-    """Run full build. Returns BuildResult with written/skipped/errors."""
+    """Run build. Returns BuildResult with written/skipped/errors.
+
+    With ``incremental`` (default), outputs whose source, templates, config and
+    collection metadata are unchanged since the last build are skipped before
+    Markdown and Jinja rendering; if ``config`` is unchanged and no file under
+    the content, theme, static or output paths changed (by stat), the build returns at once
+    with ``up_to_date`` set. ``clean`` or ``incremental=False`` re-renders all.
+    ``jobs`` > 1 renders items across a process pool (0 = one worker per CPU).
+    A ``profiler`` collects per-stage and per-render timings.
+    """
+    profiler = profiler or Profiler(enabled=False)
     project_root = Path(project_root).resolve()
     content_dir = project_root / config.build.content_dir
-    output_dir = project_root / config.build.output_dir
+    final_output_dir = project_root / config.build.output_dir
     theme_dir = project_root / config.build.theme_dir
     templates_dir = theme_dir / "templates"
     theme_static = theme_dir / "static"
     user_static = project_root / config.build.static_dir
-    output_static = output_dir / "static"
     cache_dir = project_root / ".pycobello"
-    cache_path = cache_dir / "cache.json"
+    cache_path = cache_dir / "cache.db"
+    stamp_path = cache_dir / "stamp"
+    hash_backend = use_hash_backend(config.build.hash)
 
-    if clean and output_dir.exists():
-        import shutil
+    # Nothing changed since the last successful build: stat-only check, no reads.
+    if incremental and not clean:
+        with profiler.stage("stamp"):
+            up_to_date = read_stamp(stamp_path) == build_stamp(project_root, config)[0]
+        if up_to_date:
+            return BuildResult(written=[], skipped=[], errors=[], up_to_date=True)
 
+    # With atomic_output, write into a staged copy of dist/ and swap it in at the end.
+    output_dir = final_output_dir
+    staged = config.build.atomic_output
+    if staged:
+        with profiler.stage("stage"):
+            output_dir = prepare_staging(final_output_dir, empty=clean)
+    elif clean and output_dir.exists():
         shutil.rmtree(output_dir)
-    cache_dir.mkdir(parents=True, exist_ok=True)
-    cache = load_cache(cache_path)
+    output_static = output_dir / "static"
+    writer = OutputWriter(fsync=config.build.fsync)
+
+    def shown(path: Path) -> str:
+        """Path as reported in the result (under the real output dir)."""
+        return str(final_output_dir / path.relative_to(output_dir))
+
+    cache = BuildCache(cache_path, project_root)
 
     from pycobello.plugins.manager import load_plugins
 
@@ -52,102 +114,287 @@ def run_pipeline(
         "posts": config.collections.posts,
         "pages": config.collections.pages,
     }
-    items = discover_items(
-        content_dir,
-        coll_dict,
-        ignore=config.build.ignore,
-    )
-
-    site_dict = {
-        "title": config.site.title,
-        "base_url": config.site.base_url,
-        "author": config.site.author,
-    }
+    with profiler.stage("discover"):
+        header_index = HeaderIndex(cache)
+        items = discover_items(
+            content_dir,
+            coll_dict,
+            ignore=config.build.ignore,
+            index=header_index,
+        )
+        header_index.save()
 
-    posts = [i for i in items if i.kind.value == "post"]
-    pages = [i for i in items if i.kind.value == "page"]
-    posts_sorted = sorted(
-        posts,
-        key=lambda x: x.date or date.min,
-        reverse=True,
-    )
-    collections_dict = {
-        "posts": [_item_to_ctx(i, markdown_to_html(i.body_markdown)) for i in posts_sorted],
-        "pages": [_item_to_ctx(i, markdown_to_html(i.body_markdown)) for i in pages],
-    }
+    site_dict = site_context(config)
+
+    # Digests from another backend are never reused: switching rehashes every
+    # source and template, and so rebuilds everything, once.
+    same_backend = cache.meta("hash") == hash_backend
+    files_prev = cache["files"] if same_backend else {}
+    # After --clean the recorded output hashes no longer describe files on disk
+    outputs_prev = {} if clean else cache["outputs"]
+    files: dict = {}
+    outputs: dict = {}
+    source_to_output: dict = {}
+    with profiler.stage("hash"):
+        for item in items:
+            entry = source_fingerprint(item.source_path, files_prev.get(str(item.source_path)))
+            if entry is not None:
+                files[str(item.source_path)] = entry
+
+        config_fp = config_fingerprint(config)
+        templates = template_fingerprints(
+            templates_dir, cache["templates"] if same_backend else None
+        )
+        meta_fp = collections_fingerprint(items)
+        sources_fp = deps_fingerprint(*sorted(e["hash"] for e in files.values()))
+    full = clean or not incremental
+
+    fragments = open_fragment_store(config, cache_dir)
+    # One parse per changed source yields its links and (via the fragment store)
+    # the body HTML its own render will use.
+    with profiler.stage("links"):
+        graph = LinkGraph(cache)
+        graph.update(items, jobs, store=fragments)
+        backlinks = backlinks_for(items, graph.inbound())
+    # Bodies are rendered on demand: for stale items' own pages, and for
+    # collection items only when a template reads their ``content``.
+    bodies = BodyRenderer(fragments)
+    grouped = group_items(items)
+    collections = CollectionsView(grouped, bodies)
+    taxonomies = build_taxonomies(config, grouped)
+    env = None
+
+    def get_env():
+        nonlocal env
+        if env is None:
+            env = create_env(templates_dir, site_dict, collections)
+        return env
 
-    env = create_env(templates_dir, site_dict, collections_dict)
+    def collections_dep(level: int) -> str | None:
+        """What a render depends on, given how deeply it read the collections."""
+        if level <= 0:
+            return None
+        if level == 1:
+            return meta_fp
+        return deps_fingerprint(meta_fp, sources_fp)
 
-    # Index page
+    def is_fresh(rel_out: str, out_path: Path, deps: str) -> bool:
+        if full or not out_path.exists():
+            return False
+        prev = outputs_prev.get(rel_out) or {}
+        return (
+            prev.get("deps") == deps
+            and templates_unchanged(prev.get("templates"), templates)
+            and prev.get("collections") == collections_dep(prev.get("collections_level", 2))
+        )
+
+    def cached_hash(rel_out: str, out_path: Path) -> str | None:
+        """Hash of the last write of an output, or None if the file is gone."""
+        if not out_path.exists():
+            return None
+        return outputs_prev.get(rel_out, {}).get("hash")
+
+    def output_entry(new_hash: str, deps: str, loaded: set[str], level: int) -> dict:
+        return {
+            "hash": new_hash,
+            "deps": deps,
+            # A template looked up but missing is recorded as None: creating it
+            # later makes the output stale.
+            "templates": {n: (templates.get(n) or {}).get("hash") for n in sorted(loaded)},
+            "collections": collections_dep(level),
+            "collections_level": level,
+        }
+
+    def record_render(name: str, template: str, timing: RenderTiming) -> None:
+        profiler.record_render(name, template, timing)
+        profiler.add_stage("markdown", timing.markdown_seconds)
+        profiler.add_stage("jinja", timing.seconds - timing.markdown_seconds)
+
+    def render_listing(out_path: Path, deps: str, template: str, ctx: dict) -> None:
+        """Render and write a listing page unless it is fresh."""
+        rel_out = str(out_path.relative_to(output_dir))
+        if is_fresh(rel_out, out_path, deps):
+            skipped.append(shown(out_path))
+            outputs[rel_out] = outputs_prev[rel_out]
+            return
+        loaded: set[str] = set()
+        collections.access.level = 0
+        timing = RenderTiming(time.perf_counter())
+        cpu0, md0 = time.process_time(), bodies.seconds
+        try:
+            with profiler.stage("render"):
+                content = render_template(get_env(), template, ctx, loaded)
+        except Exception as e:
+            errors.append(f"{rel_out}: {e}")
+            return
+        timing.seconds = time.perf_counter() - timing.started
+        timing.cpu_seconds = time.process_time() - cpu0
+        timing.markdown_seconds = bodies.seconds - md0
+        record_render(rel_out, template, timing)
+        cached_out = cached_hash(rel_out, out_path)
+        with profiler.stage("write"):
+            did_write, new_hash = writer.write_if_changed(out_path, content, cached_out)
+        if did_write:
+            written.append(shown(out_path))
+        else:
+            skipped.append(shown(out_path))
+        outputs[rel_out] = output_entry(new_hash, deps, loaded, collections.access.level)
+
+    # Index page (unless paginated below), then paginated index, archive and
+    # taxonomy term pages. Each listing page depends only on its own slice, so an
+    # edit re-renders just the pages whose items (or page count) changed.
     output_dir.mkdir(parents=True, exist_ok=True)
-    index_path = output_dir / "index.html"
-    index_ctx = build_context(site_dict, collections_dict)
-    index_content = render_template(env, "index.html", index_ctx)
-    out_key = "index.html"
-    cached_out = (cache.get("outputs") or {}).get(out_key, {}).get("sha256")
-    did_write, new_hash = write_if_changed(index_path, index_content, cached_out)
-    if did_write:
-        written.append(str(index_path))
-    else:
-        skipped.append(str(index_path))
-    cache.setdefault("outputs", {})[out_key] = {"sha256": new_hash}
+    if config.collections.posts.per_page <= 0:
+        render_listing(
+            output_dir / "index.html",
+            deps_fingerprint(config_fp),
+            "index.html",
+            build_context(site_dict, collections),
+        )
+
+    def source_hash(item) -> str | None:
+        return (files.get(str(item.source_path)) or {}).get("hash")
+
+    for listing in listing_pages(config, grouped, taxonomies):
+        render_listing(
+            listing_output_path(output_dir, listing.url_path, config.build.clean_urls),
+            deps_fingerprint(config_fp, listing_fingerprint(listing, source_hash)),
+            listing.template,
+            build_context(site_dict, collections, paginator=paginator_ctx(listing, bodies)),
+        )
+    for term_list in term_list_pages(config, taxonomies):
+        render_listing(
+            listing_output_path(output_dir, term_list.url_path, config.build.clean_urls),
+            deps_fingerprint(config_fp, listing_fingerprint(term_list, source_hash)),
+            term_list.template,
+            build_context(site_dict, collections, taxonomy=taxonomy_ctx(term_list)),
+        )
 
-    # Each post and page
+    # Each post and page: pick stale items, render them (optionally in parallel),
+    # then write in discovery order so results and cache are deterministic.
+    tasks: list[RenderTask] = []
+    pending: list[tuple[Path, str, str]] = []
     for item in items:
         out_path = output_path_for_item(
             output_dir,
             item.url_path,
             clean_urls=config.build.clean_urls,
         )
-        template_name = item.template or (
-            config.collections.posts.template
-            if item.kind.value == "post"
-            else config.collections.pages.template
+        rel_out = str(out_path.relative_to(output_dir))
+        entry = files.get(str(item.source_path))
+        linking = [backlink_ctx(i) for i in backlinks.get(str(item.source_path), ())]
+        item_deps = deps_fingerprint(
+            config_fp,
+            entry["hash"] if entry else None,
+            json.dumps(linking, sort_keys=True, default=str) if linking else None,
         )
-        html = markdown_to_html(item.body_markdown)
-        ctx = build_context(
-            site_dict,
-            collections_dict,
-            page=_item_to_ctx(item, html) if item.kind.value == "page" else None,
-            post=_item_to_ctx(item, html) if item.kind.value == "post" else None,
+        source_to_output[str(item.source_path)] = rel_out
+        if entry is not None and is_fresh(rel_out, out_path, item_deps):
+            skipped.append(shown(out_path))
+            outputs[rel_out] = outputs_prev[rel_out]
+            continue
+        tasks.append(
+            RenderTask(item=item, template_name=template_for(item, config), backlinks=linking)
         )
-        try:
-            content = render_template(env, template_name, ctx)
-        except Exception as e:
-            errors.append(f"{item.source_path}: {e}")
+        pending.append((out_path, rel_out, item_deps))
+
+    outcomes: list = []
+    if tasks:
+        with profiler.stage("render"):
+            outcomes = render_items(
+                tasks,
+                jobs,
+                templates_dir,
+                site_dict,
+                collections,
+                config.plugins.enabled,
+                env=env,
+            )
+    for (out_path, rel_out, item_deps), outcome, task in zip(pending, outcomes, tasks, strict=True):
+        if outcome.error is not None:
+            errors.append(outcome.error)
             continue
-        rel_out = str(out_path.relative_to(output_dir))
-        cached_out = (cache.get("outputs") or {}).get(rel_out, {}).get("sha256")
-        did_write, new_hash = write_if_changed(out_path, content, cached_out)
+        record_render(str(task.item.source_path), task.template_name, outcome.timing)
+        cached_out = cached_hash(rel_out, out_path)
+        with profiler.stage("write"):
+            did_write, new_hash = writer.write_if_changed(out_path, outcome.content, cached_out)
         if did_write:
-            written.append(str(out_path))
+            written.append(shown(out_path))
         else:
-            skipped.append(str(out_path))
-        cache.setdefault("outputs", {})[rel_out] = {"sha256": new_hash}
-        cache.setdefault("source_to_output", {})[str(item.source_path)] = rel_out
-        # Record source file in cache for incremental invalidation
-        try:
-            st = item.source_path.stat()
-            cache.setdefault("files", {})[str(item.source_path)] = {
-                "mtime": st.st_mtime,
-                "size": st.st_size,
-                "sha256": file_sha256(item.source_path),
-            }
-        except OSError:
-            pass
-
-    copy_assets(theme_static, user_static, output_static)
-
-    save_cache(cache_path, cache)
-    return BuildResult(written=written, skipped=skipped, errors=errors)
-
-
-def _item_to_ctx(item, html: str) -> dict:
-    return {
-        "title": item.front_matter.get("title", ""),
-        "slug": item.slug,
-        "url_path": item.url_path,
-        "date": item.date,
-        "content": html,
-        "front_matter": item.front_matter,
-    }
+            skipped.append(shown(out_path))
+        outputs[rel_out] = output_entry(
+            new_hash, item_deps, outcome.loaded, outcome.collections_level
+        )
+
+    # Search index: only changed items are tokenized, only the shards and
+    # document blocks they touch are rewritten.
+    if config.search.enabled:
+        with profiler.stage("search"):
+            search = SearchIndex(cache, config.search.prefix_length)
+            update = search.update(items, files, bodies, jobs)
+            for name in search.files():
+                rel_out = f"{config.search.output_dir}/{name}"
+                out_path = output_dir / rel_out
+                if name not in update.dirty and rel_out in outputs_prev and out_path.exists():
+                    outputs[rel_out] = outputs_prev[rel_out]
+                    continue
+                cached_out = cached_hash(rel_out, out_path)
+                did_write, new_hash = writer.write_if_changed(
+                    out_path, search.render(name), cached_out
+                )
+                if did_write:
+                    written.append(shown(out_path))
+                outputs[rel_out] = {"hash": new_hash}
+
+    with profiler.stage("write"):
+        writer.flush()
+
+    # Outputs of the last build that nothing produced this time (deleted or renamed
+    # items, vanished terms, fewer listing pages) are orphans. A failed render
+    # keeps its old entry without deps, so it is retried and can still be pruned.
+    orphans = [rel for rel in outputs_prev if rel not in outputs]
+    if errors:
+        for rel in orphans:
+            outputs[rel] = {"hash": outputs_prev[rel].get("hash")}
+        removed = []
+    else:
+        removed = [shown(Path(p)) for p in prune_outputs(output_dir, orphans)]
+
+    with profiler.stage("assets"):
+        assets = sync_assets(
+            [theme_static, user_static],
+            output_static,
+            cache["assets"],
+            hardlink=config.build.asset_hardlinks,
+        )
+
+    if staged:
+        if errors:
+            # Keep the live tree and the cache that describes it.
+            shutil.rmtree(output_dir, ignore_errors=True)
+            stamp_path.unlink(missing_ok=True)
+            cache.close()
+            return BuildResult(written=[], skipped=[], errors=errors)
+        with profiler.stage("swap"):
+            swap_into_place(output_dir, final_output_dir)
+            if config.build.fsync:
+                fsync_dir(final_output_dir.parent)
+
+    with profiler.stage("cache"):
+        if fragments is not None and bodies.rendered:
+            fragments.prune()
+        cache.save(
+            meta={"hash": hash_backend},
+            files=files,
+            templates=templates,
+            outputs=outputs,
+            source_to_output=source_to_output,
+            assets=assets.entries,
+        )
+        cache.close()
+    stamp, newest_input = build_stamp(project_root, config)
+    if errors or is_racy(newest_input):
+        stamp_path.unlink(missing_ok=True)
+    else:
+        write_stamp(stamp_path, stamp)
+    return BuildResult(written=written, skipped=skipped, errors=errors, removed=removed)
@@ -0,0 +1,138 @@
+"""Build profiling: per-stage wall/CPU time, per-template and per-item render times."""
+
+import json
+import os
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+from pycobello.log import LOG
+
+
+@dataclass
+class RenderTiming:
+    """Timing of one render, taken where it ran (main process or a worker)."""
+
+    started: float = 0.0
+    seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    markdown_seconds: float = 0.0
+    pid: int = 0
+
+
+class Profiler:
+    """Collects stage and render timings for a build.
+
+    Stages may be entered repeatedly (e.g. ``write`` per file); their times add up.
+    Disabled profilers keep nothing, so the pipeline can call them unconditionally.
+    """
+
+    def __init__(self, enabled: bool = True) -> None:
+        self.enabled = enabled
+        self.t0 = time.perf_counter()
+        self.stages: dict[str, dict] = {}
+        self.items: list[dict] = []
+        self.templates: dict[str, dict] = {}
+        self._events: list[dict] = []
+        self._pid = os.getpid()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time a block as (part of) stage ``name``."""
+        if not self.enabled:
+            yield
+            return
+        wall0, cpu0 = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            wall, cpu = time.perf_counter() - wall0, time.process_time() - cpu0
+            self.add_stage(name, wall, cpu)
+            self._event(name, "stage", wall0, wall, self._pid)
+
+    def add_stage(self, name: str, wall: float, cpu: float = 0.0) -> None:
+        """Add time to a stage measured elsewhere (e.g. Markdown inside renders)."""
+        if not self.enabled:
+            return
+        s = self.stages.setdefault(name, {"wall": 0.0, "cpu": 0.0, "calls": 0})
+        s["wall"] += wall
+        s["cpu"] += cpu
+        s["calls"] += 1
+
+    def record_render(self, name: str, template: str, timing: RenderTiming) -> None:
+        """Record one page render (Markdown + Jinja) for ``name`` using ``template``."""
+        if not self.enabled:
+            return
+        self.items.append(
+            {
+                "name": name,
+                "template": template,
+                "seconds": timing.seconds,
+                "cpu": timing.cpu_seconds,
+                "markdown": timing.markdown_seconds,
+            }
+        )
+        t = self.templates.setdefault(template, {"seconds": 0.0, "renders": 0})
+        t["seconds"] += timing.seconds
+        t["renders"] += 1
+        self._event(name, "render", timing.started, timing.seconds, timing.pid or self._pid)
+
+    def _event(self, name: str, cat: str, start: float, duration: float, pid: int) -> None:
+        self._events.append(
+            {
+                "name": name,
+                "cat": cat,
+                "ph": "X",
+                "ts": round((start - self.t0) * 1e6, 1),
+                "dur": round(duration * 1e6, 1),
+                "pid": self._pid,
+                "tid": pid,
+            }
+        )
+
+    def summary(self, top: int = 10) -> dict:
+        """Machine-readable totals: stages, templates and the ``top`` slowest items."""
+        slowest = sorted(self.items, key=lambda i: i["seconds"], reverse=True)[:top]
+        templates = sorted(self.templates.items(), key=lambda kv: kv[1]["seconds"], reverse=True)
+        return {
+            "total_seconds": time.perf_counter() - self.t0,
+            "stages": self.stages,
+            "templates": dict(templates),
+            "slowest_items": slowest,
+        }
+
+    def report(self, top: int = 10) -> str:
+        """Human-readable timing table."""
+        data = self.summary(top)
+        lines = [f"Build profile ({data['total_seconds'] * 1000:.1f} ms total)", "Stages:"]
+        for name, s in data["stages"].items():
+            lines.append(
+                f"  {name:<12} {s['wall'] * 1000:9.1f} ms wall {s['cpu'] * 1000:9.1f} ms cpu"
+                f"  x{s['calls']}"
+            )
+        if data["templates"]:
+            lines.append("Templates:")
+            for name, t in data["templates"].items():
+                lines.append(f"  {name:<24} {t['seconds'] * 1000:9.1f} ms  x{t['renders']}")
+        if data["slowest_items"]:
+            lines.append(f"Slowest {len(data['slowest_items'])} renders:")
+            for i in data["slowest_items"]:
+                lines.append(
+                    f"  {i['seconds'] * 1000:9.1f} ms  (markdown {i['markdown'] * 1000:.1f} ms)"
+                    f"  {i['name']}"
+                )
+        return "\n".join(lines)
+
+    def write(self, path: Path, top: int = 10) -> None:
+        """Write a Chrome trace (chrome://tracing, Perfetto); summary in ``otherData``."""
+        trace = {
+            "traceEvents": self._events,
+            "displayTimeUnit": "ms",
+            "otherData": self.summary(top),
+        }
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(trace, indent=1))
+        LOG.debug("Wrote build profile to %s", path)
@@ -0,0 +1,206 @@
+"""Item rendering (Markdown + Jinja), serially or across a process pool."""
+
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from pycobello.build.profile import RenderTiming
+from pycobello.content.fragments import FragmentStore
+from pycobello.content.markdown import markdown_signature, markdown_to_html
+from pycobello.content.model import ContentItem
+from pycobello.render.context import build_context
+from pycobello.render.jinja import create_env, render_template
+
+
+@dataclass
+class RenderTask:
+    """One item to render with the given template (and the items linking to it)."""
+
+    item: ContentItem
+    template_name: str
+    backlinks: list[dict] = field(default_factory=list)
+
+
+@dataclass
+class RenderOutcome:
+    """Rendered HTML (or an error message) plus the templates the render loaded."""
+
+    content: str | None
+    error: str | None = None
+    loaded: set[str] = field(default_factory=set)
+    collections_level: int = 2
+    timing: RenderTiming = field(default_factory=RenderTiming)
+
+
+class BodyRenderer:
+    """Item body -> HTML on demand (through the fragment store).
+
+    Used as the ``html_for`` callback of lazy collections and for stale items'
+    own pages, so a body read by both is rendered once. Only the most recently
+    used ``max_items`` results are kept, so memory follows what templates read.
+    """
+
+    def __init__(self, store: FragmentStore | None = None, max_items: int = 512) -> None:
+        self.store = store
+        self.max_items = max_items
+        self.rendered = 0
+        self.seconds = 0.0
+        self._html: OrderedDict[str, str] = OrderedDict()
+
+    def __call__(self, item: ContentItem) -> str:
+        key = str(item.source_path)
+        html = self._html.get(key)
+        if html is not None:
+            self._html.move_to_end(key)
+            return html
+        start = time.perf_counter()
+        html = markdown_to_html(item.load_body(), self.store)
+        self.seconds += time.perf_counter() - start
+        self.rendered += 1
+        self._html[key] = html
+        if len(self._html) > self.max_items:
+            self._html.popitem(last=False)
+        return html
+
+    def forget(self, sources) -> None:
+        """Drop memoized HTML for the given source paths (e.g. after an edit)."""
+        for key in sources:
+            self._html.pop(str(key), None)
+
+    def __getstate__(self) -> dict:
+        # Workers start with an empty memo; only the store location is shipped.
+        return {"store": self.store, "max_items": self.max_items}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(state["store"], state["max_items"])
+
+
+def render_item(env, task: RenderTask, site: dict, collections) -> RenderOutcome:
+    """Render one post or page: Markdown body, then its Jinja template."""
+    item = task.item
+    html_for = getattr(collections, "html_for", None)
+    timing = RenderTiming(time.perf_counter(), pid=os.getpid())
+    cpu0 = time.process_time()
+    md0 = getattr(html_for, "seconds", 0.0)
+    html = html_for(item) if html_for is not None else markdown_to_html(item.load_body())
+    access = getattr(collections, "access", None)
+    if access is not None:
+        access.level = 0
+    ctx = build_context(
+        site,
+        collections,
+        page=item_to_ctx(item, html) if item.kind.value == "page" else None,
+        post=item_to_ctx(item, html) if item.kind.value == "post" else None,
+        backlinks=task.backlinks,
+    )
+    loaded: set[str] = set()
+    try:
+        content = render_template(env, task.template_name, ctx, loaded)
+    except Exception as e:
+        return RenderOutcome(content=None, error=f"{item.source_path}: {e}")
+    timing.seconds = time.perf_counter() - timing.started
+    timing.cpu_seconds = time.process_time() - cpu0
+    timing.markdown_seconds = getattr(html_for, "seconds", 0.0) - md0
+    level = access.level if access is not None else 2
+    return RenderOutcome(content=content, loaded=loaded, collections_level=level, timing=timing)
+
+
+def template_for(item: ContentItem, config) -> str:
+    """Front matter ``template`` or the collection default."""
+    return item.template or (
+        config.collections.posts.template
+        if item.kind.value == "post"
+        else config.collections.pages.template
+    )
+
+
+def open_fragment_store(config, cache_dir: Path) -> FragmentStore | None:
+    """Fragment store under ``cache_dir`` sized from config; None if disabled."""
+    if config.build.markdown_cache_mb <= 0:
+        return None
+    return FragmentStore(
+        cache_dir / "fragments",
+        markdown_signature(),
+        max_bytes=config.build.markdown_cache_mb * 1024 * 1024,
+    )
+
+
+def item_to_ctx(item: ContentItem, html: str) -> dict:
+    """Template-facing dict for a post or page."""
+    return {
+        "title": item.front_matter.get("title", ""),
+        "slug": item.slug,
+        "url_path": item.url_path,
+        "date": item.date,
+        "content": html,
+        "front_matter": item.front_matter,
+    }
+
+
+def backlink_ctx(item: ContentItem) -> dict:
+    """Template-facing summary of an item that links to the page being rendered."""
+    return {
+        "title": item.front_matter.get("title", ""),
+        "url_path": item.url_path,
+        "date": item.date,
+    }
+
+
+def resolve_jobs(jobs: int) -> int:
+    """Normalize a --jobs value: 0 or less means one worker per CPU."""
+    if jobs <= 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+def render_items(
+    tasks: list[RenderTask],
+    jobs: int,
+    templates_dir: Path,
+    site: dict,
+    collections,
+    plugins: list[str],
+    env=None,
+) -> list[RenderOutcome]:
+    """Render tasks; results are returned in task order regardless of ``jobs``.
+
+    With ``jobs > 1`` items are sharded across a process pool. Each worker loads
+    plugins and builds its own Jinja environment once (pool initializer).
+    """
+    jobs = resolve_jobs(jobs)
+    if jobs <= 1 or len(tasks) <= 1:
+        if env is None:
+            env = create_env(templates_dir, site, collections)
+        return [render_item(env, t, site, collections) for t in tasks]
+    workers = min(jobs, len(tasks))
+    chunksize = max(1, len(tasks) // (workers * 4))
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(templates_dir, site, collections, plugins),
+    ) as pool:
+        return list(pool.map(_render_in_worker, tasks, chunksize=chunksize))
+
+
+_worker_state: dict = {}
+
+
+def _init_worker(templates_dir: Path, site: dict, collections, plugins: list[str]) -> None:
+    from pycobello.plugins.manager import load_plugins
+
+    load_plugins(plugins)
+    _worker_state["env"] = create_env(templates_dir, site, collections)
+    _worker_state["site"] = site
+    _worker_state["collections"] = collections
+
+
+def _render_in_worker(task: RenderTask) -> RenderOutcome:
+    return render_item(
+        _worker_state["env"],
+        task,
+        _worker_state["site"],
+        _worker_state["collections"],
+    )
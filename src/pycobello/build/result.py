@@ -1,6 +1,6 @@
 """BuildResult dataclass."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 @dataclass
@@ -10,3 +10,5 @@ class BuildResult:
     written: list[str]
     skipped: list[str]
     errors: list[str]
+    up_to_date: bool = False
+    removed: list[str] = field(default_factory=list)
@@ -0,0 +1,301 @@
+"""Client-side search index: a stemmed inverted index, sharded by term prefix.
+
+Written under ``<output_dir>/<search.output_dir>/``:
+
+- ``index.json``: format, prefix length, document count, block size, and the
+  shard file of each term prefix;
+- ``t/<prefix>.json``: ``{term: [doc, weight, doc, weight, ...]}`` for the terms
+  starting with that prefix;
+- ``d/<n>.json``: ``[url, title]`` of documents ``n * DOC_BLOCK`` onwards (null
+  for unused ids).
+
+A browser fetches the manifest, one shard per query term and the blocks of the
+hits it shows (see the scaffolded ``static/search.js``). Postings live in the
+build cache, so a build re-tokenizes only changed items and rewrites only the
+shards and blocks they touch.
+"""
+
+import json
+import re
+from collections import Counter
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
+from html import unescape
+
+from pycobello.build.cache import BuildCache
+from pycobello.content.model import ContentItem
+
+SEARCH_FORMAT = 1
+# Below this many documents to (re)index, a process pool costs more than it saves.
+MIN_PARALLEL_DOCS = 64
+# Documents per ``d/<n>.json`` block.
+DOC_BLOCK = 256
+# Each occurrence of a term in the title counts this many times.
+TITLE_WEIGHT = 5
+MAX_TERM_LENGTH = 40
+STOPWORDS = frozenset(
+    "a an and are as at be but by for from has have in is it its of on or that the "
+    "this to was were will with".split()
+)
+
+_WORD = re.compile(r"[^\W_]+")
+_MARKUP = re.compile(r"<(script|style)\b.*?</\1\s*>|<!--.*?-->|<[^>]*>", re.DOTALL | re.IGNORECASE)
+_VOWELS = frozenset("aeiouy")
+
+
+@lru_cache(maxsize=65536)
+def stem(word: str) -> str:
+    """Light English suffix stripping (plurals, -ing, -ed, -ly, final e).
+
+    Deliberately simple so ``search.js`` can apply the same rules to queries;
+    non-ASCII words and words of three letters or fewer are kept as they are.
+    """
+    if len(word) <= 3 or not word.isascii() or not word.isalpha():
+        return word
+    if word.endswith("ies") and len(word) > 4:
+        word = word[:-3] + "y"
+    elif word.endswith("s") and not word.endswith(("ss", "us", "is")):
+        word = word[:-1]
+    for suffix in ("ingly", "edly", "ing", "ed", "ly"):
+        base = word[: -len(suffix)]
+        if word.endswith(suffix) and len(base) >= 3 and _VOWELS.intersection(base):
+            word = base
+            if len(word) > 3 and word[-1] == word[-2] and word[-1] not in "lsz":
+                word = word[:-1]
+            break
+    if word.endswith("e") and len(word) > 3:
+        word = word[:-1]
+    return word
+
+
+def tokenize(text: str) -> list[str]:
+    """Stemmed search terms of ``text``, in order (stopwords dropped)."""
+    return [
+        stem(word)
+        for word in _WORD.findall(text.lower())
+        if len(word) <= MAX_TERM_LENGTH and word not in STOPWORDS
+    ]
+
+
+def html_text(html: str) -> str:
+    """Visible text of an HTML fragment."""
+    return unescape(_MARKUP.sub(" ", html))
+
+
+def term_weights(title: str, html: str) -> dict[str, int]:
+    """Term -> weight for one document: occurrences, title ones ``TITLE_WEIGHT`` each."""
+    weights: dict[str, int] = {}
+    # Count words first: each distinct word is filtered and stemmed once.
+    for word, n in Counter(_WORD.findall(html_text(html).lower())).items():
+        if len(word) <= MAX_TERM_LENGTH and word not in STOPWORDS:
+            term = stem(word)
+            weights[term] = weights.get(term, 0) + n
+    for term in tokenize(title):
+        weights[term] = weights.get(term, 0) + TITLE_WEIGHT
+    return weights
+
+
+def shard_file(prefix: str) -> str:
+    """File name of a prefix's shard (hex-encoded unless plain ASCII)."""
+    if prefix.isascii() and prefix.isalnum():
+        return f"t/{prefix}.json"
+    return f"t/_{prefix.encode('utf-8').hex()}.json"
+
+
+@dataclass
+class SearchUpdate:
+    """What ``SearchIndex.update`` changed: items indexed, sources dropped, files to rewrite."""
+
+    indexed: list[ContentItem] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    dirty: set[str] = field(default_factory=set)
+
+
+class SearchIndex:
+    """Postings (``search_postings``) and documents (``search_docs``) in the build cache.
+
+    Each document keeps a small integer id; freed ids are reused so blocks stay
+    dense. ``update`` leaves its writes uncommitted: ``BuildCache.save`` commits
+    them with the rest of the build, so a failed build keeps the previous index.
+    """
+
+    def __init__(self, cache: BuildCache, prefix_length: int = 2) -> None:
+        self.cache = cache
+        self.prefix_length = prefix_length
+        self.docs = cache["search_docs"]
+
+    def signature(self) -> str:
+        from pycobello.content.markdown import markdown_signature
+
+        return json.dumps([SEARCH_FORMAT, self.prefix_length, markdown_signature()])
+
+    def update(
+        self,
+        items: list[ContentItem],
+        files: dict,
+        html_for: Callable[[ContentItem], str],
+        jobs: int = 1,
+    ) -> SearchUpdate:
+        """Re-index items whose source hash, URL or title changed; drop vanished ones.
+
+        ``files`` holds the build's source fingerprints; ``html_for`` renders a
+        body (the pipeline's ``BodyRenderer``, so fragments are reused). Only
+        postings whose weight changed are rewritten, and only their shards (and
+        the blocks of added, removed or retitled documents) are marked dirty.
+        """
+        conn = self.cache.conn
+        signature = self.signature()
+        result = SearchUpdate()
+        previous = self.docs.load_all() if self.cache.meta("search") == signature else {}
+        if not previous:
+            conn.execute("DELETE FROM search_postings")
+            conn.execute("DELETE FROM search_docs")
+        prefixes = self.prefixes()
+        rows: dict[str, dict] = {}
+        current: set[str] = set()
+        for item in items:
+            key = str(item.source_path)
+            entry = files.get(key)
+            if entry is None:
+                continue
+            current.add(key)
+            row = previous.get(key)
+            want = {
+                "hash": entry["hash"],
+                "url": item.url_path,
+                "title": str(item.front_matter.get("title", "")),
+            }
+            if row is None or any(row.get(k) != v for k, v in want.items()):
+                result.indexed.append(item)
+                rows[key] = want
+        result.removed = [key for key in previous if key not in current]
+
+        for key in result.removed:
+            doc = previous[key]["id"]
+            found = conn.execute(
+                "SELECT DISTINCT prefix FROM search_postings WHERE doc = ?", (doc,)
+            )
+            result.dirty.update(shard_file(p) for (p,) in found)
+            result.dirty.add(self.block_file(doc))
+            conn.execute("DELETE FROM search_postings WHERE doc = ?", (doc,))
+
+        used = {row["id"] for key, row in previous.items() if key in current}
+        ids = _free_ids(used)
+        titles = [rows[str(item.source_path)]["title"] for item in result.indexed]
+        for item, weights in zip(
+            result.indexed, _weights_all(result.indexed, titles, html_for, jobs), strict=True
+        ):
+            key = str(item.source_path)
+            row = rows[key]
+            old_row = previous.get(key)
+            if old_row is None:
+                row["id"] = doc = next(ids)
+                used.add(doc)
+                old: dict[str, int] = {}
+            else:
+                row["id"] = doc = old_row["id"]
+                found = conn.execute(
+                    "SELECT term, weight FROM search_postings WHERE doc = ?", (doc,)
+                )
+                old = dict(found.fetchall())
+            if old_row is None or (old_row["url"], old_row["title"]) != (row["url"], row["title"]):
+                result.dirty.add(self.block_file(doc))
+            changed = [t for t in old.keys() | weights.keys() if old.get(t) != weights.get(t)]
+            conn.executemany(
+                "DELETE FROM search_postings WHERE doc = ? AND term = ?",
+                ((doc, t) for t in changed if t in old),
+            )
+            conn.executemany(
+                "INSERT INTO search_postings (prefix, term, doc, weight) VALUES (?, ?, ?, ?)",
+                ((self.prefix(t), t, doc, weights[t]) for t in changed if t in weights),
+            )
+            result.dirty.update(shard_file(self.prefix(t)) for t in changed)
+        self.docs.delete(result.removed)
+        self.docs.upsert(rows)
+        conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('search', ?)", (signature,))
+        if result.removed or len(used) != len(previous) or self.prefixes() != prefixes:
+            result.dirty.add("index.json")
+        return result
+
+    def prefixes(self) -> list[str]:
+        """Term prefixes that have postings (one shard each), sorted."""
+        found = self.cache.conn.execute(
+            "SELECT DISTINCT prefix FROM search_postings ORDER BY prefix"
+        )
+        return [p for (p,) in found]
+
+    def prefix(self, term: str) -> str:
+        return term[: self.prefix_length]
+
+    def block_file(self, doc: int) -> str:
+        return f"d/{doc // DOC_BLOCK}.json"
+
+    def files(self) -> list[str]:
+        """Every file of the index, relative to its directory."""
+        blocks = self.cache.conn.execute(f"SELECT DISTINCT id / {DOC_BLOCK} FROM search_docs")
+        return [
+            "index.json",
+            *sorted(shard_file(p) for p in self.prefixes()),
+            *sorted(f"d/{n}.json" for (n,) in blocks),
+        ]
+
+    def render(self, name: str) -> str:
+        """Content of one index file (a name from ``files``)."""
+        conn = self.cache.conn
+        if name == "index.json":
+            data: object = {
+                "format": SEARCH_FORMAT,
+                "prefix": self.prefix_length,
+                "docs": len(self.docs),
+                "block": DOC_BLOCK,
+                "shards": {p: shard_file(p) for p in self.prefixes()},
+            }
+        elif name.startswith("t/"):
+            prefix = name[2:].removesuffix(".json")
+            if prefix.startswith("_"):
+                prefix = bytes.fromhex(prefix[1:]).decode("utf-8")
+            data = {}
+            for term, doc, weight in conn.execute(
+                "SELECT term, doc, weight FROM search_postings WHERE prefix = ? ORDER BY term, doc",
+                (prefix,),
+            ):
+                data.setdefault(term, []).extend((doc, weight))
+        else:
+            n = int(name[2:].removesuffix(".json"))
+            data = [None] * DOC_BLOCK
+            for doc, url, title in conn.execute(
+                "SELECT id, url, title FROM search_docs WHERE id >= ? AND id < ?",
+                (n * DOC_BLOCK, (n + 1) * DOC_BLOCK),
+            ):
+                data[doc - n * DOC_BLOCK] = [url, title]
+            while data and data[-1] is None:
+                data.pop()
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+def _weights_all(
+    items: list[ContentItem], titles: list[str], html_for, jobs: int
+) -> list[dict[str, int]]:
+    from pycobello.build.renderer import resolve_jobs
+
+    weigh = partial(_weights, html_for=html_for)
+    workers = min(resolve_jobs(jobs), len(items))
+    if workers <= 1 or len(items) < MIN_PARALLEL_DOCS:
+        return list(map(weigh, items, titles))
+    chunksize = max(1, len(items) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(weigh, items, titles, chunksize=chunksize))
+
+
+def _weights(item: ContentItem, title: str, html_for) -> dict[str, int]:
+    return term_weights(title, html_for(item))
+
+
+def _free_ids(used: set[int]):
+    n = 0
+    while True:
+        if n not in used:
+            yield n
+        n += 1
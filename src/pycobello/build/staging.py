@@ -0,0 +1,66 @@
+"""Staged output: build into a hardlinked copy of dist/, then swap it into place."""
+
+import ctypes
+import os
+import shutil
+import sys
+from pathlib import Path
+
+RENAME_EXCHANGE = 2
+
+
+def staging_dir_for(output_dir: Path) -> Path:
+    return output_dir.with_name(f".{output_dir.name}.staging")
+
+
+def prepare_staging(output_dir: Path, empty: bool = False) -> Path:
+    """Fresh staging directory mirroring ``output_dir`` through hardlinks.
+
+    Files are copied where linking fails. Outputs are replaced by rename, so
+    writing into the staging tree never touches the live one. With ``empty``
+    (``--clean``) the staging tree starts empty instead.
+    """
+    staging = staging_dir_for(output_dir)
+    shutil.rmtree(staging, ignore_errors=True)
+    if output_dir.is_dir() and not empty:
+        shutil.copytree(output_dir, staging, copy_function=_link_or_copy, symlinks=True)
+    else:
+        staging.mkdir(parents=True)
+    return staging
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def swap_into_place(staging: Path, output_dir: Path) -> None:
+    """Make ``staging`` the new ``output_dir``.
+
+    On Linux the two directories are exchanged in one ``renameat2`` call, so
+    readers always see a complete tree; elsewhere two renames leave a brief gap.
+    """
+    if output_dir.is_dir() and _exchange(staging, output_dir):
+        shutil.rmtree(staging, ignore_errors=True)
+        return
+    old = output_dir.with_name(f".{output_dir.name}.old")
+    shutil.rmtree(old, ignore_errors=True)
+    if output_dir.exists():
+        os.rename(output_dir, old)
+    os.rename(staging, output_dir)
+    shutil.rmtree(old, ignore_errors=True)
+
+
+def _exchange(a: Path, b: Path) -> bool:
+    if not sys.platform.startswith("linux"):
+        return False
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        renameat2 = libc.renameat2
+    except (OSError, AttributeError):
+        return False
+    at_fdcwd = -100
+    rc = renameat2(at_fdcwd, os.fsencode(a), at_fdcwd, os.fsencode(b), RENAME_EXCHANGE)
+    return rc == 0
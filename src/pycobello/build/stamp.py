@@ -0,0 +1,83 @@
+"""Stat-only build stamp: detects "nothing changed since the last build" without reading files."""
+
+import hashlib
+import os
+import time
+from pathlib import Path
+
+# Sources modified this recently may still change within the same mtime tick, so
+# a stamp is only recorded once every input is older than this ("racy" files).
+RACY_NS = 2_000_000_000
+
+
+def build_stamp(project_root: Path, config) -> tuple[str, int]:
+    """(digest, newest input mtime in ns) over config, content, theme, static and output.
+
+    The digest covers the effective ``config`` (whatever file or code it came
+    from) and each file's path, mtime and size; output files do not count towards
+    the newest mtime. Files are only walked and ``stat()``-ed.
+    """
+    from pycobello import __version__
+    from pycobello.build.incremental import config_fingerprint
+
+    h = hashlib.sha256(__version__.encode())
+    h.update(config_fingerprint(config).encode())
+    output_dir = project_root / config.build.output_dir
+    newest = 0
+    for path in (
+        project_root / config.build.content_dir,
+        project_root / config.build.theme_dir,
+        project_root / config.build.static_dir,
+        output_dir,
+    ):
+        h.update(f"\0{path}\0".encode())
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        if path.is_dir():
+            latest = _walk(path, h)
+        else:
+            h.update(f"{st.st_mtime_ns} {st.st_size}\n".encode())
+            latest = st.st_mtime_ns
+        if path != output_dir:
+            newest = max(newest, latest)
+    return h.hexdigest(), newest
+
+
+def is_racy(newest_mtime_ns: int) -> bool:
+    """True if an input changed too recently for its mtime to be trusted."""
+    return newest_mtime_ns >= time.time_ns() - RACY_NS
+
+
+def _walk(directory: Path, h) -> int:
+    newest = 0
+    try:
+        entries = sorted(os.scandir(directory), key=lambda e: e.name)
+    except OSError:
+        return newest
+    for entry in entries:
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                h.update(f"{entry.path}/\n".encode())
+                newest = max(newest, _walk(Path(entry.path), h))
+            else:
+                st = entry.stat()
+                h.update(f"{entry.path} {st.st_mtime_ns} {st.st_size}\n".encode())
+                newest = max(newest, st.st_mtime_ns)
+        except OSError:
+            continue
+    return newest
+
+
+def read_stamp(path: Path) -> str | None:
+    """The stamp recorded by the last successful build, if any."""
+    try:
+        return path.read_text().strip()
+    except OSError:
+        return None
+
+
+def write_stamp(path: Path, stamp: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(stamp + "\n")
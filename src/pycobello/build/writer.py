@@ -1,19 +1,136 @@
 """File writing with write-avoidance by hash. Step 6."""
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from pycobello.build.cache import content_sha256
+from pycobello.build.cache import content_hash
+
+FLUSH_BYTES = 64 * 1024 * 1024
 
 
 def write_if_changed(
     path: Path,
     content: str,
-    cached_sha256: str | None,
+    cached_hash: str | None,
 ) -> tuple[bool, str]:
-    """Write content to path only if sha256 differs. Return (written, new_sha256)."""
-    new_hash = content_sha256(content)
-    if cached_sha256 == new_hash:
+    """Write content to path only if its hash differs. Return (written, new_hash)."""
+    data = content.encode("utf-8")
+    new_hash = content_hash(data)
+    if cached_hash == new_hash:
         return False, new_hash
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content, encoding="utf-8")
+    write_atomic(path, data)
     return True, new_hash
+
+
+def write_atomic(path: Path, data: bytes, fsync: bool = False) -> None:
+    """Write via a temp file in the same directory and rename over ``path``.
+
+    Readers see the old file or the new one, never a partial write.
+    """
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+class OutputWriter:
+    """Batched output writes: hash now, write later in a thread pool.
+
+    ``write_if_changed`` decides and returns at once; changed files are queued
+    and written by ``flush`` (also triggered once ``FLUSH_BYTES`` are pending),
+    which creates each missing directory once and writes atomically. With
+    ``fsync``, files and their directories are synced before returning.
+    """
+
+    def __init__(self, fsync: bool = False, workers: int | None = None) -> None:
+        self.fsync = fsync
+        self.workers = workers
+        self._pending: dict[Path, bytes] = {}
+        self._pending_bytes = 0
+        self._dirs: set[Path] = set()
+
+    def write_if_changed(
+        self, path: Path, content: str, cached_hash: str | None
+    ) -> tuple[bool, str]:
+        """Queue content for path only if its hash differs. Return (written, new_hash).
+
+        The encoded bytes are hashed and later written as-is, so encoding happens once.
+        """
+        data = content.encode("utf-8")
+        new_hash = content_hash(data)
+        if cached_hash == new_hash:
+            return False, new_hash
+        # A path queued twice in one batch is written once, with the latest content.
+        self._pending_bytes += len(data) - len(self._pending.get(path, b""))
+        self._pending[path] = data
+        if self._pending_bytes >= FLUSH_BYTES:
+            self.flush()
+        return True, new_hash
+
+    def flush(self) -> None:
+        """Write everything queued so far."""
+        pending, self._pending, self._pending_bytes = list(self._pending.items()), {}, 0
+        if not pending:
+            return
+        parents = sorted({path.parent for path, _ in pending} - self._dirs)
+        for parent in parents:
+            parent.mkdir(parents=True, exist_ok=True)
+        self._dirs.update(parents)
+        if len(pending) == 1:
+            write_atomic(*pending[0], fsync=self.fsync)
+        else:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                list(pool.map(lambda item: write_atomic(*item, fsync=self.fsync), pending))
+        if self.fsync:
+            for parent in {path.parent for path, _ in pending}:
+                fsync_dir(parent)
+
+
+def fsync_dir(path: Path) -> None:
+    """Persist directory entries (renames) where the platform allows it."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def prune_outputs(output_dir: Path, stale: list[str]) -> list[str]:
+    """Delete stale outputs (relative to output_dir) and directories left empty."""
+    removed: list[str] = []
+    for rel in sorted(stale):
+        path = output_dir / rel
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError:
+            continue
+        else:
+            removed.append(str(path))
+        prune_empty_dirs(path.parent, output_dir)
+    return removed
+
+
+def prune_empty_dirs(directory: Path, stop: Path) -> None:
+    """Remove ``directory`` and its parents while empty, up to (not including) ``stop``."""
+    while directory != stop and directory.is_relative_to(stop):
+        try:
+            directory.rmdir()
+        except OSError:
+            return
+        directory = directory.parent
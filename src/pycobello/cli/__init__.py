@@ -61,11 +61,37 @@ def new(
 def build(
     project_root: str = typer.Argument(".", help="Project root."),
     clean: bool = typer.Option(False, "--clean", help="Clean output dir before build."),
+    incremental: bool = typer.Option(
+        True,
+        "--incremental/--full",
+        help="Skip rendering unchanged items (default) or re-render everything.",
+    ),
+    jobs: int = typer.Option(
+        1,
+        "--jobs",
+        "-j",
+        help="Render with N worker processes (0 = one per CPU).",
+    ),
+    profile: bool = typer.Option(
+        False, "--profile", help="Print per-stage, per-template and slowest-item timings."
+    ),
+    profile_output: str | None = typer.Option(
+        None,
+        "--profile-output",
+        help="Also write the profile as a Chrome trace JSON file (implies --profile).",
+    ),
 ) -> None:
     """Build the site."""
     from pycobello.cli._build import run_build
 
-    run_build(project_root, clean=clean)
+    run_build(
+        project_root,
+        clean=clean,
+        incremental=incremental,
+        jobs=jobs,
+        profile=profile,
+        profile_output=profile_output,
+    )
 
 
 @app.command()
@@ -73,21 +99,47 @@ def preview(
     project_root: str = typer.Argument(".", help="Project root."),
     port: int = typer.Option(8000, "--port", "-p", help="Port to serve on."),
     watch: bool = typer.Option(False, "--watch", "-w", help="Watch and rebuild on changes."),
+    live: bool = typer.Option(
+        False,
+        "--live",
+        help="Render pages in memory on request; invalidate only what each change affects.",
+    ),
 ) -> None:
     """Serve the built site; optionally watch and rebuild."""
     from pycobello.cli._preview import run_preview
 
-    run_preview(project_root, port=port, watch=watch)
+    run_preview(project_root, port=port, watch=watch, live=live)
 
 
 @app.command()
 def check(
     project_root: str = typer.Argument(".", help="Project root."),
+    jobs: int = typer.Option(
+        1,
+        "--jobs",
+        "-j",
+        help="Parse changed files with N worker processes (0 = one per CPU).",
+    ),
+    html: bool = typer.Option(
+        False,
+        "--html",
+        help="Also check links, #anchors and asset references in the built output.",
+    ),
+    external: bool = typer.Option(
+        False,
+        "--external",
+        help="Also request external http(s) links found in the built output.",
+    ),
+    external_ttl: float = typer.Option(
+        24.0,
+        "--external-ttl",
+        help="Hours a passing external link is trusted before it is requested again.",
+    ),
 ) -> None:
     """Run diagnostics (links, slugs, front matter)."""
     from pycobello.cli._check import run_check
 
-    run_check(project_root)
+    run_check(project_root, jobs=jobs, html=html, external=external, external_ttl=external_ttl)
 
 
 @app.command("deploy")
@@ -1,9 +1,19 @@
 """Build command implementation."""
 
+from pathlib import Path
 
-def run_build(project_root: str, clean: bool = False) -> None:
+
+def run_build(
+    project_root: str,
+    clean: bool = False,
+    incremental: bool = True,
+    jobs: int = 1,
+    profile: bool = False,
+    profile_output: str | None = None,
+) -> None:
     """Run build pipeline. Implemented in Steps 5–7."""
     from pycobello.build.pipeline import run_pipeline
+    from pycobello.build.profile import Profiler
     from pycobello.config.load import load_config
     from pycobello.errors import ConfigError
 
@@ -11,9 +21,26 @@ def run_build(project_root: str, clean: bool = False) -> None:
         config = load_config(project_root)
     except ConfigError as e:
         raise SystemExit(str(e)) from e
-    result = run_pipeline(config, project_root=project_root, clean=clean)
+    profiler = Profiler() if profile or profile_output else None
+    result = run_pipeline(
+        config,
+        project_root=project_root,
+        clean=clean,
+        incremental=incremental,
+        jobs=jobs,
+        profiler=profiler,
+    )
+    if profiler is not None:
+        print(profiler.report())
+        if profile_output:
+            profiler.write(Path(project_root) / profile_output)
+            print(f"Profile written to {profile_output}")
     if result.errors:
         for err in result.errors:
             print(err, file=__import__("sys").stderr)
         raise SystemExit(1)
-    print(f"Build done: {len(result.written)} written, {len(result.skipped)} skipped.")
+    if result.up_to_date:
+        print("Build up to date.")
+        return
+    removed = f", {len(result.removed)} removed" if result.removed else ""
+    print(f"Build done: {len(result.written)} written, {len(result.skipped)} skipped{removed}.")
@@ -1,8 +1,20 @@
 """Check command implementation."""
 
 
-def run_check(project_root: str) -> None:
+def run_check(
+    project_root: str,
+    jobs: int = 1,
+    html: bool = False,
+    external: bool = False,
+    external_ttl: float = 24.0,
+) -> None:
     """Run diagnostics. Implemented in Step 9."""
     from pycobello.diagnostics.checks import run_checks
 
-    run_checks(project_root)
+    run_checks(
+        project_root,
+        jobs=jobs,
+        html=html,
+        external=external,
+        external_ttl_hours=external_ttl,
+    )
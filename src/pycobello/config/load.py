@@ -10,15 +10,21 @@ from pycobello.config.models import (
     CollectionsSettings,
     PluginsSettings,
     PyCobelloSettings,
+    SearchSettings,
     SiteSettings,
+    TaxonomyConfig,
 )
 from pycobello.errors import ConfigError
 
 
+def config_file(project_root: str | Path = ".", config_path: str | None = None) -> Path:
+    """The config file ``load_config`` reads (``pycobello.yml`` unless given)."""
+    return Path(project_root).resolve() / (config_path or "pycobello.yml")
+
+
 def load_config(project_root: str = ".", config_path: str | None = None) -> PyCobelloSettings:
     """Load and validate config from YAML. Raises ConfigError if missing or invalid."""
-    root = Path(project_root).resolve()
-    path = root / (config_path or "pycobello.yml")
+    path = config_file(project_root, config_path)
     if not path.is_file():
         raise ConfigError(f"Config not found: {path}. Run 'pycobello init' to create a new site.")
     try:
@@ -37,10 +43,13 @@ def load_config(project_root: str = ".", config_path: str | None = None) -> PyCo
 
 def _settings_from_dict(d: dict) -> PyCobelloSettings:
     """Build PyCobelloSettings from a plain dict (no env)."""
+    from pycobello.build.cache import HASH_BACKENDS
+
     site_d = d.get("site") or {}
     build_d = d.get("build") or {}
     coll_d = d.get("collections") or {}
     plugins_d = d.get("plugins") or {}
+    search_d = d.get("search") or {}
 
     site = SiteSettings(
         title=_str(site_d.get("title"), "My Site"),
@@ -54,24 +63,75 @@ def _settings_from_dict(d: dict) -> PyCobelloSettings:
         output_dir=_str(build_d.get("output_dir"), "dist"),
         clean_urls=_bool(build_d.get("clean_urls"), True),
         ignore=_str_list(build_d.get("ignore")),
+        markdown_cache_mb=_int(build_d.get("markdown_cache_mb"), 256),
+        asset_hardlinks=_bool(build_d.get("asset_hardlinks"), False),
+        atomic_output=_bool(build_d.get("atomic_output"), False),
+        fsync=_bool(build_d.get("fsync"), False),
+        hash=_choice(build_d.get("hash"), "auto", HASH_BACKENDS),
     )
     posts_d = coll_d.get("posts") if isinstance(coll_d.get("posts"), dict) else {}
     pages_d = coll_d.get("pages") if isinstance(coll_d.get("pages"), dict) else {}
     collections = CollectionsSettings(
-        posts=CollectionConfig(
-            path=_str(posts_d.get("path"), "posts"),
-            url_prefix=_str(posts_d.get("url_prefix"), "blog"),
-            template=_str(posts_d.get("template"), "post.html"),
-        ),
-        pages=CollectionConfig(
-            path=_str(pages_d.get("path"), "pages"),
-            url_prefix=_str(pages_d.get("url_prefix"), ""),
-            template=_str(pages_d.get("template"), "page.html"),
-        ),
+        posts=_collection("posts", posts_d, "posts", "blog", "post.html"),
+        pages=_collection("pages", pages_d, "pages", "", "page.html"),
     )
     plugins = PluginsSettings(enabled=_str_list(plugins_d.get("enabled")))
+    taxonomies = [_taxonomy(t) for t in d.get("taxonomies") or []]
+    search = SearchSettings(
+        enabled=_bool(search_d.get("enabled"), False),
+        output_dir=_str(search_d.get("output_dir"), "search").strip("/"),
+        prefix_length=_int(search_d.get("prefix_length"), 2),
+    )
+    if search.prefix_length < 1:
+        raise TypeError(f"search.prefix_length must be at least 1, got {search.prefix_length}")
+    if not search.output_dir:
+        raise TypeError("search.output_dir must not be empty")
+
+    return PyCobelloSettings(
+        site=site,
+        build=build,
+        collections=collections,
+        plugins=plugins,
+        taxonomies=taxonomies,
+        search=search,
+    )
+
 
-    return PyCobelloSettings(site=site, build=build, collections=collections, plugins=plugins)
+def _collection(name: str, d: dict, path: str, url_prefix: str, template: str) -> CollectionConfig:
+    coll = CollectionConfig(
+        path=_str(d.get("path"), path),
+        url_prefix=_str(d.get("url_prefix"), url_prefix),
+        template=_str(d.get("template"), template),
+        per_page=_int(d.get("per_page"), 0),
+        archive_template=_str(d.get("archive_template"), ""),
+    )
+    if coll.archive_template and not coll.url_prefix.strip("/"):
+        raise TypeError(f"collections.{name}.archive_template requires a url_prefix")
+    return coll
+
+
+def _taxonomy(d: object) -> TaxonomyConfig:
+    """A taxonomy entry: a name (``- tags``) or a mapping with at least ``name``."""
+    if not isinstance(d, dict):
+        d = {"name": d}
+    name = _str(d.get("name"), "")
+    if not name:
+        raise TypeError("taxonomies entries need a name")
+    return TaxonomyConfig(
+        name=name,
+        field=_str(d.get("field"), name),
+        url_prefix=_str(d.get("url_prefix"), name),
+        template=_str(d.get("template"), "term.html"),
+        list_template=_str(d.get("list_template"), "terms.html"),
+        per_page=_int(d.get("per_page"), 0),
+    )
+
+
+def _choice(v: object, default: str, choices: tuple[str, ...]) -> str:
+    value = _str(v, default).lower()
+    if value not in choices:
+        raise TypeError(f"expected one of {', '.join(choices)}, got {v!r}")
+    return value
 
 
 def _str(v: object, default: str) -> str:
@@ -88,6 +148,17 @@ def _bool(v: object, default: bool) -> bool:
     return str(v).lower() in ("true", "1", "yes")
 
 
+def _int(v: object, default: int) -> int:
+    if v is None:
+        return default
+    if isinstance(v, bool):
+        raise TypeError(f"expected an integer, got {v!r}")
+    try:
+        return int(v)
+    except ValueError as e:
+        raise TypeError(f"expected an integer, got {v!r}") from e
+
+
 def _str_list(v: object) -> list[str]:
     if v is None:
         return []
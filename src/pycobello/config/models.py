@@ -22,15 +22,26 @@ class BuildSettings:
     output_dir: str = "dist"
     clean_urls: bool = True
     ignore: list[str] = field(default_factory=list)
+    markdown_cache_mb: int = 256
+    asset_hardlinks: bool = False
+    atomic_output: bool = False
+    fsync: bool = False
+    hash: str = "auto"
 
 
 @dataclass
 class CollectionConfig:
-    """Single collection (posts or pages)."""
+    """Single collection (posts or pages).
+
+    ``per_page`` > 0 paginates its listings; ``archive_template`` enables archive
+    pages at ``/<url_prefix>/`` and ``/<url_prefix>/page/N/``.
+    """
 
     path: str
     url_prefix: str = ""
     template: str = ""
+    per_page: int = 0
+    archive_template: str = ""
 
 
 @dataclass
@@ -47,6 +58,22 @@ class CollectionsSettings:
     )
 
 
+@dataclass
+class TaxonomyConfig:
+    """A taxonomy (e.g. tags) read from a front matter field.
+
+    Each term gets ``template`` pages at ``/<url_prefix>/<term>/`` (paginated by
+    ``per_page``); ``list_template`` adds a page listing all terms.
+    """
+
+    name: str
+    field: str = ""
+    url_prefix: str = ""
+    template: str = "term.html"
+    list_template: str = "terms.html"
+    per_page: int = 0
+
+
 @dataclass
 class PluginsSettings:
     """Plugin enable list."""
@@ -54,6 +81,18 @@ class PluginsSettings:
     enabled: list[str] = field(default_factory=list)
 
 
+@dataclass
+class SearchSettings:
+    """Client-side search index, written to ``<output_dir>/<search.output_dir>/``.
+
+    Terms are sharded by their first ``prefix_length`` characters.
+    """
+
+    enabled: bool = False
+    output_dir: str = "search"
+    prefix_length: int = 2
+
+
 @dataclass
 class PyCobelloSettings:
     """Root config (from pycobello.yml only; no env overrides)."""
@@ -62,3 +101,5 @@ class PyCobelloSettings:
     build: BuildSettings = field(default_factory=BuildSettings)
     collections: CollectionsSettings = field(default_factory=CollectionsSettings)
     plugins: PluginsSettings = field(default_factory=PluginsSettings)
+    taxonomies: list[TaxonomyConfig] = field(default_factory=list)
+    search: SearchSettings = field(default_factory=SearchSettings)
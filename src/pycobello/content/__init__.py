@@ -1,12 +1,15 @@
 """Content discovery, front matter, and markdown."""
 
-from pycobello.content.discovery import discover_items
+from pycobello.content.discovery import Discovery, discover, discover_items, iter_items
 from pycobello.content.frontmatter import parse_frontmatter
 from pycobello.content.markdown import get_tokens, markdown_to_html
 from pycobello.content.model import ContentItem, ContentKind
 
 __all__ = [
+    "Discovery",
+    "discover",
     "discover_items",
+    "iter_items",
     "parse_frontmatter",
     "markdown_to_html",
     "get_tokens",
@@ -1,21 +1,41 @@
 """Discover content files in content dir. Filled in Step 4."""
 
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from datetime import date as date_type
 from pathlib import Path
 
+from pycobello.content.index import HeaderIndex
 from pycobello.content.model import ContentItem, ContentKind
+from pycobello.errors import FrontMatterError
 
 
-def discover_items(
+@dataclass
+class Discovery:
+    """One discovery pass, shared by the build and every diagnostic."""
+
+    items: list[ContentItem] = field(default_factory=list)
+    errors: list[tuple[Path, str]] = field(default_factory=list)
+
+
+def iter_items(
     content_dir: Path,
     collections: dict,
     ignore: list[str] | None = None,
-) -> list[ContentItem]:
-    """Find all markdown files in collection paths. Returns list of ContentItems (parsed in pipeline)."""
-    from pycobello.content.frontmatter import parse_frontmatter
+    errors: list[tuple[Path, str]] | None = None,
+    index: HeaderIndex | None = None,
+) -> Iterator[ContentItem]:
+    """Yield item headers (path, stat, front matter, slug, URL) one file at a time.
+
+    Only the leading front matter bytes are read, and not even those when the
+    header ``index`` has an entry for the file's mtime/size. Bodies are loaded
+    later by ``ContentItem.load_body``. Invalid front matter raises
+    FrontMatterError unless an ``errors`` list is given to collect it.
+    """
+    from pycobello.content.frontmatter import load_yaml, read_frontmatter
     from pycobello.render.routing import slug_from_item
 
     ignore = ignore or []
-    items: list[ContentItem] = []
     for name, coll in collections.items():
         if name == "posts":
             kind = ContentKind.POST
@@ -31,18 +51,32 @@ def discover_items(
             if any(p in path.parts for p in ignore):
                 continue
             try:
-                raw = path.read_text()
+                st = path.stat()
             except OSError:
                 continue
-            fm, body = parse_frontmatter(raw)
+            cached = index.get(path, st) if index is not None else None
+            if cached is not None:
+                fm, body_offset = cached
+            else:
+                try:
+                    fm_s, body_offset = read_frontmatter(path)
+                except OSError:
+                    continue
+                try:
+                    fm = load_yaml(fm_s) if fm_s is not None else {}
+                except FrontMatterError as e:
+                    if errors is None:
+                        raise
+                    errors.append((path, str(e)))
+                    continue
+                if index is not None:
+                    index.put(path, st, fm, body_offset)
             slug = slug_from_item(path, fm, kind)
             url_prefix = getattr(coll, "url_prefix", "") or ""
             if url_prefix:
                 url_path = f"/{url_prefix.rstrip('/')}/{slug}/"
             else:
                 url_path = f"/{slug}/"
-            from datetime import date as date_type
-
             d = None
             if "date" in fm and fm["date"]:
                 try:
@@ -50,16 +84,38 @@ def discover_items(
                 except (ValueError, TypeError):
                     pass
             template = fm.get("template") or getattr(coll, "template", "")
-            items.append(
-                ContentItem(
-                    kind=kind,
-                    source_path=path,
-                    front_matter=fm,
-                    body_markdown=body,
-                    slug=slug,
-                    url_path=url_path.rstrip("/") or "/",
-                    date=d,
-                    template=template or None,
-                )
+            yield ContentItem(
+                kind=kind,
+                source_path=path,
+                front_matter=fm,
+                body_markdown=None,
+                slug=slug,
+                url_path=url_path.rstrip("/") or "/",
+                date=d,
+                template=template or None,
+                mtime=st.st_mtime,
+                size=st.st_size,
+                body_offset=body_offset,
             )
-    return items
+
+
+def discover_items(
+    content_dir: Path,
+    collections: dict,
+    ignore: list[str] | None = None,
+    index: HeaderIndex | None = None,
+) -> list[ContentItem]:
+    """Find all markdown files in collection paths. Returns item headers (bodies load lazily)."""
+    return list(iter_items(content_dir, collections, ignore, index=index))
+
+
+def discover(
+    content_dir: Path,
+    collections: dict,
+    ignore: list[str] | None = None,
+    index: HeaderIndex | None = None,
+) -> Discovery:
+    """Discover once, collecting front matter errors instead of raising."""
+    result = Discovery()
+    result.items.extend(iter_items(content_dir, collections, ignore, result.errors, index))
+    return result
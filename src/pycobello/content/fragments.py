@@ -0,0 +1,84 @@
+"""Content-addressed on-disk store of rendered Markdown fragments (LRU by mtime)."""
+
+import hashlib
+import os
+from pathlib import Path
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+class FragmentStore:
+    """HTML fragments under ``root``, keyed by body sha256 + Markdown configuration.
+
+    Each fragment is one file (``root/ab/abcdef....html``). A hit refreshes the
+    file's mtime, so ``prune`` can evict least-recently-used fragments until the
+    store fits in ``max_bytes``. Safe to share between processes.
+    """
+
+    def __init__(self, root: Path, signature: str, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.root = Path(root)
+        self.signature = signature
+        self.max_bytes = max_bytes
+
+    def key(self, text: str) -> str:
+        h = hashlib.sha256(self.signature.encode("utf-8"))
+        h.update(b"\0")
+        h.update(text.encode("utf-8"))
+        return h.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.html"
+
+    def has(self, key: str) -> bool:
+        return self._path(key).is_file()
+
+    def get(self, key: str) -> str | None:
+        path = self._path(key)
+        try:
+            html = path.read_text(encoding="utf-8")
+        except OSError:
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return html
+
+    def put(self, key: str, html: str) -> None:
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            tmp.write_text(html, encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError:
+            pass
+
+    def prune(self) -> int:
+        """Evict oldest fragments until total size <= max_bytes. Return number removed."""
+        if not self.root.is_dir():
+            return 0
+        entries: list[tuple[float, int, str]] = []
+        total = 0
+        for sub in os.scandir(self.root):
+            if not sub.is_dir():
+                continue
+            for f in os.scandir(sub.path):
+                if f.name.endswith(".html"):
+                    st = f.stat()
+                    entries.append((st.st_mtime, st.st_size, f.path))
+                    total += st.st_size
+        removed = 0
+        if total <= self.max_bytes:
+            return removed
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        return removed
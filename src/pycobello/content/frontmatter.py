@@ -1,26 +1,72 @@
 """Parse YAML front matter from Markdown. Filled in Step 4."""
 
+import codecs
+from pathlib import Path
+
 import yaml
 
+from pycobello.content.model import normalize_newlines
 from pycobello.errors import FrontMatterError
 
+# libyaml-backed loader when PyYAML was built with it; same results, much faster.
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-def parse_frontmatter(text: str) -> tuple[dict, str]:
-    """Return (front_matter_dict, body_markdown). No delimiter -> ({}, full text)."""
-    text = text.lstrip("\n")
-    if not text.startswith("---"):
-        return {}, text
+
+def split_frontmatter(text: str) -> tuple[str | None, int]:
+    """Locate front matter. Return (yaml_source or None, index where the body starts)."""
+    start = len(text) - len(text.lstrip("\n"))
+    if not text.startswith("---", start):
+        return None, start
     try:
-        idx = text.index("\n---", 3)
+        idx = text.index("\n---", start + 3)
     except ValueError:
-        return {}, text
-    end = idx + 1
-    fm_s = text[3:end].strip()
-    body = text[end + 4 :].lstrip("\n")
+        return None, start
+    fm_s = text[start + 3 : idx + 1].strip()
+    body_start = idx + 5
+    while body_start < len(text) and text[body_start] == "\n":
+        body_start += 1
+    return fm_s, body_start
+
+
+def read_frontmatter(path: Path, chunk_size: int = 4096) -> tuple[str | None, int]:
+    """Like split_frontmatter on the file's text, but reads only the leading bytes.
+
+    The body offset indexes the newline-normalized text (see ContentItem.load_body).
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    raw = ""
+    with open(path, "rb") as f:
+        while True:
+            data = f.read(chunk_size)
+            eof = not data
+            raw += decoder.decode(data, final=eof)
+            text = normalize_newlines(raw)
+            fm_s, body_start = split_frontmatter(text)
+            if eof:
+                return fm_s, body_start
+            head = text.lstrip("\n")
+            if len(head) >= 3 and not head.startswith("---"):
+                return None, body_start
+            if fm_s is not None and body_start < len(text):
+                return fm_s, body_start
+            chunk_size *= 2
+
+
+def load_yaml(fm_s: str) -> dict:
+    """Parse a front matter block; empty block -> {}."""
     if not fm_s:
-        return {}, body
+        return {}
     try:
-        data = yaml.safe_load(fm_s)
+        data = yaml.load(fm_s, Loader=_SafeLoader)
     except yaml.YAMLError as e:
         raise FrontMatterError(str(e)) from e
-    return (data or {}), body
+    return data or {}
+
+
+def parse_frontmatter(text: str) -> tuple[dict, str]:
+    """Return (front_matter_dict, body_markdown). No delimiter -> ({}, full text)."""
+    fm_s, body_start = split_frontmatter(text)
+    body = text[body_start:]
+    if fm_s is None:
+        return {}, body
+    return load_yaml(fm_s), body
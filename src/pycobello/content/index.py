@@ -0,0 +1,86 @@
+"""Persistent index of parsed front matter, keyed by file fingerprint."""
+
+import json
+from datetime import date, datetime
+from pathlib import Path
+
+
+class HeaderIndex:
+    """Parsed front matter + body offset per source, valid while mtime/size match.
+
+    Rows live in the build cache's ``headers`` table, keyed by project-relative
+    path and looked up one at a time. Front matter is stored as JSON with dates
+    and datetimes tagged so they round-trip; front matter JSON can't represent
+    (sets, binary, non-string keys) is simply not indexed. ``save`` writes the
+    entries added since loading and drops those of sources not seen, so deleted
+    sources drop out.
+    """
+
+    def __init__(self, cache) -> None:
+        self.cache = cache
+        self.table = cache["headers"]
+        self._seen: set[str] = set()
+        self._added: dict[str, dict] = {}
+
+    def get(self, source: Path, st) -> tuple[dict, int] | None:
+        """Return (front_matter, body_offset) if indexed for this stat result."""
+        key = str(source)
+        entry = self.table.get(key)
+        if entry is None or entry["mtime_ns"] != st.st_mtime_ns or entry["size"] != st.st_size:
+            return None
+        self._seen.add(key)
+        return json.loads(entry["fm"], object_hook=_decode), entry["offset"]
+
+    def put(self, source: Path, st, front_matter: dict, body_offset: int) -> None:
+        try:
+            _check_encodable(front_matter)
+        except TypeError:
+            return
+        key = str(source)
+        self._added[key] = {
+            "mtime_ns": st.st_mtime_ns,
+            "size": st.st_size,
+            "fm": json.dumps(front_matter, default=_encode, separators=(",", ":")),
+            "offset": body_offset,
+        }
+        self._seen.add(key)
+
+    def save(self) -> None:
+        """Commit added entries and drop the entries of sources not seen."""
+        gone = [key for key in self.table if key not in self._seen]
+        if not gone and not self._added:
+            return
+        with self.cache.conn:
+            self.table.upsert(self._added)
+            self.table.delete(gone)
+        self._added = {}
+
+
+def _check_encodable(value) -> None:
+    if isinstance(value, dict):
+        for k, v in value.items():
+            if not isinstance(k, str):
+                raise TypeError(f"non-string key {k!r}")
+            _check_encodable(v)
+    elif isinstance(value, list):
+        for v in value:
+            _check_encodable(v)
+    elif not isinstance(value, str | int | float | bool | date | type(None)):
+        raise TypeError(f"unsupported front matter value {value!r}")
+
+
+def _encode(value):
+    if isinstance(value, datetime):
+        return {"$datetime": value.isoformat()}
+    if isinstance(value, date):
+        return {"$date": value.isoformat()}
+    raise TypeError(f"unsupported front matter value {value!r}")
+
+
+def _decode(obj: dict):
+    if len(obj) == 1:
+        if "$date" in obj:
+            return date.fromisoformat(obj["$date"])
+        if "$datetime" in obj:
+            return datetime.fromisoformat(obj["$datetime"])
+    return obj
@@ -1,17 +1,53 @@
 """Markdown rendering via markdown-it-py. Step 4."""
 
+import json
+from functools import cache
+
+import markdown_it
 from markdown_it import MarkdownIt
 
+from pycobello.content.fragments import FragmentStore
+
 
+@cache
 def _md() -> MarkdownIt:
+    """Configured parser, built once per process and reused for every document."""
     return MarkdownIt()
 
 
-def markdown_to_html(text: str) -> str:
-    """Render Markdown to HTML."""
-    return _md().render(text)
+@cache
+def markdown_signature() -> str:
+    """Identifies the Markdown configuration (version, options, active rules)."""
+    md = _md()
+    return json.dumps(
+        [markdown_it.__version__, dict(md.options), md.get_active_rules()],
+        sort_keys=True,
+        default=str,
+    )
+
+
+def markdown_to_html(text: str, store: FragmentStore | None = None) -> str:
+    """Render Markdown to HTML, consulting the fragment store first if given."""
+    if store is None:
+        return _md().render(text)
+    key = store.key(text)
+    html = store.get(key)
+    if html is None:
+        html = _md().render(text)
+        store.put(key, html)
+    return html
+
 
+def get_tokens(text: str, store: FragmentStore | None = None):
+    """Return token stream for diagnostics (e.g. link extraction).
 
-def get_tokens(text: str):
-    """Return token stream for diagnostics (e.g. link extraction)."""
-    return _md().parse(text)
+    With a fragment store, the HTML rendered from these tokens is stored as well
+    (unless already there), so a later ``markdown_to_html`` does not parse again.
+    """
+    md = _md()
+    tokens = md.parse(text)
+    if store is not None:
+        key = store.key(text)
+        if not store.has(key):
+            store.put(key, md.renderer.render(tokens, md.options, {}))
+    return tokens
@@ -17,13 +17,36 @@ class ContentKind(StrEnum):
 
 @dataclass
 class ContentItem:
-    """A single content file (post or page)."""
+    """A single content file (post or page).
+
+    Discovery yields lightweight headers: ``body_markdown`` is None and the body
+    is read from ``source_path`` (starting at ``body_offset``) by ``load_body``.
+    """
 
     kind: ContentKind
     source_path: Path
     front_matter: dict
-    body_markdown: str
+    body_markdown: str | None
     slug: str
     url_path: str
     date: date | None = None
     template: str | None = None
+    mtime: float | None = None
+    size: int | None = None
+    body_offset: int = 0
+
+    def load_body(self) -> str:
+        """Return the Markdown body, reading it from disk if not held in memory."""
+        if self.body_markdown is not None:
+            return self.body_markdown
+        return read_source(self.source_path)[self.body_offset :]
+
+
+def read_source(path: Path) -> str:
+    """Read a content file as UTF-8 text with normalized newlines."""
+    return normalize_newlines(path.read_bytes().decode("utf-8"))
+
+
+def normalize_newlines(text: str) -> str:
+    """CRLF / CR -> LF (what text-mode reads did before)."""
+    return text.replace("\r\n", "\n").replace("\r", "\n")
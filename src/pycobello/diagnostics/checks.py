@@ -6,32 +6,61 @@ from pycobello.config.load import load_config
 from pycobello.errors import ConfigError
 
 
-def run_checks(project_root: str) -> None:
-    """Run all diagnostics; exit non-zero on any error."""
+def run_checks(
+    project_root: str,
+    jobs: int = 1,
+    html: bool = False,
+    external: bool = False,
+    external_ttl_hours: float = 24.0,
+) -> None:
+    """Run all diagnostics; exit non-zero on any error.
+
+    ``jobs`` > 1 parses changed files for links in a process pool (0 = one per CPU).
+    With ``html``, the built output is checked as well (links, anchors, assets);
+    with ``external``, its http(s) links are requested, reusing results that
+    passed within ``external_ttl_hours``.
+    """
     try:
         config = load_config(project_root)
     except ConfigError as e:
         _err(str(e))
         raise SystemExit(1) from e
 
-    root = Path(project_root).resolve()
-    content_dir = root / config.build.content_dir
-    errors: list[str] = []
-
-    from pycobello.diagnostics.frontmatter import check_required_frontmatter
-    from pycobello.diagnostics.links import check_internal_links
-    from pycobello.diagnostics.slugs import check_duplicate_urls
+    from pycobello.diagnostics.engine import run_diagnostics
 
-    errors.extend(check_duplicate_urls(content_dir, config))
-    errors.extend(check_required_frontmatter(content_dir, config))
-    errors.extend(check_internal_links(content_dir, config))
+    root = Path(project_root).resolve()
+    errors = run_diagnostics(root, config, jobs=jobs)
+    if html or external:
+        from pycobello.diagnostics.html import check_output, scan_output
 
+        output_dir = root / config.build.output_dir
+        if not output_dir.is_dir():
+            errors.append(f"{output_dir}: not found; run 'pycobello build' first.")
+        else:
+            scanned = scan_output(output_dir, jobs)
+            if html:
+                errors.extend(check_output(output_dir, config.site.base_url, scanned=scanned))
+            if external:
+                errors.extend(_check_external(root, config, scanned, external_ttl_hours))
     if errors:
         for e in errors:
             _err(e)
         raise SystemExit(1)
 
 
+def _check_external(root: Path, config, scanned, ttl_hours: float) -> list[str]:
+    from pycobello.build.cache import BuildCache
+    from pycobello.diagnostics.external import check_external_links
+
+    cache = BuildCache(root / ".pycobello" / "cache.db", root)
+    try:
+        return check_external_links(
+            scanned, cache, config.site.base_url, ttl_seconds=ttl_hours * 3600
+        )
+    finally:
+        cache.close()
+
+
 def _err(msg: str) -> None:
     import sys
 
@@ -0,0 +1,31 @@
+"""Diagnostics over one discovery, with link checks driven by the persistent link graph."""
+
+from pathlib import Path
+
+
+def run_diagnostics(root: Path, config, jobs: int = 1) -> list[str]:
+    """All checks; only changed files (and files linking to added/removed URLs) are re-examined."""
+    from pycobello.build.cache import BuildCache
+    from pycobello.build.linkgraph import LinkGraph
+    from pycobello.content.discovery import discover
+    from pycobello.content.index import HeaderIndex
+    from pycobello.diagnostics.frontmatter import check_required_frontmatter
+    from pycobello.diagnostics.slugs import check_duplicate_urls
+
+    content_dir = root / config.build.content_dir
+    coll_dict = {"posts": config.collections.posts, "pages": config.collections.pages}
+    cache = BuildCache(root / ".pycobello" / "cache.db", root)
+    try:
+        index = HeaderIndex(cache)
+        discovery = discover(content_dir, coll_dict, ignore=config.build.ignore, index=index)
+        index.save()
+
+        errors = check_duplicate_urls(content_dir, config, discovery.items)
+        errors.extend(check_required_frontmatter(content_dir, config, discovery))
+
+        graph = LinkGraph(cache)
+        graph.update(discovery.items, jobs)
+        errors.extend(graph.check(discovery.items))
+    finally:
+        cache.close()
+    return errors
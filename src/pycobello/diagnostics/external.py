@@ -0,0 +1,210 @@
+"""External link checking: asyncio HTTP/1.1 client with per-host limits and a TTL cache."""
+
+import asyncio
+import ssl
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from urllib.parse import urljoin, urlsplit
+
+USER_AGENT = "pycobello-linkcheck"
+MAX_REDIRECTS = 5
+DEFAULT_TTL_SECONDS = 24 * 3600
+
+
+@dataclass
+class LinkStatus:
+    """Outcome of checking one URL: final HTTP status, or the error that prevented one."""
+
+    url: str
+    status: int | None = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status is not None and self.status < 400
+
+    def describe(self) -> str:
+        return f"HTTP {self.status}" if self.status is not None else (self.error or "failed")
+
+
+@dataclass
+class _Host:
+    """Per-host concurrency limit and idle keep-alive connections."""
+
+    limit: asyncio.Semaphore
+    idle: list[tuple[asyncio.StreamReader, asyncio.StreamWriter]] = field(default_factory=list)
+
+
+class LinkChecker:
+    """Checks URLs concurrently: at most ``per_host`` requests per host at a time and
+    ``max_connections`` overall, reusing connections (HTTP/1.1 keep-alive).
+
+    ``HEAD`` is tried first and ``GET`` used when a server rejects it; redirects
+    are followed up to ``MAX_REDIRECTS``. Every request is bounded by ``timeout``.
+    """
+
+    def __init__(self, per_host: int = 4, max_connections: int = 32, timeout: float = 10.0) -> None:
+        self.per_host = per_host
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self._hosts: dict[tuple[str, str, int], _Host] = {}
+        self._ssl = ssl.create_default_context()
+        self.connections_opened = 0
+
+    async def check_all(self, urls: Iterable[str]) -> dict[str, LinkStatus]:
+        self._total = asyncio.Semaphore(self.max_connections)
+        unique = list(dict.fromkeys(urls))
+        try:
+            results = await asyncio.gather(*(self.check(url) for url in unique))
+        finally:
+            for host in self._hosts.values():
+                for _, writer in host.idle:
+                    writer.close()
+            self._hosts.clear()
+        return {r.url: r for r in results}
+
+    async def check(self, url: str) -> LinkStatus:
+        target = url
+        try:
+            for _ in range(MAX_REDIRECTS + 1):
+                status, location = await self._request("HEAD", target)
+                if status in (405, 501):
+                    status, location = await self._request("GET", target)
+                if 300 <= status < 400 and location:
+                    target = urljoin(target, location)
+                    continue
+                return LinkStatus(url, status)
+            return LinkStatus(url, error="too many redirects")
+        except (TimeoutError, OSError, EOFError, ValueError) as e:
+            return LinkStatus(url, error=f"{type(e).__name__}: {e}".rstrip(": "))
+
+    async def _request(self, method: str, url: str) -> tuple[int, str | None]:
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError(f"unsupported URL {url!r}")
+        port = parts.port or (443 if scheme == "https" else 80)
+        key = (scheme, parts.hostname, port)
+        host = self._hosts.get(key)
+        if host is None:
+            host = self._hosts[key] = _Host(asyncio.Semaphore(self.per_host))
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+        request = (
+            f"{method} {path} HTTP/1.1\r\nHost: {parts.netloc.rsplit('@', 1)[-1]}\r\n"
+            f"User-Agent: {USER_AGENT}\r\nAccept: */*\r\nConnection: keep-alive\r\n\r\n"
+        ).encode("latin-1")
+        async with host.limit, self._total:
+            return await asyncio.wait_for(
+                self._exchange(host, key, request, method), timeout=self.timeout
+            )
+
+    async def _exchange(
+        self, host: _Host, key: tuple[str, str, int], request: bytes, method: str
+    ) -> tuple[int, str | None]:
+        scheme, hostname, port = key
+        # A reused connection may have been closed by the server; retry once fresh.
+        for reused in (True, False):
+            if reused and not host.idle:
+                continue
+            if reused:
+                reader, writer = host.idle.pop()
+            else:
+                reader, writer = await asyncio.open_connection(
+                    hostname, port, ssl=self._ssl if scheme == "https" else None
+                )
+                self.connections_opened += 1
+            try:
+                writer.write(request)
+                await writer.drain()
+                status, headers = await _read_head(reader)
+            except (OSError, asyncio.IncompleteReadError, ValueError):
+                writer.close()
+                if reused:
+                    continue
+                raise
+            keep = method == "HEAD" and headers.get("connection", "").lower() != "close"
+            if keep:
+                host.idle.append((reader, writer))
+            else:
+                writer.close()
+            return status, headers.get("location")
+        raise OSError("connection failed")
+
+
+async def _read_head(reader: asyncio.StreamReader) -> tuple[int, dict[str, str]]:
+    """Status code and (lower-cased) headers of an HTTP/1.x response."""
+    line = await reader.readline()
+    if not line:
+        raise asyncio.IncompleteReadError(b"", None)
+    parts = line.decode("latin-1").split(None, 2)
+    if len(parts) < 2 or not parts[0].startswith("HTTP/"):
+        raise ValueError(f"bad status line {line!r}")
+    status = int(parts[1])
+    headers: dict[str, str] = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    return status, headers
+
+
+def check_urls(urls: Iterable[str], **options) -> dict[str, LinkStatus]:
+    """Check ``urls`` (see ``LinkChecker`` for ``options``); fragments are ignored."""
+    return asyncio.run(LinkChecker(**options).check_all(urls))
+
+
+def check_external_links(
+    scanned,
+    cache,
+    base_url: str = "",
+    ttl_seconds: float = DEFAULT_TTL_SECONDS,
+    **options,
+) -> list[str]:
+    """Errors for external links in the built pages of ``scanned`` (an ``OutputScan``).
+
+    Results are kept in the build cache's ``external_links`` table; a URL that
+    passed less than ``ttl_seconds`` ago is not requested again. Failures are
+    always re-checked.
+    """
+    site = urlsplit(base_url).netloc
+    uses: dict[str, list[tuple[str, int]]] = {}
+    for page, scan in scanned.pages.items():
+        for url, line in scan.refs:
+            parts = urlsplit(url)
+            if parts.scheme.lower() in ("http", "https") and parts.netloc != site:
+                uses.setdefault(parts._replace(fragment="").geturl(), []).append((page, line))
+
+    table = cache["external_links"]
+    now = time.time()
+    results: dict[str, LinkStatus] = {}
+    stale: list[str] = []
+    for url in uses:
+        row = table.get(url)
+        if row and row.get("status", 999) < 400 and now - row.get("checked_at", 0) < ttl_seconds:
+            results[url] = LinkStatus(url, row["status"])
+        else:
+            stale.append(url)
+    fresh = check_urls(stale, **options) if stale else {}
+    results.update(fresh)
+    rows = {
+        url: {"status": r.status, "error": r.error, "checked_at": now} for url, r in fresh.items()
+    }
+    with cache.conn:
+        table.upsert(rows)
+        table.delete([url for url in table if url not in uses])
+
+    errors: list[str] = []
+    for url, places in uses.items():
+        result = results[url]
+        if not result.ok:
+            for page, line in places:
+                errors.append(
+                    f"{scanned.output_dir / page}:{line}: External link {url} failed: "
+                    f"{result.describe()}"
+                )
+    return errors
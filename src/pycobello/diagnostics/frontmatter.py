@@ -2,30 +2,37 @@
 
 from pathlib import Path
 
-from pycobello.content.frontmatter import parse_frontmatter
-from pycobello.errors import FrontMatterError
+from pycobello.content.discovery import Discovery, discover
 
 
-def check_required_frontmatter(content_dir: Path, config) -> list[str]:
-    """Check posts have title and date. Return list of error messages."""
+def check_required_frontmatter(
+    content_dir: Path,
+    config,
+    discovery: Discovery | None = None,
+) -> list[str]:
+    """Check posts have title and date. Return list of error messages.
+
+    Unparseable front matter found by ``discovery`` is reported here as well.
+    """
     errors: list[str] = []
-    posts_dir = content_dir / config.collections.posts.path
-    if not posts_dir.is_dir():
-        return errors
-    for path in posts_dir.rglob("*.md"):
-        if any(p in path.parts for p in (config.build.ignore or [])):
-            continue
-        try:
-            raw = path.read_text()
-        except OSError:
-            continue
-        try:
-            fm, _ = parse_frontmatter(raw)
-        except FrontMatterError as e:
-            errors.append(f"{path}: Invalid front matter: {e}")
+    if discovery is None:
+        posts_dir = content_dir / config.collections.posts.path
+        if not posts_dir.is_dir():
+            return errors
+        discovery = discover(
+            content_dir,
+            {"posts": config.collections.posts},
+            ignore=config.build.ignore,
+        )
+    # Not specific to posts: report these even when there is no posts directory.
+    for path, message in discovery.errors:
+        errors.append(f"{path}: Invalid front matter: {message}")
+    for item in discovery.items:
+        if item.kind.value != "post":
             continue
+        fm = item.front_matter
         if not fm.get("title"):
-            errors.append(f"{path}: Post missing required 'title' in front matter.")
+            errors.append(f"{item.source_path}: Post missing required 'title' in front matter.")
         if not fm.get("date"):
-            errors.append(f"{path}: Post missing required 'date' in front matter.")
+            errors.append(f"{item.source_path}: Post missing required 'date' in front matter.")
     return errors
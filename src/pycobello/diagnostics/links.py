@@ -4,32 +4,63 @@ from pathlib import Path
 
 from pycobello.content.discovery import discover_items
 from pycobello.content.markdown import get_tokens
+from pycobello.content.model import ContentItem
 
 
-def check_internal_links(content_dir: Path, config) -> list[str]:
+def check_internal_links(
+    content_dir: Path,
+    config,
+    items: list[ContentItem] | None = None,
+) -> list[str]:
     """Extract link hrefs from markdown; resolve .md/extensionless to known URLs; report broken."""
-    coll_dict = {"posts": config.collections.posts, "pages": config.collections.pages}
-    items = discover_items(content_dir, coll_dict, ignore=config.build.ignore)
-    known_urls: set[str] = set()
-    for item in items:
-        known_urls.add(item.url_path.rstrip("/") or "/")
-        known_urls.add(item.url_path)
+    if items is None:
+        coll_dict = {"posts": config.collections.posts, "pages": config.collections.pages}
+        items = discover_items(content_dir, coll_dict, ignore=config.build.ignore)
+    known = known_urls(items)
     errors: list[str] = []
     for item in items:
-        tokens = get_tokens(item.body_markdown)
-        for t in _iter_links(tokens):
-            href = getattr(t, "attrGet", lambda _: None)("href") or ""
-            if not href or href.startswith(("#", "http://", "https://", "mailto:")):
-                continue
-            if href.startswith("/"):
-                target = href.rstrip("/") or "/"
-            else:
-                target = _resolve_relative(href, item.url_path)
-            if target and target not in known_urls and not target.startswith("http"):
-                errors.append(f"{item.source_path}: Broken internal link to {href}")
+        links = extract_links(item.load_body(), item.url_path)
+        errors.extend(broken_link_errors(item.source_path, broken_links(links, known)))
     return errors
 
 
+def known_urls(items: list[ContentItem]) -> set[str]:
+    """Every URL an internal link may resolve to (with and without trailing slash)."""
+    urls: set[str] = set()
+    for item in items:
+        urls.add(item.url_path.rstrip("/") or "/")
+        urls.add(item.url_path)
+    return urls
+
+
+def extract_links(body: str, url_path: str, store=None) -> list[list[str]]:
+    """[href, resolved target] for each internal link in a Markdown body.
+
+    ``store`` (a fragment store) also receives the body's HTML from the same parse.
+    """
+    links: list[list[str]] = []
+    for t in _iter_links(get_tokens(body, store)):
+        href = getattr(t, "attrGet", lambda _: None)("href") or ""
+        if not href or href.startswith(("#", "http://", "https://", "mailto:")):
+            continue
+        if href.startswith("/"):
+            target = href.rstrip("/") or "/"
+        else:
+            target = _resolve_relative(href, url_path)
+        if target and not target.startswith("http"):
+            links.append([href, target])
+    return links
+
+
+def broken_links(links: list[list[str]], known: set[str]) -> list[str]:
+    """Hrefs of ``links`` whose target is not a known URL."""
+    return [href for href, target in links if target not in known]
+
+
+def broken_link_errors(source: Path | str, hrefs: list[str]) -> list[str]:
+    return [f"{source}: Broken internal link to {href}" for href in hrefs]
+
+
 def _iter_links(tokens):
     """Yield link_open tokens (use attrGet('href'))."""
     for t in tokens:
@@ -3,12 +3,18 @@
 from pathlib import Path
 
 from pycobello.content.discovery import discover_items
+from pycobello.content.model import ContentItem
 
 
-def check_duplicate_urls(content_dir: Path, config) -> list[str]:
+def check_duplicate_urls(
+    content_dir: Path,
+    config,
+    items: list[ContentItem] | None = None,
+) -> list[str]:
     """Return list of error messages for duplicate url_path."""
-    coll_dict = {"posts": config.collections.posts, "pages": config.collections.pages}
-    items = discover_items(content_dir, coll_dict, ignore=config.build.ignore)
+    if items is None:
+        coll_dict = {"posts": config.collections.posts, "pages": config.collections.pages}
+        items = discover_items(content_dir, coll_dict, ignore=config.build.ignore)
     seen: dict[str, str] = {}
     errors: list[str] = []
     for item in items:
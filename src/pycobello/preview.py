@@ -1,19 +1,44 @@
 """Preview server and optional watch. Step 8."""
 
+import hashlib
 import http.server
-import socketserver
+import mimetypes
+import os
+import posixpath
+import shutil
 import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from email.utils import formatdate, parsedate_to_datetime
+from html import escape
 from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+SMALL_FILE_BYTES = 1024 * 1024
+MEMORY_CACHE_BYTES = 64 * 1024 * 1024
 
 
 def serve_preview(
     project_root: str,
     port: int = 8000,
     watch: bool = False,
+    live: bool = False,
 ) -> None:
-    """Serve dist/ with stdlib http.server; optionally watch and rebuild."""
+    """Serve dist/ with stdlib http.server; optionally watch and rebuild.
+
+    With ``live``, pages are rendered in memory on request instead of being built
+    into dist/, and each file change invalidates only the pages it affects.
+    """
     root = Path(project_root).resolve()
     dist = root / "dist"
+    if live:
+        try:
+            import watchfiles  # noqa: F401
+        except ImportError:
+            print("Install watch support: pip install pycobello[watch]")
+            raise SystemExit(1) from None
+        _run_live(root, port)
+        return
     if not dist.is_dir():
         print("Run 'pycobello build' first.")
         raise SystemExit(1)
@@ -29,16 +54,238 @@ def serve_preview(
         _serve(dist, port)
 
 
-def _serve(dist: Path, port: int) -> None:
-    class Handler(http.server.SimpleHTTPRequestHandler):
-        def __init__(self, *a, **k):
-            super().__init__(*a, directory=str(dist), **k)
+@dataclass
+class CachedFile:
+    """A servable file: body is held in memory only for small files."""
+
+    path: Path
+    mtime: float
+    size: int
+    etag: str
+    body: bytes | None = None
+
+
+class FileCache:
+    """Small files kept in memory (LRU by total bytes), revalidated by stat on each hit."""
+
+    def __init__(
+        self,
+        max_file_bytes: int = SMALL_FILE_BYTES,
+        max_total_bytes: int = MEMORY_CACHE_BYTES,
+    ) -> None:
+        self.max_file_bytes = max_file_bytes
+        self.max_total_bytes = max_total_bytes
+        self._files: OrderedDict[Path, tuple[int, CachedFile]] = OrderedDict()
+        self._total = 0
+        self._lock = threading.Lock()
+
+    def get(self, path: Path) -> CachedFile | None:
+        """Return the entry for path (body loaded if small), revalidated by stat.
+
+        The ETag of a small file is the hash of the body read, taken with its stat
+        from the same open file, so a rebuild rewriting the file meanwhile cannot
+        pair an old hash with new content. Large files get a weak stat-based ETag.
+        """
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        with self._lock:
+            hit = self._files.get(path)
+            if hit is not None and hit[0] == st.st_mtime_ns and hit[1].size == st.st_size:
+                self._files.move_to_end(path)
+                return hit[1]
+        if st.st_size > self.max_file_bytes:
+            etag = f"W/{st.st_mtime_ns:x}-{st.st_size:x}"
+            return CachedFile(path, st.st_mtime, st.st_size, _quote_etag(etag))
+        try:
+            with open(path, "rb") as fh:
+                st = os.fstat(fh.fileno())
+                body = fh.read()
+        except OSError:
+            return None
+        etag = hashlib.sha256(body).hexdigest()
+        entry = CachedFile(path, st.st_mtime, len(body), _quote_etag(etag), body)
+        with self._lock:
+            old = self._files.pop(path, None)
+            if old is not None:
+                self._total -= old[1].size
+            self._files[path] = (st.st_mtime_ns, entry)
+            self._total += entry.size
+            while self._total > self.max_total_bytes and self._files:
+                _, (_, evicted) = self._files.popitem(last=False)
+                self._total -= evicted.size
+        return entry
+
+
+def _quote_etag(tag: str) -> str:
+    if tag.startswith("W/"):
+        return f'W/"{tag[2:]}"'
+    return f'"{tag}"'
+
+
+class _CachingHandler(http.server.BaseHTTPRequestHandler):
+    """Common response logic: ETag / Last-Modified, 304s, keep-alive."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        self._respond(send_body=True)
+
+    def do_HEAD(self) -> None:
+        self._respond(send_body=False)
+
+    def _respond(self, send_body: bool) -> None:
+        raise NotImplementedError
 
-    with socketserver.TCPServer(("", port), Handler) as httpd:
+    def _not_modified(self, etag: str, mtime: float | None) -> bool:
+        inm = self.headers.get("If-None-Match")
+        if inm is not None:
+            tags = [t.strip() for t in inm.split(",")]
+            return "*" in tags or etag in tags or etag.removeprefix("W/") in tags
+        ims = self.headers.get("If-Modified-Since")
+        if ims is not None and mtime is not None:
+            try:
+                return int(mtime) <= parsedate_to_datetime(ims).timestamp()
+            except (TypeError, ValueError):
+                return False
+        return False
+
+    def _send_cached(self, f: CachedFile, send_body: bool) -> None:
+        ctype = mimetypes.guess_type(f.path.name)[0] or "application/octet-stream"
+        if ctype.startswith("text/") or ctype in ("application/javascript", "application/json"):
+            ctype += "; charset=utf-8"
+        if self._not_modified(f.etag, f.mtime):
+            self._send_status(304, f.etag, f.mtime)
+            return
+        self._send_status(200, f.etag, f.mtime, ctype, f.size)
+        if not send_body:
+            return
+        if f.body is not None:
+            self.wfile.write(f.body)
+        else:
+            with open(f.path, "rb") as fh:
+                shutil.copyfileobj(fh, self.wfile)
+
+    def _send_bytes(self, status: int, body: bytes, ctype: str, send_body: bool) -> None:
+        self._send_status(status, None, None, ctype, len(body))
+        if send_body:
+            self.wfile.write(body)
+
+    def _send_status(
+        self,
+        status: int,
+        etag: str | None,
+        mtime: float | None,
+        ctype: str | None = None,
+        length: int = 0,
+    ) -> None:
+        self.send_response(status)
+        if etag is not None:
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+        if mtime is not None:
+            self.send_header("Last-Modified", formatdate(mtime, usegmt=True))
+        if status != 304:
+            if ctype is not None:
+                self.send_header("Content-Type", ctype)
+            self.send_header("Content-Length", str(length))
+        self.end_headers()
+
+
+def _dist_handler(dist: Path, files: FileCache) -> type:
+    """Handler serving dist/ with content-hash ETags and an in-memory small-file cache."""
+
+    class Handler(_CachingHandler):
+        def _respond(self, send_body: bool) -> None:
+            url_path = urlsplit(self.path).path
+            rel = posixpath.normpath(unquote(url_path)).lstrip("/")
+            if rel in (".", ""):
+                rel = ""
+            if rel.startswith("..") or "\0" in rel:
+                self._send_bytes(404, b"Not found", "text/plain", send_body)
+                return
+            target = dist / rel
+            if target.is_dir():
+                if not url_path.endswith("/"):
+                    self.send_response(301)
+                    self.send_header("Location", url_path + "/")
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                target = target / "index.html"
+                rel = posixpath.join(rel, "index.html") if rel else "index.html"
+            f = files.get(target)
+            if f is None:
+                self._send_bytes(404, b"Not found", "text/plain", send_body)
+                return
+            self._send_cached(f, send_body)
+
+    return Handler
+
+
+def _make_server(port: int, handler: type) -> http.server.ThreadingHTTPServer:
+    server = http.server.ThreadingHTTPServer(("", port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def _serve(dist: Path, port: int) -> None:
+    with _make_server(port, _dist_handler(dist, FileCache())) as httpd:
         print(f"Serving {dist} at http://127.0.0.1:{port}/")
         httpd.serve_forever()
 
 
+def _live_handler(site, files: FileCache) -> type:
+    """Handler that serves LiveSite pages and static files with ETags."""
+
+    class Handler(_CachingHandler):
+        def _respond(self, send_body: bool) -> None:
+            try:
+                page = site.page(self.path)
+            except Exception as e:
+                body = f"<pre>{escape(str(e))}</pre>".encode()
+                self._send_bytes(500, body, "text/html; charset=utf-8", send_body)
+                return
+            if page is not None:
+                etag = f'"{page.etag}"'
+                if self._not_modified(etag, None):
+                    self._send_status(304, etag, None)
+                    return
+                self._send_status(200, etag, None, "text/html; charset=utf-8", len(page.content))
+                if send_body:
+                    self.wfile.write(page.content)
+                return
+            static = site.static_file(self.path)
+            f = files.get(static) if static is not None else None
+            if f is None:
+                self._send_bytes(404, b"Not found", "text/plain", send_body)
+                return
+            self._send_cached(f, send_body)
+
+    return Handler
+
+
+def _run_live(root: Path, port: int) -> None:
+    from watchfiles import watch
+
+    from pycobello.build.live import LiveSite
+
+    site = LiveSite(root)
+    for err in site.errors:
+        print(err)
+    httpd = _make_server(port, _live_handler(site, FileCache()))
+    server_thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    server_thread.start()
+    print(f"Serving {root} (live, in-memory) at http://127.0.0.1:{port}/")
+    watch_dirs = [p for p in (site.content_dir, site.theme_dir, *site.static_dirs) if p.is_dir()]
+    for changes in watch(*watch_dirs, site.config_path):
+        dropped = site.apply_changes(path for _, path in changes)
+        print(f"Change: {len(changes)} file(s), {dropped} page(s) invalidated")
+        for err in site.errors:
+            print(err)
+
+
 def _run_with_watch(root: Path, dist: Path, port: int) -> None:
     from watchfiles import watch
 
@@ -0,0 +1,181 @@
+"""Lazy collection context: items and their fields are computed on access."""
+
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from datetime import date
+
+from pycobello.content.model import ContentItem
+
+ITEM_FIELDS = ("title", "slug", "url_path", "date", "content", "front_matter")
+
+
+class CollectionAccess:
+    """Records how much of the collections a render touched.
+
+    ``level`` is 0 (not used), 1 (item metadata) or 2 (some item's rendered content).
+    """
+
+    def __init__(self) -> None:
+        self.level = 0
+
+    def touch(self, level: int) -> None:
+        if level > self.level:
+            self.level = level
+
+
+class LazyItem(Mapping):
+    """Template view of a ContentItem. ``content`` is rendered only when read.
+
+    Views compare (and hash) by source path, so ``item in collections.posts``
+    never renders a body.
+    """
+
+    __slots__ = ("_item", "_html_for", "_access")
+
+    def __init__(
+        self,
+        item: ContentItem,
+        html_for: Callable[[ContentItem], str],
+        access: CollectionAccess | None = None,
+    ) -> None:
+        self._item = item
+        self._html_for = html_for
+        self._access = access
+
+    def __getitem__(self, key: str):
+        item = self._item
+        if key == "content":
+            if self._access is not None:
+                self._access.touch(2)
+            return self._html_for(item)
+        if key == "title":
+            return item.front_matter.get("title", "")
+        if key in ("slug", "url_path", "date", "front_matter"):
+            return getattr(item, key)
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(ITEM_FIELDS)
+
+    def __len__(self) -> int:
+        return len(ITEM_FIELDS)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, LazyItem):
+            return NotImplemented
+        return self._item.source_path == other._item.source_path
+
+    def __hash__(self) -> int:
+        return hash(self._item.source_path)
+
+    def __repr__(self) -> str:
+        return f"LazyItem({self._item.url_path!r})"
+
+
+class LazyCollection(Sequence):
+    """Read-only, sliceable view over sorted ContentItems.
+
+    Slices and pages are views too; no LazyItem is created until an element is read.
+    """
+
+    def __init__(
+        self,
+        items: Sequence[ContentItem],
+        html_for: Callable[[ContentItem], str],
+        access: CollectionAccess | None = None,
+        start: int = 0,
+        stop: int | None = None,
+    ) -> None:
+        self._items = items
+        self._html_for = html_for
+        self._access = access
+        self._start = start
+        self._stop = len(items) if stop is None else stop
+
+    def __len__(self) -> int:
+        return max(0, self._stop - self._start)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            return LazyCollection(
+                self._items,
+                self._html_for,
+                self._access,
+                self._start + start,
+                self._start + max(start, stop),
+            )
+        n = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError(index)
+        return LazyItem(self._items[self._start + index], self._html_for, self._access)
+
+    def __iter__(self) -> Iterator[LazyItem]:
+        for i in range(self._start, self._stop):
+            yield LazyItem(self._items[i], self._html_for, self._access)
+
+    def __add__(self, other) -> list:
+        """``collections.posts + collections.pages`` concatenates, as plain lists did."""
+        if not isinstance(other, (LazyCollection, list)):
+            return NotImplemented
+        return [*self, *other]
+
+    def __radd__(self, other) -> list:
+        if not isinstance(other, list):
+            return NotImplemented
+        return [*other, *self]
+
+    def page_count(self, per_page: int) -> int:
+        """Number of pages of ``per_page`` items (at least 1)."""
+        if per_page <= 0:
+            return 1
+        return max(1, -(-len(self) // per_page))
+
+    def page(self, number: int, per_page: int) -> "LazyCollection":
+        """Items on 1-based page ``number``; empty view if out of range."""
+        if per_page <= 0:
+            return self[:]
+        if number < 1:
+            return self[0:0]
+        start = (number - 1) * per_page
+        return self[start : start + per_page]
+
+
+class CollectionsView(Mapping):
+    """``collections`` template global: name -> LazyCollection, with access tracking."""
+
+    def __init__(
+        self,
+        collections: Mapping[str, Sequence[ContentItem]],
+        html_for: Callable[[ContentItem], str],
+    ) -> None:
+        self.access = CollectionAccess()
+        self.html_for = html_for
+        self._collections = {
+            name: LazyCollection(items, html_for, self.access)
+            for name, items in collections.items()
+        }
+
+    def __getitem__(self, name: str) -> LazyCollection:
+        coll = self._collections[name]
+        self.access.touch(1)
+        return coll
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._collections)
+
+    def __len__(self) -> int:
+        return len(self._collections)
+
+
+def group_items(items: Iterable[ContentItem]) -> dict[str, list[ContentItem]]:
+    """Split items into collections: posts newest first, pages in discovery order."""
+    posts: list[ContentItem] = []
+    pages: list[ContentItem] = []
+    for item in items:
+        (posts if item.kind.value == "post" else pages).append(item)
+    posts.sort(key=lambda x: x.date or date.min, reverse=True)
+    return {"posts": posts, "pages": pages}
@@ -6,11 +6,29 @@ def build_context(
     collections: dict,
     page: dict | None = None,
     post: dict | None = None,
+    paginator: dict | None = None,
+    taxonomy: dict | None = None,
+    backlinks: list[dict] | None = None,
 ) -> dict:
-    """Context for Jinja: site, collections, current page/post."""
+    """Context for Jinja: site, collections, current page/post or listing page."""
     ctx: dict = {"site": site, "collections": collections}
     if page is not None:
         ctx["page"] = page
     if post is not None:
         ctx["post"] = post
+    if paginator is not None:
+        ctx["paginator"] = paginator
+    if taxonomy is not None:
+        ctx["taxonomy"] = taxonomy
+    if backlinks is not None:
+        ctx["backlinks"] = backlinks
     return ctx
+
+
+def site_context(config) -> dict:
+    """The ``site`` template variable from settings."""
+    return {
+        "title": config.site.title,
+        "base_url": config.site.base_url,
+        "author": config.site.author,
+    }
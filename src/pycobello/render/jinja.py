@@ -1,14 +1,71 @@
 """Jinja env and template rendering. Step 5."""
 
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import UTC, datetime
 from pathlib import Path
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import Environment, FileSystemLoader, Template, TemplateNotFound, select_autoescape
 
 
-def create_env(templates_dir: Path, site: dict, collections: dict) -> Environment:
+class TrackingEnvironment(Environment):
+    """Environment that records which templates are loaded while rendering.
+
+    Covers the render entry point as well as ``extends``, ``include``, ``import``
+    and ``from ... import`` (all of which go through ``get_template`` /
+    ``select_template``), even when the compiled template is already cached.
+    Names looked up but not found (``include ... ignore missing``, earlier
+    ``select_template`` candidates) are recorded too: creating one later must
+    invalidate the render.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._recorders: list[set[str]] = []
+
+    @contextmanager
+    def record_loads(self) -> Iterator[set[str]]:
+        """Collect names of templates loaded inside the block."""
+        loaded: set[str] = set()
+        self._recorders.append(loaded)
+        try:
+            yield loaded
+        finally:
+            self._recorders.remove(loaded)
+
+    def get_template(self, name, parent=None, globals=None) -> Template:
+        try:
+            t = super().get_template(name, parent, globals)
+        except TemplateNotFound as e:
+            self._note(*e.templates)
+            raise
+        self._note(t.name)
+        return t
+
+    def select_template(self, names, parent=None, globals=None) -> Template:
+        try:
+            t = super().select_template(names, parent, globals)
+        except TemplateNotFound as e:
+            self._note(*e.templates)
+            raise
+        tried = []
+        for name in names:
+            if not isinstance(name, str) or name == t.name:
+                break
+            tried.append(name)
+        self._note(*tried, t.name)
+        return t
+
+    def _note(self, *names) -> None:
+        for name in names:
+            if isinstance(name, str):
+                for loaded in self._recorders:
+                    loaded.add(name)
+
+
+def create_env(templates_dir: Path, site: dict, collections: dict) -> TrackingEnvironment:
     """Create Jinja environment with globals and filters."""
-    env = Environment(
+    env = TrackingEnvironment(
         loader=FileSystemLoader(str(templates_dir)),
         autoescape=select_autoescape(("html", "htm")),
     )
@@ -51,7 +108,16 @@ def render_template(
     env: Environment,
     template_name: str,
     context: dict,
+    loaded: set[str] | None = None,
 ) -> str:
-    """Render a template with context."""
-    t = env.get_template(template_name)
-    return t.render(**context)
+    """Render a template with context.
+
+    If ``loaded`` is given (and env is a TrackingEnvironment), the names of all
+    templates used by the render are added to it.
+    """
+    if loaded is None or not isinstance(env, TrackingEnvironment):
+        return env.get_template(template_name).render(**context)
+    with env.record_loads() as names:
+        content = env.get_template(template_name).render(**context)
+    loaded.update(names)
+    return content
@@ -0,0 +1,102 @@
+"""Paginated listings: the index, collection archives (``/blog/page/N/``) and term pages."""
+
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+from pycobello.content.model import ContentItem
+from pycobello.render.collections import LazyCollection
+from pycobello.render.routing import output_path_for_item
+from pycobello.render.taxonomy import Term, term_url
+
+
+@dataclass
+class ListingPage:
+    """One page of a listing: its template, URL and the slice of items it shows."""
+
+    template: str
+    collection: str
+    base_url: str
+    number: int
+    total: int
+    items: Sequence[ContentItem]
+    term: Term | None = None
+
+    @property
+    def url_path(self) -> str:
+        return page_url(self.base_url, self.number)
+
+
+def page_url(base_url: str, number: int) -> str:
+    """URL of page ``number``: the base URL for page 1, then ``{base}page/N/``."""
+    if number <= 1:
+        return base_url
+    return f"{base_url}page/{number}/"
+
+
+def paginate(
+    items: Sequence[ContentItem],
+    per_page: int,
+    template: str,
+    base_url: str,
+    collection: str,
+    term: Term | None = None,
+) -> list[ListingPage]:
+    """Split items into listing pages (one page with everything if ``per_page`` <= 0)."""
+    if per_page <= 0 or not items:
+        chunks = [items]
+    else:
+        chunks = [items[i : i + per_page] for i in range(0, len(items), per_page)]
+    return [
+        ListingPage(template, collection, base_url, n, len(chunks), chunk, term)
+        for n, chunk in enumerate(chunks, 1)
+    ]
+
+
+def listing_pages(
+    config,
+    grouped: dict[str, Sequence[ContentItem]],
+    taxonomies: dict[str, dict[str, Term]] | None = None,
+) -> list[ListingPage]:
+    """Every listing page the config asks for.
+
+    The index is paginated when ``collections.posts.per_page`` is set; each
+    collection with an ``archive_template`` gets archive pages under its prefix;
+    each term of an indexed taxonomy gets pages at ``/<url_prefix>/<term>/``.
+    """
+    pages: list[ListingPage] = []
+    posts = config.collections.posts
+    if posts.per_page > 0:
+        pages += paginate(grouped["posts"], posts.per_page, "index.html", "/", "posts")
+    for name in ("posts", "pages"):
+        coll = getattr(config.collections, name)
+        if coll.archive_template:
+            base_url = f"/{coll.url_prefix.strip('/')}/"
+            pages += paginate(grouped[name], coll.per_page, coll.archive_template, base_url, name)
+    for tax in config.taxonomies:
+        for term in (taxonomies or {}).get(tax.name, {}).values():
+            base_url = term_url(tax.url_prefix, term.slug)
+            pages += paginate(term.items, tax.per_page, tax.template, base_url, tax.name, term)
+    return pages
+
+
+def listing_output_path(output_dir: Path, url_path: str, clean_urls: bool = True) -> Path:
+    """Output file for a listing URL; ``/`` is the site's ``index.html``."""
+    if url_path.strip("/") == "":
+        return output_dir / "index.html"
+    return output_path_for_item(output_dir, url_path, clean_urls=clean_urls)
+
+
+def paginator_ctx(page: ListingPage, html_for: Callable[[ContentItem], str]) -> dict:
+    """The ``paginator`` template variable for a listing page."""
+    return {
+        "entries": LazyCollection(page.items, html_for),
+        "collection": page.collection,
+        "term": page.term.name if page.term is not None else None,
+        "number": page.number,
+        "total": page.total,
+        "prev_url": page_url(page.base_url, page.number - 1) if page.number > 1 else None,
+        "next_url": (
+            page_url(page.base_url, page.number + 1) if page.number < page.total else None
+        ),
+    }
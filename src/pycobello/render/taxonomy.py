@@ -0,0 +1,99 @@
+"""Taxonomies (tags, categories): inverted indexes and their term / term-list pages."""
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+
+from slugify import slugify
+
+from pycobello.content.model import ContentItem
+
+
+@dataclass
+class Term:
+    """One term of a taxonomy and the items that carry it, in listing order."""
+
+    name: str
+    slug: str
+    items: list[ContentItem] = field(default_factory=list)
+
+
+@dataclass
+class TermListPage:
+    """The page listing every term of a taxonomy (``/tags/``)."""
+
+    template: str
+    taxonomy: str
+    url_path: str
+    terms: Sequence[Term]
+
+
+def item_terms(item: ContentItem, field_name: str) -> list[str]:
+    """Term names from a front matter field (a string or a list of strings)."""
+    value = item.front_matter.get(field_name)
+    if value is None:
+        return []
+    if isinstance(value, list | tuple):
+        return [str(v).strip() for v in value if v is not None and str(v).strip()]
+    value = str(value).strip()
+    return [value] if value else []
+
+
+def build_index(items: Iterable[ContentItem], field_name: str) -> dict[str, Term]:
+    """Term slug -> Term in one pass over items; item order is preserved per term.
+
+    Terms whose names slugify alike are merged under the first name seen.
+    """
+    index: dict[str, Term] = {}
+    for item in items:
+        seen: set[str] = set()
+        for name in item_terms(item, field_name):
+            slug = slugify(name, lowercase=True)
+            if not slug or slug in seen:
+                continue
+            seen.add(slug)
+            term = index.get(slug)
+            if term is None:
+                term = index[slug] = Term(name=name, slug=slug)
+            term.items.append(item)
+    return dict(sorted(index.items()))
+
+
+def build_taxonomies(config, grouped: dict[str, Sequence[ContentItem]]) -> dict[str, dict]:
+    """Index every configured taxonomy over posts (newest first), then pages."""
+    ordered = [*grouped["posts"], *grouped["pages"]]
+    return {tax.name: build_index(ordered, tax.field or tax.name) for tax in config.taxonomies}
+
+
+def term_url(url_prefix: str, slug: str) -> str:
+    return f"/{url_prefix.strip('/')}/{slug}/"
+
+
+def term_list_pages(config, indexes: dict[str, dict[str, Term]]) -> list[TermListPage]:
+    """One term-list page per taxonomy that has a ``list_template``."""
+    return [
+        TermListPage(
+            template=tax.list_template,
+            taxonomy=tax.name,
+            url_path=f"/{tax.url_prefix.strip('/')}/",
+            terms=list(indexes[tax.name].values()),
+        )
+        for tax in config.taxonomies
+        if tax.list_template
+    ]
+
+
+def taxonomy_ctx(page: TermListPage) -> dict:
+    """The ``taxonomy`` template variable for a term-list page."""
+    prefix = page.url_path
+    return {
+        "name": page.taxonomy,
+        "terms": [
+            {
+                "name": t.name,
+                "slug": t.slug,
+                "url_path": term_url(prefix, t.slug),
+                "count": len(t.items),
+            }
+            for t in page.terms
+        ],
+    }
@@ -65,12 +65,19 @@ build:
   output_dir: dist
   clean_urls: true
   ignore: []
+  markdown_cache_mb: 256
+  asset_hardlinks: false
+  atomic_output: false
+  fsync: false
+  hash: auto
 
 collections:
   posts:
     path: posts
     url_prefix: blog
     template: post.html
+    per_page: 0
+    archive_template: ""
   pages:
     path: pages
     url_prefix: ""
@@ -78,6 +85,15 @@ collections:
 
 plugins:
   enabled: []
+
+# e.g. - tags   (front matter "tags: [a, b]" -> /tags/ and /tags/<term>/)
+taxonomies: []
+
+# Client-side search index in dist/<output_dir>/ (queried by static/search.js)
+search:
+  enabled: false
+  output_dir: search
+  prefix_length: 2
 """,
         encoding="utf-8",
     )
@@ -126,6 +142,20 @@ def _write_theme(root: Path) -> None:
         )
         print(f"Created {base}")
 
+    style = theme / "static" / "style.css"
+    if not style.exists():
+        style.write_text(
+            "body { max-width: 42rem; margin: 2rem auto; padding: 0 1rem; "
+            "font-family: system-ui, sans-serif; line-height: 1.6; }\n",
+            encoding="utf-8",
+        )
+        print(f"Created {style}")
+
+    search_js = theme / "static" / "search.js"
+    if not search_js.exists():
+        search_js.write_text(SEARCH_JS, encoding="utf-8")
+        print(f"Created {search_js}")
+
     page = theme / "templates" / "page.html"
     if not page.exists():
         page.write_text(
@@ -152,6 +182,14 @@ def _write_theme(root: Path) -> None:
   <h1>{{ post.title }}</h1>
   <time>{{ post.date | datefmt }}</time>
   {{ post.content | safe }}
+  {% if backlinks %}
+  <aside>
+    <h2>Linked from</h2>
+    <ul>
+      {% for link in backlinks %}<li><a href="{{ link.url_path }}">{{ link.title }}</a></li>{% endfor %}
+    </ul>
+  </aside>
+  {% endif %}
 </article>
 {% endblock %}
 """,
@@ -167,16 +205,151 @@ def _write_theme(root: Path) -> None:
 {% block body %}
 <header><h1>{{ site.title }}</h1></header>
 <ul>
-  {% for post in collections.posts %}
+  {% for post in (paginator.entries if paginator is defined else collections.posts) %}
   <li><a href="{{ url_for(post.url_path) }}">{{ post.title }}</a> — {{ post.date | datefmt }}</li>
   {% endfor %}
 </ul>
+{% if paginator is defined and paginator.total > 1 %}
+<nav>
+  {% if paginator.prev_url %}<a href="{{ url_for(paginator.prev_url) }}">Newer</a>{% endif %}
+  Page {{ paginator.number }} of {{ paginator.total }}
+  {% if paginator.next_url %}<a href="{{ url_for(paginator.next_url) }}">Older</a>{% endif %}
+</nav>
+{% endif %}
 {% endblock %}
 """,
             encoding="utf-8",
         )
         print(f"Created {index}")
 
+    archive = theme / "templates" / "archive.html"
+    if not archive.exists():
+        archive.write_text(
+            """{% extends "base.html" %}
+{% block title %}Archive | {{ site.title }}{% endblock %}
+{% block body %}
+<h1>Archive</h1>
+<ul>
+  {% for item in paginator.entries %}
+  <li><a href="{{ url_for(item.url_path) }}">{{ item.title }}</a> {{ item.date | datefmt }}</li>
+  {% endfor %}
+</ul>
+{% if paginator.total > 1 %}
+<nav>
+  {% if paginator.prev_url %}<a href="{{ url_for(paginator.prev_url) }}">Newer</a>{% endif %}
+  Page {{ paginator.number }} of {{ paginator.total }}
+  {% if paginator.next_url %}<a href="{{ url_for(paginator.next_url) }}">Older</a>{% endif %}
+</nav>
+{% endif %}
+{% endblock %}
+""",
+            encoding="utf-8",
+        )
+        print(f"Created {archive}")
+
+    term = theme / "templates" / "term.html"
+    if not term.exists():
+        term.write_text(
+            """{% extends "base.html" %}
+{% block title %}{{ paginator.term }} | {{ site.title }}{% endblock %}
+{% block body %}
+<h1>{{ paginator.term }}</h1>
+<ul>
+  {% for item in paginator.entries %}
+  <li><a href="{{ url_for(item.url_path) }}">{{ item.title }}</a> {{ item.date | datefmt }}</li>
+  {% endfor %}
+</ul>
+{% if paginator.total > 1 %}
+<nav>
+  {% if paginator.prev_url %}<a href="{{ url_for(paginator.prev_url) }}">Newer</a>{% endif %}
+  Page {{ paginator.number }} of {{ paginator.total }}
+  {% if paginator.next_url %}<a href="{{ url_for(paginator.next_url) }}">Older</a>{% endif %}
+</nav>
+{% endif %}
+{% endblock %}
+""",
+            encoding="utf-8",
+        )
+        print(f"Created {term}")
+
+    terms = theme / "templates" / "terms.html"
+    if not terms.exists():
+        terms.write_text(
+            """{% extends "base.html" %}
+{% block title %}{{ taxonomy.name }} | {{ site.title }}{% endblock %}
+{% block body %}
+<h1>{{ taxonomy.name }}</h1>
+<ul>
+  {% for term in taxonomy.terms %}
+  <li><a href="{{ url_for(term.url_path) }}">{{ term.name }}</a> ({{ term.count }})</li>
+  {% endfor %}
+</ul>
+{% endblock %}
+""",
+            encoding="utf-8",
+        )
+        print(f"Created {terms}")
+
+
+# Query side of pycobello.build.search: same tokenizer, stemmer and file layout.
+SEARCH_JS = """// Search the index written when search.enabled is set in pycobello.yml.
+// searchSite("/search/", "query") resolves to [{url, title, score}], best first.
+const STOPWORDS = new Set(
+  ("a an and are as at be but by for from has have in is it its of on or that the " +
+    "this to was were will with").split(" "));
+
+function stem(word) {
+  if (word.length <= 3 || !/^[a-z]+$/.test(word)) return word;
+  if (word.endsWith("ies") && word.length > 4) word = word.slice(0, -3) + "y";
+  else if (word.endsWith("s") && !/(ss|us|is)$/.test(word)) word = word.slice(0, -1);
+  for (const suffix of ["ingly", "edly", "ing", "ed", "ly"]) {
+    const base = word.slice(0, -suffix.length);
+    if (word.endsWith(suffix) && base.length >= 3 && /[aeiouy]/.test(base)) {
+      word = base;
+      const last = word[word.length - 1];
+      if (word.length > 3 && last === word[word.length - 2] && !"lsz".includes(last)) {
+        word = word.slice(0, -1);
+      }
+      break;
+    }
+  }
+  if (word.endsWith("e") && word.length > 3) word = word.slice(0, -1);
+  return word;
+}
+
+function tokenize(text) {
+  return (text.toLowerCase().match(/[\\p{L}\\p{N}]+/gu) || [])
+    .filter((w) => [...w].length <= 40 && !STOPWORDS.has(w))
+    .map(stem);
+}
+
+async function searchSite(base, query, limit = 20) {
+  const get = async (path) => (await fetch(base + path)).json();
+  const index = await get("index.json");
+  const terms = [...new Set(tokenize(query))];
+  const scores = new Map();
+  await Promise.all(terms.map(async (term) => {
+    const shard = index.shards[[...term].slice(0, index.prefix).join("")];
+    const postings = shard ? (await get(shard))[term] || [] : [];
+    const idf = Math.log(1 + index.docs / Math.max(1, postings.length / 2));
+    for (let i = 0; i < postings.length; i += 2) {
+      const [hits, score] = scores.get(postings[i]) || [0, 0];
+      scores.set(postings[i], [hits + 1, score + Math.log(1 + postings[i + 1]) * idf]);
+    }
+  }));
+  const top = [...scores].sort((a, b) => b[1][0] - a[1][0] || b[1][1] - a[1][1]).slice(0, limit);
+  const blocks = {};
+  for (const [doc] of top) {
+    const n = Math.floor(doc / index.block);
+    blocks[n] = blocks[n] || get(`d/${n}.json`);
+  }
+  return Promise.all(top.map(async ([doc, [, score]]) => {
+    const [url, title] = (await blocks[Math.floor(doc / index.block)])[doc % index.block];
+    return { url, title, score };
+  }));
+}
+"""
+
 
 def _update_gitignore(root: Path) -> None:
     gi = root / ".gitignore"
@@ -0,0 +1,50 @@
+"""Static asset sync: overlay, skip-unchanged, stale removal, hardlinks."""
+
+from pathlib import Path
+
+from pycobello.build.assets import sync_assets
+
+
+def _tree(root: Path, files: dict[str, str]) -> Path:
+    for rel, text in files.items():
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+    return root
+
+
+def test_user_static_overrides_theme_with_one_write(tmp_path: Path) -> None:
+    theme = _tree(tmp_path / "theme", {"style.css": "theme", "js/app.js": "app"})
+    user = _tree(tmp_path / "user", {"style.css": "user", "img/a.txt": "a"})
+    out = tmp_path / "out"
+    result = sync_assets([theme, user], out)
+    assert (out / "style.css").read_text() == "user"
+    assert (out / "js" / "app.js").read_text() == "app"
+    assert sorted(result.copied) == sorted(
+        str(out / rel) for rel in ("style.css", "js/app.js", "img/a.txt")
+    )
+    assert result.entries["style.css"]["src"] == str(user / "style.css")
+
+    again = sync_assets([theme, user], out, result.entries)
+    assert again.copied == []
+
+
+def test_removed_sources_are_deleted_from_output(tmp_path: Path) -> None:
+    user = _tree(tmp_path / "user", {"img/a.txt": "a", "b.txt": "b"})
+    out = tmp_path / "out"
+    (out / "keep.txt").parent.mkdir(parents=True)
+    (out / "keep.txt").write_text("not ours")
+    first = sync_assets([user], out)
+    (user / "img" / "a.txt").unlink()
+    result = sync_assets([user], out, first.entries)
+    assert result.removed == [str(out / "img" / "a.txt")]
+    assert not (out / "img").exists()
+    assert (out / "keep.txt").exists()
+
+
+def test_hardlink_mode_links_sources(tmp_path: Path) -> None:
+    user = _tree(tmp_path / "user", {"big.bin": "x" * 1000})
+    out = tmp_path / "out"
+    sync_assets([user], out, hardlink=True)
+    assert (out / "big.bin").stat().st_ino == (user / "big.bin").stat().st_ino
+    assert sync_assets([user], out, hardlink=True).copied == []
@@ -0,0 +1,37 @@
+"""Benchmark harness: synthetic site generation and baseline comparison."""
+
+from pathlib import Path
+
+from benchmarks.run import compare, main
+from benchmarks.sitegen import SiteSpec, generate_site
+
+from pycobello.build.pipeline import run_pipeline
+from pycobello.config.load import load_config
+
+
+def test_generated_site_builds_cleanly(tmp_path: Path) -> None:
+    """A small synthetic site builds without errors and has the requested size."""
+    spec = SiteSpec(posts=12, pages=3, paragraphs=2, template_depth=2, assets=4, asset_bytes=64)
+    root = generate_site(tmp_path / "site", spec)
+    result = run_pipeline(load_config(str(root)), project_root=root)
+    assert not result.errors
+    assert len(list((root / "content" / "posts").glob("*.md"))) == 12
+    assert len(list((root / "dist" / "static" / "assets").iterdir())) == 4
+    assert 'class="level2"' in (root / "dist" / "index.html").read_text()
+
+
+def test_compare_flags_regressions_beyond_tolerance() -> None:
+    baseline = {"cold": {"seconds": 1.0, "peak_rss_mb": 50.0}}
+    assert compare({"cold": {"seconds": 1.1, "peak_rss_mb": 50.0}}, baseline) == []
+    problems = compare({"cold": {"seconds": 1.5, "peak_rss_mb": 50.0}}, baseline)
+    assert problems and problems[0].startswith("cold: seconds")
+
+
+def test_compare_without_baseline_fails_clearly(tmp_path: Path, capsys) -> None:
+    assert main(["--compare", "--baseline", str(tmp_path / "missing.json")]) == 2
+    assert "--save-baseline" in capsys.readouterr().out
+
+
+def test_compare_skips_unavailable_memory_metric() -> None:
+    baseline = {"cold": {"seconds": 1.0, "peak_rss_mb": None}}
+    assert compare({"cold": {"seconds": 1.0, "peak_rss_mb": 80.0}}, baseline) == []
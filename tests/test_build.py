@@ -27,3 +27,349 @@ def test_incremental_build_skips_unchanged(project_root: Path) -> None:
     assert not result2.errors
     # Second run should have nothing written (or only index if we don't cache it)
     assert len(result2.written) == 0, f"Expected no writes on second run, got {result2.written}"
+
+
+def test_incremental_build_rerenders_only_edited_item(project_root: Path) -> None:
+    """Editing one post re-renders that post and the index; other items are skipped."""
+    config = load_config(str(project_root))
+    run_pipeline(config, project_root=project_root, clean=True)
+    post = next((project_root / "content" / "posts").glob("*.md"))
+    post.write_text(post.read_text() + "\nMore text.\n")
+    result = run_pipeline(config, project_root=project_root)
+    assert not result.errors
+    dist = project_root / "dist"
+    assert result.written == [str(dist / "blog" / "hello" / "index.html")]
+    assert str(dist / "about" / "index.html") in result.skipped
+
+
+def test_incremental_build_rerenders_on_template_change(project_root: Path) -> None:
+    """A template edit invalidates skipped outputs."""
+    config = load_config(str(project_root))
+    run_pipeline(config, project_root=project_root, clean=True)
+    page_tpl = project_root / "theme" / "templates" / "page.html"
+    page_tpl.write_text(page_tpl.read_text().replace("<article>", "<article class='page'>"))
+    result = run_pipeline(config, project_root=project_root)
+    about = project_root / "dist" / "about" / "index.html"
+    assert str(about) in result.written
+    assert "class='page'" in about.read_text()
+
+
+def test_partial_template_change_rebuilds_only_dependents(project_root: Path) -> None:
+    """Editing a template rebuilds only outputs whose render loaded it."""
+    templates = project_root / "theme" / "templates"
+    (templates / "partials").mkdir()
+    (templates / "partials" / "footer.html").write_text("<footer>v1</footer>")
+    page_tpl = templates / "page.html"
+    page_tpl.write_text(
+        page_tpl.read_text().replace("</article>", "</article>{% include 'partials/footer.html' %}")
+    )
+    config = load_config(str(project_root))
+    run_pipeline(config, project_root=project_root, clean=True)
+
+    (templates / "partials" / "footer.html").write_text("<footer>v2</footer>")
+    result = run_pipeline(config, project_root=project_root)
+    dist = project_root / "dist"
+    assert result.written == [str(dist / "about" / "index.html")]
+    assert "v2" in (dist / "about" / "index.html").read_text()
+
+    post_tpl = templates / "post.html"
+    post_tpl.write_text(post_tpl.read_text().replace("<article>", "<article class='post'>"))
+    result = run_pipeline(config, project_root=project_root)
+    assert result.written == [str(dist / "blog" / "hello" / "index.html")]
+    assert str(dist / "about" / "index.html") in result.skipped
+
+
+def test_creating_missing_template_rebuilds_dependents(project_root: Path) -> None:
+    """A template looked up but missing (``ignore missing``) is a dependency too."""
+    templates = project_root / "theme" / "templates"
+    page_tpl = templates / "page.html"
+    page_tpl.write_text(
+        page_tpl.read_text().replace(
+            "</article>", "</article>{% include 'partials/extra.html' ignore missing %}"
+        )
+    )
+    config = load_config(str(project_root))
+    run_pipeline(config, project_root=project_root, clean=True)
+    assert not run_pipeline(config, project_root=project_root).written
+
+    (templates / "partials").mkdir()
+    (templates / "partials" / "extra.html").write_text("<aside>extra</aside>")
+    result = run_pipeline(config, project_root=project_root)
+    about = project_root / "dist" / "about" / "index.html"
+    assert result.written == [str(about)]
+    assert "<aside>extra</aside>" in about.read_text()
+
+
+def test_full_build_rerenders_everything(project_root: Path, monkeypatch) -> None:
+    """incremental=False renders every item even when nothing changed."""
+    from pycobello.build import pipeline, renderer
+
+    config = load_config(str(project_root))
+    run_pipeline(config, project_root=project_root, clean=True)
+    rendered: list[str] = []
+    original = pipeline.render_template
+
+    def spy(env, name, ctx, loaded=None):
+        rendered.append(name)
+        return original(env, name, ctx, loaded)
+
+    monkeypatch.setattr(pipeline, "render_template", spy)
+    monkeypatch.setattr(renderer, "render_template", spy)
+    run_pipeline(config, project_root=project_root)
+    assert rendered == []
+    run_pipeline(config, project_root=project_root, incremental=False)
+    assert sorted(rendered) == ["index.html", "page.html", "post.html"]
+
+
+def test_parallel_build_matches_serial(project_root: Path) -> None:
+    """Rendering with a process pool produces the same outputs as a serial build."""
+    for i in range(4):
+        (project_root / "content" / "posts" / f"2024-01-0{i + 1}-p{i}.md").write_text(
+            f"---\ntitle: Post {i}\ndate: 2024-01-0{i + 1}\n---\n\nBody *{i}*.\n"
+        )
+    config = load_config(str(project_root))
+    serial = run_pipeline(config, project_root=project_root, clean=True)
+    dist = project_root / "dist"
+    expected = {p: Path(p).read_text() for p in serial.written}
+    parallel = run_pipeline(config, project_root=project_root, clean=True, jobs=2)
+    assert not parallel.errors
+    assert parallel.written == serial.written
+    assert {p: Path(p).read_text() for p in parallel.written} == expected
+    assert "<em>3</em>" in (dist / "blog" / "post-3" / "index.html").read_text()
+
+
+def test_markdown_rendered_once_per_item(project_root: Path, monkeypatch) -> None:
+    """Collections and page renders share one Markdown render per body."""
+    from pycobello.build import renderer
+    from pycobello.content.markdown import _md
+
+    calls: list[str] = []
+    original = renderer.markdown_to_html
+
+    def spy(text: str, store=None) -> str:
+        calls.append(text)
+        return original(text, store)
+
+    monkeypatch.setattr(renderer, "markdown_to_html", spy)
+    config = load_config(str(project_root))
+    result = run_pipeline(config, project_root=project_root, clean=True)
+    assert not result.errors
+    assert len(calls) == 2
+    assert _md() is _md()
+
+
+def test_profiler_records_stages_and_renders(project_root: Path, tmp_path: Path) -> None:
+    """A profiled build reports stage times, per-item renders and a Chrome trace."""
+    import json
+
+    from pycobello.build.profile import Profiler
+
+    profiler = Profiler()
+    config = load_config(str(project_root))
+    run_pipeline(config, project_root=project_root, clean=True, profiler=profiler)
+    assert {"discover", "hash", "render", "markdown", "jinja", "write", "assets"} <= set(
+        profiler.stages
+    )
+    assert {i["template"] for i in profiler.items} >= {"index.html", "post.html", "page.html"}
+    assert "Slowest" in profiler.report(top=2)
+    trace_path = tmp_path / "trace.json"
+    profiler.write(trace_path)
+    trace = json.loads(trace_path.read_text())
+    assert any(e["cat"] == "render" for e in trace["traceEvents"])
+    assert len(trace["otherData"]["slowest_items"]) == 3
+
+
+def test_noop_build_short_circuits_on_stat_stamp(project_root: Path) -> None:
+    """With nothing changed since the last build, build returns up to date at once."""
+    import os
+    import time
+
+    old = time.time() - 60
+    for path in project_root.rglob("*"):
+        os.utime(path, (old, old))
+    config = load_config(str(project_root))
+    first = run_pipeline(config, project_root=project_root, clean=True)
+    assert not first.up_to_date
+    assert (project_root / ".pycobello" / "stamp").exists()
+    assert run_pipeline(config, project_root=project_root).up_to_date
+    assert not run_pipeline(config, project_root=project_root, incremental=False).up_to_date
+
+    about = project_root / "content" / "pages" / "about.md"
+    about.write_text(about.read_text() + "\nMore.\n")
+    result = run_pipeline(config, project_root=project_root)
+    assert not result.up_to_date
+    assert str(project_root / "dist" / "about" / "index.html") in result.written
+    # The edit is too recent to trust its mtime, so no stamp is recorded yet.
+    assert not (project_root / ".pycobello" / "stamp").exists()
+
+
+def test_noop_stamp_covers_in_memory_config(project_root: Path) -> None:
+    """A config changed in code (not on disk) is not mistaken for an up-to-date build."""
+    import os
+    import time
+
+    old = time.time() - 60
+    for path in project_root.rglob("*"):
+        os.utime(path, (old, old))
+    config = load_config(str(project_root))
+    run_pipeline(config, project_root=project_root, clean=True)
+    assert run_pipeline(config, project_root=project_root).up_to_date
+
+    config.site.title = "Changed"
+    result = run_pipeline(config, project_root=project_root)
+    assert not result.up_to_date
+    assert "Changed" in (project_root / "dist" / "about" / "index.html").read_text()
+    config.build.clean_urls = False
+    result = run_pipeline(config, project_root=project_root)
+    assert not result.up_to_date
+    assert (project_root / "dist" / "about.html").exists()
+
+
+def test_orphaned_outputs_are_pruned(project_root: Path) -> None:
+    """Deleting or renaming an item removes its old output and empty directories."""
+    config = load_config(str(project_root))
+    run_pipeline(config, project_root=project_root, clean=True)
+    dist = project_root / "dist"
+    (dist / "notes.txt").write_text("not produced by the build")
+    about = project_root / "content" / "pages" / "about.md"
+    about.write_text(about.read_text().replace("title: About", "title: About Us"))
+    result = run_pipeline(config, project_root=project_root)
+    assert result.removed == [str(dist / "about" / "index.html")]
+    assert not (dist / "about").exists()
+    assert (dist / "about-us" / "index.html").exists()
+    assert (dist / "notes.txt").exists()
+
+
+def test_deleted_output_is_restored(project_root: Path) -> None:
+    """An output deleted from dist/ is written again, not skipped as unchanged."""
+    config = load_config(str(project_root))
+    run_pipeline(config, project_root=project_root, clean=True)
+    dist = project_root / "dist"
+    post = dist / "blog" / "hello" / "index.html"
+    index = dist / "index.html"
+    post.unlink()
+    index.unlink()
+    result = run_pipeline(config, project_root=project_root)
+    assert sorted(result.written) == sorted([str(post), str(index)])
+    assert post.exists() and index.exists()
+
+
+def test_failed_render_keeps_output_for_later_pruning(project_root: Path) -> None:
+    """While a build has errors nothing is pruned, and the output stays tracked."""
+    config = load_config(str(project_root))
+    run_pipeline(config, project_root=project_root, clean=True)
+    about = project_root / "content" / "pages" / "about.md"
+    about.write_text(about.read_text().replace("title: About", "title: About\ntemplate: nope.html"))
+    result = run_pipeline(config, project_root=project_root)
+    assert result.errors and not result.removed
+    about.unlink()
+    result = run_pipeline(config, project_root=project_root)
+    assert not result.errors
+    assert result.removed == [str(project_root / "dist" / "about" / "index.html")]
+
+
+def test_atomic_output_swaps_staged_tree(project_root: Path) -> None:
+    """With atomic_output, builds go to a staged copy that replaces dist/ at the end."""
+    cfg = project_root / "pycobello.yml"
+    cfg.write_text(cfg.read_text().replace("atomic_output: false", "atomic_output: true"))
+    config = load_config(str(project_root))
+    dist = project_root / "dist"
+    run_pipeline(config, project_root=project_root, clean=True)
+    about = dist / "about" / "index.html"
+    about_inode = about.stat().st_ino
+
+    post = next((project_root / "content" / "posts").glob("*.md"))
+    post.write_text(post.read_text() + "\nMore text.\n")
+    result = run_pipeline(config, project_root=project_root)
+    assert result.written == [str(dist / "blog" / "hello" / "index.html")]
+    assert "More text." in (dist / "blog" / "hello" / "index.html").read_text()
+    assert about.stat().st_ino == about_inode
+    assert not (project_root / ".dist.staging").exists()
+    assert not list(dist.rglob("*.tmp"))
+
+    post.write_text(post.read_text().replace("title: Hello", "title: Hello\ntemplate: nope.html"))
+    result = run_pipeline(config, project_root=project_root)
+    assert result.errors and not result.written
+    assert "More text." in (dist / "blog" / "hello" / "index.html").read_text()
+    assert not (project_root / ".dist.staging").exists()
+
+
+def test_output_writer_batches_atomic_writes(tmp_path: Path) -> None:
+    from pycobello.build.writer import OutputWriter
+
+    writer = OutputWriter(fsync=True)
+    paths = [tmp_path / "a" / f"{i}" / "index.html" for i in range(5)]
+    for i, path in enumerate(paths):
+        assert writer.write_if_changed(path, f"page {i}", None)[0]
+        assert not path.exists()
+    did_write, digest = writer.write_if_changed(paths[0], "page 0", None)
+    writer.flush()
+    assert [p.read_text() for p in paths] == [f"page {i}" for i in range(5)]
+    assert writer.write_if_changed(paths[0], "page 0", digest) == (False, digest)
+    assert not list(tmp_path.rglob("*.tmp"))
+
+
+def test_output_writer_writes_a_path_queued_twice_once(tmp_path: Path) -> None:
+    """Two queued writes to one path must not race on its temp file."""
+    from pycobello.build.writer import OutputWriter
+
+    writer = OutputWriter()
+    target = tmp_path / "index.html"
+    others = [tmp_path / f"{i}.html" for i in range(8)]
+    writer.write_if_changed(target, "first", None)
+    for path in others:
+        writer.write_if_changed(path, path.name, None)
+    writer.write_if_changed(target, "second", None)
+    assert writer._pending_bytes == sum(len(p.name) for p in others) + len("second")
+    writer.flush()
+    assert target.read_text() == "second"
+    assert not list(tmp_path.glob(".*.tmp"))
+
+
+def test_hash_backend_switch_rebuilds_once(project_root: Path) -> None:
+    import os
+    import time
+
+    from pycobello.build.cache import BuildCache, use_hash_backend
+
+    # Old mtimes: cached digests would be reused by stat alone unless discarded.
+    old = time.time() - 60
+    for path in project_root.rglob("*"):
+        os.utime(path, (old, old))
+    cfg = project_root / "pycobello.yml"
+    cfg.write_text(cfg.read_text().replace("hash: auto", "hash: blake2b"))
+    config = load_config(str(project_root))
+    assert config.build.hash == "blake2b"
+    try:
+        first = run_pipeline(config, project_root=project_root)
+        cache = BuildCache(project_root / ".pycobello" / "cache.db", project_root)
+        assert cache.meta("hash") == "blake2b"
+        for table in ("outputs", "files", "templates"):
+            assert all(len(e["hash"]) == 32 for e in cache[table].values())
+        cache.close()
+
+        config.build.hash = "sha256"
+        switched = run_pipeline(config, project_root=project_root)
+        assert sorted(switched.written) == sorted(first.written)
+        assert run_pipeline(config, project_root=project_root).written == []
+        cache = BuildCache(project_root / ".pycobello" / "cache.db", project_root)
+        for table in ("outputs", "files", "templates"):
+            assert all(len(e["hash"]) == 64 for e in cache[table].values())
+        cache.close()
+    finally:
+        use_hash_backend("auto")
+
+
+def test_backlinks_in_templates_follow_link_edits(project_root: Path) -> None:
+    posts = project_root / "content" / "posts"
+    linker = posts / "2024-02-01-linker.md"
+    linker.write_text("---\ntitle: Linker\ndate: 2024-02-01\n---\n\nSee [hello](/blog/hello/).\n")
+    config = load_config(str(project_root))
+    run_pipeline(config, project_root=project_root)
+    hello = project_root / "dist" / "blog" / "hello" / "index.html"
+    assert '<a href="/blog/linker">Linker</a>' in hello.read_text()
+
+    linker.write_text(linker.read_text().replace("[hello](/blog/hello/)", "nothing"))
+    result = run_pipeline(config, project_root=project_root)
+    assert str(hello) in result.written
+    assert "Linked from" not in hello.read_text()
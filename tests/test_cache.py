@@ -0,0 +1,71 @@
+"""Tests for the SQLite build cache."""
+
+import sqlite3
+from pathlib import Path
+
+from pycobello.build.cache import BuildCache
+from pycobello.build.pipeline import run_pipeline
+from pycobello.config.load import load_config
+
+
+def test_cache_round_trip_with_relative_paths(tmp_path: Path) -> None:
+    db = tmp_path / ".pycobello" / "cache.db"
+    source = str(tmp_path / "content" / "a.md")
+    cache = BuildCache(db, tmp_path)
+    cache.save(
+        meta={"hash": "sha256"},
+        files={source: {"mtime": 1.5, "size": 3, "hash": "abc"}},
+        outputs={
+            "a/index.html": {"hash": "h", "templates": {"post.html": "t"}, "collections": None}
+        },
+        source_to_output={source: "a/index.html"},
+    )
+    cache.close()
+
+    conn = sqlite3.connect(db)
+    assert conn.execute("SELECT path FROM files").fetchall() == [("content/a.md",)]
+    conn.close()
+
+    cache = BuildCache(db, tmp_path)
+    assert cache.meta("hash") == "sha256"
+    assert cache["files"][source] == {"mtime": 1.5, "size": 3, "hash": "abc"}
+    assert cache["outputs"]["a/index.html"] == {"hash": "h", "templates": {"post.html": "t"}}
+    assert list(cache["source_to_output"]) == [source]
+    assert cache["source_to_output"][source] == "a/index.html"
+    assert "missing" not in cache["outputs"]
+    cache.close()
+
+
+def test_cache_save_writes_only_changes_and_collects_deleted(tmp_path: Path) -> None:
+    cache = BuildCache(tmp_path / "cache.db", tmp_path)
+    rows = {f"{i}.html": {"hash": str(i)} for i in range(5)}
+    assert cache.save(outputs=rows) == 5
+
+    outputs = cache["outputs"]
+    kept = {k: outputs[k] for k in ("0.html", "1.html")}
+    kept["2.html"] = {"hash": "changed"}
+    assert cache.save(outputs=kept) == 2 + 1  # two deleted, one updated
+    assert dict(cache["outputs"]) == kept
+    cache.close()
+
+
+def test_unreadable_cache_is_discarded(tmp_path: Path) -> None:
+    db = tmp_path / "cache.db"
+    db.write_bytes(b"not a database" * 100)
+    cache = BuildCache(db, tmp_path)
+    assert len(cache["files"]) == 0
+    cache.close()
+
+
+def test_build_cache_drops_deleted_sources(project_root: Path) -> None:
+    config = load_config(str(project_root))
+    run_pipeline(config, project_root=project_root)
+    post = next((project_root / "content" / "posts").glob("*.md"))
+    post.unlink()
+    run_pipeline(config, project_root=project_root)
+
+    cache = BuildCache(project_root / ".pycobello" / "cache.db", project_root)
+    assert str(post) not in cache["files"]
+    assert str(post) not in cache["source_to_output"]
+    assert "blog/hello/index.html" not in cache["outputs"]
+    cache.close()
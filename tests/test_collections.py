@@ -0,0 +1,144 @@
+"""Lazy collection context and collection-aware incremental builds."""
+
+from pathlib import Path
+
+from pycobello.build.pipeline import run_pipeline
+from pycobello.config.load import load_config
+from pycobello.content.model import ContentItem, ContentKind
+from pycobello.render.collections import CollectionsView
+from pycobello.render.pagination import paginate, paginator_ctx
+
+
+def _items(n: int) -> list[ContentItem]:
+    return [
+        ContentItem(
+            kind=ContentKind.POST,
+            source_path=Path(f"p{i}.md"),
+            front_matter={"title": f"Post {i}"},
+            body_markdown=f"*{i}*",
+            slug=f"p{i}",
+            url_path=f"/blog/p{i}",
+        )
+        for i in range(n)
+    ]
+
+
+def test_lazy_collection_renders_content_on_access() -> None:
+    """Metadata reads don't render bodies; reading content renders just that item."""
+    rendered: list[str] = []
+
+    def html_for(item: ContentItem) -> str:
+        rendered.append(item.slug)
+        return f"<p>{item.slug}</p>"
+
+    view = CollectionsView({"posts": _items(5)}, html_for)
+    posts = view["posts"]
+    assert [p["title"] for p in posts] == [f"Post {i}" for i in range(5)]
+    assert rendered == []
+    assert view.access.level == 1
+    assert posts[3]["content"] == "<p>p3</p>"
+    assert rendered == ["p3"]
+    assert view.access.level == 2
+
+
+def test_lazy_collection_slices_and_pages_are_views() -> None:
+    """Slicing and paging return views with the expected items."""
+    posts = CollectionsView({"posts": _items(7)}, str)["posts"]
+    assert [p["slug"] for p in posts[2:4]] == ["p2", "p3"]
+    assert posts.page_count(3) == 3
+    assert [p["slug"] for p in posts.page(3, 3)] == ["p6"]
+    assert len(posts.page(4, 3)) == 0
+    assert posts[-1]["slug"] == "p6"
+
+
+def test_lazy_collections_concatenate_without_rendering() -> None:
+    """``+`` joins collections like plain lists; membership tests don't render bodies."""
+    from jinja2 import Environment
+
+    rendered: list[str] = []
+
+    def html_for(item: ContentItem) -> str:
+        rendered.append(item.slug)
+        return ""
+
+    items = _items(3)
+    view = CollectionsView({"posts": items[:2], "pages": items[2:]}, html_for)
+    template = Environment().from_string(
+        "{% for x in collections.posts + collections.pages %}{{ x.slug }} {% endfor %}"
+        "{{ collections.posts[1] in collections.posts }}"
+        " {{ collections.pages[0] in collections.posts }}"
+    )
+    assert template.render(collections=view) == "p0 p1 p2 True False"
+    assert [x["slug"] for x in [view["pages"][0]] + view["posts"]] == ["p2", "p0", "p1"]
+    assert rendered == []
+    assert view.access.level == 1
+
+
+def test_listing_template_rebuilds_on_sibling_title_change(project_root: Path) -> None:
+    """A page reading collections re-renders when listing metadata changes, not on body edits."""
+    page_tpl = project_root / "theme" / "templates" / "page.html"
+    page_tpl.write_text(
+        page_tpl.read_text().replace(
+            "</article>", "</article>{% for p in collections.posts %}{{ p.title }}{% endfor %}"
+        )
+    )
+    config = load_config(str(project_root))
+    run_pipeline(config, project_root=project_root, clean=True)
+    about = project_root / "dist" / "about" / "index.html"
+    post = next((project_root / "content" / "posts").glob("*.md"))
+
+    post.write_text(post.read_text() + "\nMore body.\n")
+    result = run_pipeline(config, project_root=project_root)
+    assert str(about) in result.skipped
+
+    post.write_text(post.read_text().replace("title: Hello", "title: Howdy"))
+    result = run_pipeline(config, project_root=project_root)
+    assert str(about) in result.written
+    assert "Howdy" in about.read_text()
+
+
+def test_paginate_urls_and_slices() -> None:
+    """Pages hold consecutive slices; page 1 lives at the base URL."""
+    pages = paginate(_items(5), 2, "archive.html", "/blog/", "posts")
+    assert [p.url_path for p in pages] == ["/blog/", "/blog/page/2/", "/blog/page/3/"]
+    assert [len(p.items) for p in pages] == [2, 2, 1]
+    ctx = paginator_ctx(pages[1], lambda item: "")
+    assert ctx["prev_url"] == "/blog/"
+    assert ctx["next_url"] == "/blog/page/3/"
+    assert paginator_ctx(pages[2], lambda item: "")["next_url"] is None
+    assert len(paginate([], 2, "archive.html", "/blog/", "posts")) == 1
+
+
+def test_paginated_listings_rebuild_only_changed_pages(project_root: Path) -> None:
+    """Editing a post re-renders the listing pages that show it, not the others."""
+    cfg = project_root / "pycobello.yml"
+    cfg.write_text(
+        cfg.read_text()
+        .replace("per_page: 0", "per_page: 2")
+        .replace('archive_template: ""', "archive_template: archive.html")
+    )
+    posts = project_root / "content" / "posts"
+    for day in range(1, 5):
+        (posts / f"2020-01-0{day}-p{day}.md").write_text(
+            f"---\ntitle: P{day}\ndate: 2020-01-0{day}\n---\n\nBody {day}.\n"
+        )
+    config = load_config(str(project_root))
+    result = run_pipeline(config, project_root=project_root, clean=True)
+    assert not result.errors
+    dist = project_root / "dist"
+    for rel in ("index.html", "page/2", "page/3", "blog", "blog/page/2", "blog/page/3"):
+        assert (dist / rel if rel.endswith(".html") else dist / rel / "index.html").exists()
+    assert "P1" in (dist / "blog" / "page" / "3" / "index.html").read_text()
+    assert "Page 1 of 3" in (dist / "index.html").read_text()
+
+    oldest = posts / "2020-01-01-p1.md"
+    oldest.write_text(oldest.read_text().replace("title: P1", "title: First"))
+    result = run_pipeline(config, project_root=project_root)
+    assert not result.errors
+    assert sorted(result.written) == sorted(
+        [
+            str(dist / "page" / "3" / "index.html"),
+            str(dist / "blog" / "page" / "3" / "index.html"),
+            str(dist / "blog" / "first" / "index.html"),
+        ]
+    )
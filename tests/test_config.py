@@ -32,3 +32,10 @@ def test_load_config_invalid_yaml(project_root: Path) -> None:
     with pytest.raises(ConfigError) as exc_info:
         load_config(str(project_root))
     assert "Invalid YAML" in str(exc_info.value) or "config" in str(exc_info.value).lower()
+
+
+def test_load_config_rejects_unknown_hash_backend(project_root: Path) -> None:
+    cfg = project_root / "pycobello.yml"
+    cfg.write_text(cfg.read_text().replace("hash: auto", "hash: md4"))
+    with pytest.raises(ConfigError):
+        load_config(str(project_root))
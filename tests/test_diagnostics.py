@@ -0,0 +1,146 @@
+"""Tests for diagnostics (pycobello check)."""
+
+from pathlib import Path
+
+import pytest
+
+from pycobello.config.load import load_config
+from pycobello.diagnostics.engine import run_diagnostics
+
+
+def _post(project_root: Path, slug: str, body: str) -> Path:
+    path = project_root / "content" / "posts" / f"2024-01-01-{slug}.md"
+    path.write_text(f"---\ntitle: {slug}\ndate: 2024-01-01\n---\n\n{body}\n")
+    return path
+
+
+def test_run_diagnostics_reports_broken_links(project_root: Path) -> None:
+    _post(project_root, "linker", "See [missing](/blog/missing/) and [about](/about/).")
+    errors = run_diagnostics(project_root, load_config(str(project_root)))
+    assert any("Broken internal link to /blog/missing/" in e for e in errors)
+    assert not any("/about/" in e for e in errors)
+
+
+def test_run_diagnostics_reports_invalid_front_matter_without_posts(project_root: Path) -> None:
+    import shutil
+
+    shutil.rmtree(project_root / "content" / "posts")
+    (project_root / "content" / "pages" / "broken.md").write_text("---\ntitle: [\n---\n\nBody.\n")
+    errors = run_diagnostics(project_root, load_config(str(project_root)))
+    assert any("broken.md: Invalid front matter" in e for e in errors)
+
+
+def test_check_reparses_only_changed_files(
+    project_root: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from pycobello.build import linkgraph
+
+    config = load_config(str(project_root))
+    linker = _post(project_root, "linker", "See [later](/blog/later/).")
+    assert any("/blog/later/" in e for e in run_diagnostics(project_root, config))
+
+    parsed: list[str] = []
+    extract = linkgraph._extract
+    monkeypatch.setattr(
+        linkgraph, "_extract", lambda item, store: parsed.append(item.slug) or extract(item)
+    )
+    assert any("/blog/later/" in e for e in run_diagnostics(project_root, config))
+    assert parsed == []
+
+    # A new target fixes the unchanged linker without re-parsing it.
+    _post(project_root, "later", "Hello.")
+    assert run_diagnostics(project_root, config) == []
+    assert parsed == ["later"]
+
+    linker.write_text(linker.read_text() + "\n[gone](/nowhere/)\n")
+    errors = run_diagnostics(project_root, config)
+    assert parsed == ["later", "linker"]
+    assert [e.rsplit(" ", 1)[1] for e in errors] == ["/nowhere/"]
+
+
+def test_link_graph_update_uses_pool_and_tracks_inbound(project_root: Path) -> None:
+    from pycobello.build.cache import BuildCache
+    from pycobello.build.linkgraph import MIN_PARALLEL_FILES, LinkGraph
+    from pycobello.content.discovery import discover_items
+
+    for i in range(MIN_PARALLEL_FILES):
+        _post(project_root, f"p{i}", f"[next](/blog/p{i + 1}/)")
+    config = load_config(str(project_root))
+    coll = {"posts": config.collections.posts, "pages": config.collections.pages}
+    items = discover_items(project_root / "content", coll)
+    cache = BuildCache(project_root / ".pycobello" / "cache.db", project_root)
+    graph = LinkGraph(cache)
+    update = graph.update(items, jobs=2)
+    assert len(update.parsed) == len(items)
+    errors = graph.check(items)
+    assert [e.rsplit(" ", 1)[1] for e in errors] == [f"/blog/p{MIN_PARALLEL_FILES}/"]
+    p1 = str(project_root / "content" / "posts" / "2024-01-01-p1.md")
+    assert graph.inbound()["/blog/p2"] == [p1]
+
+    # Deleting p2 breaks p1's link without re-parsing p1.
+    (project_root / "content" / "posts" / "2024-01-01-p2.md").unlink()
+    items = discover_items(project_root / "content", coll)
+    update = graph.update(items)
+    assert update.parsed == [] and len(update.removed) == 1
+    assert "/blog/p3" in update.affected and "/blog/p2" in update.affected
+    assert any(e.startswith(f"{p1}:") for e in graph.check(items))
+    cache.close()
+
+
+def test_check_output_finds_broken_refs_and_anchors(project_root: Path) -> None:
+    from pycobello.build.pipeline import run_pipeline
+    from pycobello.diagnostics.html import check_output
+
+    base = project_root / "theme" / "templates" / "base.html"
+    base.write_text(
+        base.read_text().replace(
+            "</body>",
+            '<img src="/static/missing.png" srcset="/static/logo.png 2x">'
+            '<a href="/about/#nope">x</a><a href="#site-end" id="site-end">y</a>'
+            '<a href="https://example.org/">ext</a></body>',
+        )
+    )
+    (project_root / "static").mkdir(exist_ok=True)
+    (project_root / "static" / "logo.png").write_bytes(b"png")
+    run_pipeline(load_config(str(project_root)), project_root=project_root)
+
+    errors = check_output(project_root / "dist")
+    pages = len(list((project_root / "dist").rglob("*.html")))
+    assert sum("Broken link to /static/missing.png" in e for e in errors) == pages
+    assert sum("Missing anchor #nope in /about/#nope" in e for e in errors) == pages
+    assert len(errors) == 2 * pages
+    assert all(e.startswith(str(project_root / "dist")) for e in errors)
+
+
+def test_check_output_resolves_relative_and_base_url(tmp_path: Path) -> None:
+    from pycobello.diagnostics.html import check_output
+
+    (tmp_path / "blog" / "a").mkdir(parents=True)
+    (tmp_path / "blog" / "a" / "index.html").write_text(
+        '<a href="../b">b</a> <a href="https://site.test/docs/blog/b#h">abs</a>'
+        ' <a href="/docs/blog/c">c</a> <a href="mailto:x@y">m</a>'
+    )
+    (tmp_path / "blog" / "b.html").write_text('<h2 id="h">b</h2>')
+    errors = check_output(tmp_path, base_url="https://site.test/docs/")
+    assert [e.split(": ", 1)[1] for e in errors] == ["Broken link to /docs/blog/c"]
+
+
+def test_scan_markup_skips_comments_and_raw_text() -> None:
+    from pycobello.diagnostics.html import scan_markup
+
+    scan = scan_markup(
+        "<!-- <a href=\"/hidden\"> --><p id=top-a class='x'>"
+        '<a href="/a?b=1&amp;c=2" name="n">t</a>\n'
+        '<script src="/s.js">var a = "<a href=\'/no\'>";</script>'
+        '<img src=/i.png srcset="/a.png 1x, /b.png 2x">\n'
+        '<a\n href="/multi">x</a><div data-x="a>b" id="y"></div>'
+    )
+    assert scan.ids == {"top-a", "n", "y"}
+    assert scan.refs == [
+        ("/a?b=1&c=2", 1),
+        ("/s.js", 2),
+        ("/i.png", 2),
+        ("/a.png", 2),
+        ("/b.png", 2),
+        ("/multi", 3),
+    ]
@@ -0,0 +1,92 @@
+"""Streaming discovery and on-demand body loading."""
+
+from pathlib import Path
+
+from pycobello.config.load import load_config
+from pycobello.content.discovery import discover, iter_items
+
+
+def _collections(project_root: Path) -> dict:
+    config = load_config(str(project_root))
+    return {"posts": config.collections.posts, "pages": config.collections.pages}
+
+
+def test_iter_items_yields_headers_without_bodies(project_root: Path) -> None:
+    """Discovered items carry front matter and stat, and load their body on demand."""
+    items = list(iter_items(project_root / "content", _collections(project_root)))
+    about = next(i for i in items if i.slug == "about")
+    assert about.body_markdown is None
+    assert about.size == (project_root / "content" / "pages" / "about.md").stat().st_size
+    assert about.front_matter == {"title": "About"}
+    assert about.load_body() == "About this site.\n"
+
+
+def test_load_body_normalizes_crlf(project_root: Path) -> None:
+    """CRLF files split correctly and load a newline-normalized body."""
+    page = project_root / "content" / "pages" / "crlf.md"
+    page.write_bytes(b"---\r\ntitle: CRLF\r\n---\r\n\r\nLine one.\r\nLine two.\r\n")
+    items = list(iter_items(project_root / "content", _collections(project_root)))
+    item = next(i for i in items if i.slug == "crlf")
+    assert item.load_body() == "Line one.\nLine two.\n"
+
+
+def test_discover_collects_front_matter_errors(project_root: Path) -> None:
+    """discover() records invalid front matter instead of raising."""
+    bad = project_root / "content" / "posts" / "bad.md"
+    bad.write_text("---\ntitle: [unclosed\n---\nBody")
+    result = discover(project_root / "content", _collections(project_root))
+    assert [p for p, _ in result.errors] == [bad]
+    assert {i.slug for i in result.items} == {"about", "hello"}
+
+
+def test_header_index_skips_reading_unchanged_files(project_root: Path, monkeypatch) -> None:
+    """A second discovery with the header index doesn't re-read or re-parse front matter."""
+    from datetime import date
+
+    from pycobello.build.cache import BuildCache
+    from pycobello.content.index import HeaderIndex
+
+    cache_path = project_root / ".pycobello" / "cache.db"
+    cache = BuildCache(cache_path, project_root)
+    index = HeaderIndex(cache)
+    first = list(iter_items(project_root / "content", _collections(project_root), index=index))
+    index.save()
+    cache.close()
+
+    def fail(*_a, **_k):
+        raise AssertionError("front matter re-read")
+
+    monkeypatch.setattr("pycobello.content.frontmatter.read_frontmatter", fail)
+    cache = BuildCache(cache_path, project_root)
+    index = HeaderIndex(cache)
+    second = list(iter_items(project_root / "content", _collections(project_root), index=index))
+    assert [(i.url_path, i.front_matter, i.body_offset) for i in second] == [
+        (i.url_path, i.front_matter, i.body_offset) for i in first
+    ]
+    post = next(i for i in second if i.kind.value == "post")
+    assert isinstance(post.front_matter["date"], date)
+    index.save()
+    cache.close()
+
+
+def test_header_index_is_relative_and_drops_deleted_sources(project_root: Path) -> None:
+    """Index rows are keyed by project-relative paths; deleted sources are dropped."""
+    import sqlite3
+
+    from pycobello.build.cache import BuildCache
+    from pycobello.content.index import HeaderIndex
+
+    cache_path = project_root / ".pycobello" / "cache.db"
+    about = project_root / "content" / "pages" / "about.md"
+    for _ in range(2):
+        cache = BuildCache(cache_path, project_root)
+        index = HeaderIndex(cache)
+        list(iter_items(project_root / "content", _collections(project_root), index=index))
+        index.save()
+        cache.close()
+        with sqlite3.connect(cache_path) as conn:
+            keys = sorted(k for (k,) in conn.execute("SELECT path FROM headers"))
+        conn.close()
+        assert all(not Path(k).is_absolute() for k in keys)
+        assert ("content/pages/about.md" in keys) == about.exists()
+        about.unlink(missing_ok=True)
@@ -0,0 +1,106 @@
+"""Tests for the external link checker (pycobello check --external)."""
+
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from pycobello.build.cache import BuildCache
+from pycobello.diagnostics.external import LinkChecker, check_external_links
+from pycobello.diagnostics.html import scan_output
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    requests: list[tuple[str, str]] = []
+
+    def _respond(self, send_body: bool) -> None:
+        self.requests.append((self.command, self.path))
+        status, headers = 200, {}
+        if self.path == "/missing":
+            status = 404
+        elif self.path == "/moved":
+            status, headers = 301, {"Location": "/ok"}
+        elif self.path == "/no-head" and self.command == "HEAD":
+            status = 405
+        body = b"hello"
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def do_HEAD(self) -> None:  # noqa: N802
+        self._respond(send_body=False)
+
+    def do_GET(self) -> None:  # noqa: N802
+        self._respond(send_body=True)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def server() -> Iterator[str]:
+    _Handler.requests = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_link_checker_statuses_redirects_and_keep_alive(server: str) -> None:
+    import asyncio
+
+    checker = LinkChecker(per_host=1, timeout=5)
+    urls = [f"{server}/ok", f"{server}/missing", f"{server}/moved", f"{server}/no-head"]
+    results = asyncio.run(checker.check_all([*urls, f"{server}/a", f"{server}/b"]))
+    assert results[f"{server}/ok"].ok
+    assert results[f"{server}/missing"].status == 404
+    assert results[f"{server}/moved"].status == 200
+    assert results[f"{server}/no-head"].status == 200
+    assert ("GET", "/no-head") in _Handler.requests
+    # One connection per host: HEAD responses keep it open for the next request.
+    assert checker.connections_opened < len(_Handler.requests)
+
+
+def test_link_checker_reports_connection_errors() -> None:
+    import asyncio
+    import socket
+
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    url = f"http://127.0.0.1:{port}/"
+    result = asyncio.run(LinkChecker(timeout=2).check_all([url]))[url]
+    assert not result.ok and result.error
+
+
+def test_check_external_links_caches_passing_results(tmp_path: Path, server: str) -> None:
+    dist = tmp_path / "dist"
+    dist.mkdir()
+    (dist / "index.html").write_text(
+        f'<a href="{server}/ok#top">ok</a>\n<a href="{server}/missing">gone</a>\n'
+        '<a href="https://example.com/self/">self</a>\n'
+    )
+    cache = BuildCache(tmp_path / "cache.db", tmp_path)
+    try:
+        errors = check_external_links(scan_output(dist), cache, "https://example.com")
+        assert errors == [
+            f"{dist / 'index.html'}:2: External link {server}/missing failed: HTTP 404"
+        ]
+        first = len(_Handler.requests)
+        errors = check_external_links(scan_output(dist), cache, "https://example.com")
+        assert len(errors) == 1
+        # Only the failing URL is requested again.
+        assert _Handler.requests[first:] == [("HEAD", "/missing")]
+        check_external_links(scan_output(dist), cache, "https://example.com", ttl_seconds=0)
+        assert ("HEAD", "/ok") in _Handler.requests[first + 1 :]
+    finally:
+        cache.close()
@@ -38,3 +38,21 @@ def test_parse_frontmatter_invalid_yaml() -> None:
     text = "---\ntitle: [unclosed\n---\nBody"
     with pytest.raises(FrontMatterError):
         parse_frontmatter(text)
+
+
+def test_read_frontmatter_matches_full_parse(tmp_path) -> None:
+    """Reading only leading bytes gives the same split as parsing the whole text."""
+    from pycobello.content.frontmatter import read_frontmatter, split_frontmatter
+
+    cases = [
+        "---\ntitle: Ünïcode\ndate: 2024-01-15\n---\n\n\nBody " + "x" * 50,
+        "\n\n---\r\ntitle: CRLF\r\n---\r\n\r\nBody\r\n",
+        "No front matter at all.",
+        "---\ntitle: never closed\n",
+        "---\n---\n",
+    ]
+    for n, text in enumerate(cases):
+        path = tmp_path / f"{n}.md"
+        path.write_bytes(text.encode("utf-8"))
+        normalized = text.replace("\r\n", "\n")
+        assert read_frontmatter(path, chunk_size=3) == split_frontmatter(normalized), text
@@ -0,0 +1,37 @@
+"""Markdown rendering and the rendered-fragment store."""
+
+import os
+from pathlib import Path
+
+from pycobello.content.fragments import FragmentStore
+from pycobello.content.markdown import markdown_signature, markdown_to_html
+
+
+def test_fragment_store_hit_skips_render(tmp_path: Path) -> None:
+    """A stored fragment is returned instead of rendering again."""
+    store = FragmentStore(tmp_path, markdown_signature())
+    assert markdown_to_html("# Hi", store) == "<h1>Hi</h1>\n"
+    store.put(store.key("# Hi"), "<h1>cached</h1>")
+    assert markdown_to_html("# Hi", store) == "<h1>cached</h1>"
+
+
+def test_fragment_key_depends_on_signature(tmp_path: Path) -> None:
+    """Changing the Markdown configuration signature changes keys."""
+    a = FragmentStore(tmp_path, "config-a")
+    b = FragmentStore(tmp_path, "config-b")
+    assert a.key("text") != b.key("text")
+
+
+def test_fragment_store_prune_evicts_least_recently_used(tmp_path: Path) -> None:
+    """Prune removes the oldest fragments until under max_bytes."""
+    store = FragmentStore(tmp_path, "sig", max_bytes=250)
+    keys = [store.key(str(i)) for i in range(3)]
+    for n, key in enumerate(keys):
+        store.put(key, "x" * 100)
+        path = tmp_path / key[:2] / f"{key}.html"
+        os.utime(path, (1000 + n, 1000 + n))
+    assert store.get(keys[0]) is not None  # refreshes keys[0]
+    assert store.prune() == 1
+    assert store.get(keys[1]) is None
+    assert store.get(keys[0]) is not None
+    assert store.get(keys[2]) is not None
@@ -0,0 +1,193 @@
+"""In-memory live preview site."""
+
+from pathlib import Path
+
+from pycobello.build.live import LiveSite
+
+
+def test_live_site_renders_on_request_and_caches(project_root: Path) -> None:
+    """Pages render lazily from memory; repeated requests reuse the cached page."""
+    site = LiveSite(project_root)
+    about = site.page("/about/")
+    assert about is not None and b"About this site." in about.content
+    assert site.page("/about/index.html") is about
+    assert b"<ul>" in site.page("/").content
+    assert site.page("/missing/") is None
+    assert not (project_root / "dist").exists()
+
+
+def test_live_site_invalidates_only_affected_pages(project_root: Path) -> None:
+    """A body edit drops that item's page; a template edit drops pages that loaded it."""
+    site = LiveSite(project_root)
+    post = next((project_root / "content" / "posts").glob("*.md"))
+    about, hello, index = site.page("/about/"), site.page("/blog/hello/"), site.page("/")
+
+    post.write_text(post.read_text() + "\nEdited.\n")
+    site.apply_changes([post])
+    assert site.page("/about/") is about
+    assert site.page("/") is index
+    assert b"Edited." in site.page("/blog/hello/").content
+
+    page_tpl = project_root / "theme" / "templates" / "page.html"
+    page_tpl.write_text(page_tpl.read_text().replace("<article>", "<article class='x'>"))
+    site.apply_changes([page_tpl])
+    assert b"class='x'" in site.page("/about/").content
+    assert site.page("/") is index
+    assert site.page("/blog/hello/") is not hello
+
+
+def test_live_site_drops_only_listing_pages_whose_slice_changed(project_root: Path) -> None:
+    """A body edit drops the archive page listing that item, not the other pages."""
+    cfg = project_root / "pycobello.yml"
+    cfg.write_text(
+        cfg.read_text().replace(
+            'per_page: 0\n    archive_template: ""',
+            "per_page: 1\n    archive_template: archive.html",
+        )
+    )
+    posts = project_root / "content" / "posts"
+    for day in (1, 2):
+        (posts / f"2024-01-0{day}-day{day}.md").write_text(
+            f"---\ntitle: Day {day}\ndate: 2024-01-0{day}\n---\n\nDay {day}.\n"
+        )
+    site = LiveSite(project_root)
+    pages = [site.page(url) for url in ("/blog/", "/blog/page/2/", "/blog/page/3/")]
+    assert all(page is not None for page in pages)
+    assert b"Day 1" in pages[2].content
+
+    day1 = posts / "2024-01-01-day1.md"
+    day1.write_text(day1.read_text() + "\nEdited.\n")
+    site.apply_changes([day1])
+    assert site.page("/blog/") is pages[0]
+    assert site.page("/blog/page/2/") is pages[1]
+    assert site.page("/blog/page/3/") is not pages[2]
+
+    day1.write_text(day1.read_text().replace("title: Day 1", "title: First day"))
+    site.apply_changes([day1])
+    assert site.page("/blog/page/2/") is pages[1]
+    assert b"First day" in site.page("/blog/page/3/").content
+
+
+def test_live_site_reloads_a_custom_config_file(project_root: Path) -> None:
+    """The config path comes from the loader, so a non-default file is watched."""
+    custom = project_root / "site.yml"
+    (project_root / "pycobello.yml").rename(custom)
+    site = LiveSite(project_root, "site.yml")
+    assert site.config_path == custom
+    custom.write_text(custom.read_text().replace("title: My Site", "title: Renamed"))
+    site.apply_changes([custom])
+    assert site.config.site.title == "Renamed"
+
+
+def test_live_site_static_overlay(project_root: Path) -> None:
+    """User static files take precedence over theme static files."""
+    (project_root / "theme" / "static" / "style.css").write_text("theme")
+    (project_root / "static" / "style.css").write_text("user")
+    site = LiveSite(project_root)
+    assert site.static_file("/static/style.css").read_text() == "user"
+    assert site.static_file("/static/../pycobello.yml") is None
+
+
+def _start(handler):
+    import threading
+
+    from pycobello.preview import _make_server
+
+    server = _make_server(0, handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def test_dist_server_etag_and_304(project_root: Path) -> None:
+    """dist/ is served with content-hash ETags; matching If-None-Match gets a 304."""
+    import hashlib
+    import http.client
+
+    from pycobello.build.pipeline import run_pipeline
+    from pycobello.config.load import load_config
+    from pycobello.preview import FileCache, _dist_handler
+
+    run_pipeline(load_config(str(project_root)), project_root=project_root)
+    dist = project_root / "dist"
+    about = dist / "about" / "index.html"
+    expected = hashlib.sha256(about.read_bytes()).hexdigest()
+    server = _start(_dist_handler(dist, FileCache()))
+    try:
+        conn = http.client.HTTPConnection("127.0.0.1", server.server_address[1])
+        conn.request("GET", "/about/")
+        resp = conn.getresponse()
+        body = resp.read()
+        assert resp.status == 200
+        assert b"About this site." in body
+        etag = resp.getheader("ETag")
+        assert etag == f'"{expected}"'
+        assert resp.getheader("Last-Modified")
+
+        conn.request("GET", "/about/", headers={"If-None-Match": etag})
+        resp = conn.getresponse()
+        resp.read()
+        assert resp.status == 304
+
+        # Rewritten mid-rebuild (before the build cache is saved): the ETag must
+        # follow the served body, or clients would get false 304s.
+        about.write_text(about.read_text().replace("About this site.", "Changed."))
+        conn.request("GET", "/about/", headers={"If-None-Match": etag})
+        resp = conn.getresponse()
+        body = resp.read()
+        assert resp.status == 200 and b"Changed." in body
+        assert resp.getheader("ETag") == f'"{hashlib.sha256(body).hexdigest()}"'
+
+        conn.request("GET", "/about")
+        resp = conn.getresponse()
+        resp.read()
+        assert resp.status == 301
+        assert resp.getheader("Location") == "/about/"
+
+        conn.request("GET", "/../pycobello.yml")
+        resp = conn.getresponse()
+        resp.read()
+        assert resp.status == 404
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_live_server_serves_pages_with_etag(project_root: Path) -> None:
+    """The live handler serves in-memory pages and answers conditional GETs."""
+    import http.client
+
+    from pycobello.preview import FileCache, _live_handler
+
+    site = LiveSite(project_root)
+    server = _start(_live_handler(site, FileCache()))
+    try:
+        conn = http.client.HTTPConnection("127.0.0.1", server.server_address[1])
+        conn.request("GET", "/blog/hello/")
+        resp = conn.getresponse()
+        assert b"First post." in resp.read()
+        etag = resp.getheader("ETag")
+        conn.request("GET", "/blog/hello/", headers={"If-None-Match": etag})
+        resp = conn.getresponse()
+        resp.read()
+        assert resp.status == 304
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_live_site_serves_archive_pages(project_root: Path) -> None:
+    """Paginated archive URLs resolve to listing pages in live mode."""
+    cfg = project_root / "pycobello.yml"
+    cfg.write_text(
+        cfg.read_text()
+        .replace("per_page: 0", "per_page: 1")
+        .replace('archive_template: ""', "archive_template: archive.html")
+    )
+    (project_root / "content" / "posts" / "2020-01-01-old.md").write_text(
+        "---\ntitle: Old\ndate: 2020-01-01\n---\n\nOld post.\n"
+    )
+    site = LiveSite(project_root)
+    page = site.page("/blog/page/2/")
+    assert page is not None
+    assert b"Old" in page.content
+    assert b"Page 2 of 2" in site.page("/page/2/").content
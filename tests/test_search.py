@@ -0,0 +1,120 @@
+"""Search index: tokenizer, sharded output and incremental updates."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from pycobello.build.pipeline import run_pipeline
+from pycobello.build.search import shard_file, stem, term_weights, tokenize
+from pycobello.config.load import load_config
+from pycobello.errors import ConfigError
+
+
+def _enable_search(project_root: Path, prefix_length: int = 2) -> None:
+    cfg = project_root / "pycobello.yml"
+    text = cfg.read_text().replace("enabled: false\n  output_dir", "enabled: true\n  output_dir")
+    cfg.write_text(text.replace("prefix_length: 2", f"prefix_length: {prefix_length}"))
+
+
+def _post(project_root: Path, slug: str, title: str, body: str) -> Path:
+    path = project_root / "content" / "posts" / f"2024-01-01-{slug}.md"
+    path.write_text(f"---\ntitle: {title}\ndate: 2024-01-01\n---\n\n{body}\n")
+    return path
+
+
+def _lookup(dist: Path, word: str) -> list[str]:
+    """URLs of documents containing ``word``, as the browser client finds them."""
+    search = dist / "search"
+    index = json.loads((search / "index.json").read_text())
+    term = stem(word)
+    shard = index["shards"].get(term[: index["prefix"]])
+    postings = json.loads((search / shard).read_text()).get(term, []) if shard else []
+    urls = []
+    for doc in postings[::2]:
+        block = json.loads((search / f"d/{doc // index['block']}.json").read_text())
+        urls.append(block[doc % index["block"]][0])
+    return urls
+
+
+def test_tokenize_stems_and_drops_stopwords() -> None:
+    assert tokenize("The Caches are caching; cached boxes!") == ["cach", "cach", "cach", "box"]
+    assert stem("running") == "run" and stem("studies") == "study" and stem("café") == "café"
+    weights = term_weights("Fast builds", "<p>Builds &amp; <code>build</code></p><!-- fast -->")
+    assert weights == {"fast": 5, "build": 7}
+    assert shard_file("ab") == "t/ab.json" and shard_file("é") == "t/_c3a9.json"
+
+
+def test_build_writes_sharded_index(project_root: Path) -> None:
+    _enable_search(project_root)
+    _post(project_root, "zebra", "Zebras", "Striped animals running wild.")
+    result = run_pipeline(load_config(str(project_root)), project_root=project_root)
+    assert not result.errors
+    dist = project_root / "dist"
+    assert _lookup(dist, "zebra") == ["/blog/zebras"]
+    assert _lookup(dist, "runs") == ["/blog/zebras"]
+    assert _lookup(dist, "about") == ["/about"]
+    index = json.loads((dist / "search" / "index.json").read_text())
+    assert index["docs"] == 3
+    assert all(len(prefix) <= 2 for prefix in index["shards"])
+
+
+def test_edit_rewrites_only_touched_shards(project_root: Path) -> None:
+    _enable_search(project_root)
+    config = load_config(str(project_root))
+    _post(project_root, "zebra", "Zebras", "Striped animals.")
+    run_pipeline(config, project_root=project_root)
+    dist = project_root / "dist"
+    shards = list((dist / "search" / "t").glob("*.json"))
+
+    def search_writes() -> list[str]:
+        result = run_pipeline(config, project_root=project_root)
+        return [Path(p).name for p in result.written if "/search/" in p]
+
+    # One weight changes: one shard; the block (same id, URL and title) is kept.
+    _post(project_root, "zebra", "Zebras", "Striped, striped animals.")
+    assert search_writes() == ["st.json"]
+    assert len(shards) > 3
+    # A term with a new prefix adds a shard, so the manifest changes too.
+    _post(project_root, "zebra", "Zebras", "Striped, striped animals and quokkas.")
+    assert search_writes() == ["index.json", "qu.json"]
+    assert _lookup(dist, "quokka") == ["/blog/zebras"]
+
+
+def test_removed_post_leaves_index_and_frees_its_id(project_root: Path) -> None:
+    _enable_search(project_root, prefix_length=1)
+    config = load_config(str(project_root))
+    zebra = _post(project_root, "zebra", "Zebras", "Striped animals.")
+    run_pipeline(config, project_root=project_root)
+    dist = project_root / "dist"
+    assert (dist / "search" / "t" / "z.json").exists()
+
+    zebra.unlink()
+    result = run_pipeline(config, project_root=project_root)
+    assert not result.errors
+    assert _lookup(dist, "zebra") == []
+    assert not (dist / "search" / "t" / "z.json").exists()
+    assert json.loads((dist / "search" / "index.json").read_text())["docs"] == 2
+
+    _post(project_root, "yak", "Yaks", "Shaggy animals.")
+    run_pipeline(config, project_root=project_root)
+    block = json.loads((dist / "search" / "d" / "0.json").read_text())
+    assert len(block) == 3 and ["/blog/yaks", "Yaks"] in block
+    assert _lookup(dist, "animal") == ["/blog/yaks"]
+
+
+def test_search_prefix_length_must_be_positive(project_root: Path) -> None:
+    _enable_search(project_root, prefix_length=0)
+    with pytest.raises(ConfigError):
+        load_config(str(project_root))
+
+
+def test_deleted_search_file_is_restored(project_root: Path) -> None:
+    _enable_search(project_root)
+    config = load_config(str(project_root))
+    run_pipeline(config, project_root=project_root, clean=True)
+    manifest = project_root / "dist" / "search" / "index.json"
+    manifest.unlink()
+    result = run_pipeline(config, project_root=project_root)
+    assert str(manifest) in result.written
+    assert manifest.exists()
@@ -0,0 +1,60 @@
+"""Taxonomy indexes and term pages."""
+
+from pathlib import Path
+
+from pycobello.build.pipeline import run_pipeline
+from pycobello.config.load import load_config
+from pycobello.content.model import ContentItem, ContentKind
+from pycobello.render.taxonomy import build_index
+
+
+def _item(name: str, tags) -> ContentItem:
+    return ContentItem(
+        kind=ContentKind.POST,
+        source_path=Path(f"{name}.md"),
+        front_matter={"title": name, "tags": tags},
+        body_markdown="",
+        slug=name,
+        url_path=f"/blog/{name}/",
+    )
+
+
+def test_build_index_inverts_terms_in_item_order() -> None:
+    """Each term maps to its items in input order; slug-equal names merge."""
+    a, b, c = _item("a", ["Python", "web"]), _item("b", "python"), _item("c", None)
+    index = build_index([a, b, c], "tags")
+    assert list(index) == ["python", "web"]
+    assert index["python"].name == "Python"
+    assert index["python"].items == [a, b]
+    assert index["web"].items == [a]
+
+
+def _post(project_root: Path, name: str, day: int, tags: list[str]) -> Path:
+    path = project_root / "content" / "posts" / f"2020-01-0{day}-{name}.md"
+    path.write_text(f"---\ntitle: {name}\ndate: 2020-01-0{day}\ntags: {tags}\n---\n\nText.\n")
+    return path
+
+
+def test_term_pages_update_only_affected_terms(project_root: Path) -> None:
+    """Adding a post re-renders its terms' pages and the term list, not other terms."""
+    cfg = project_root / "pycobello.yml"
+    cfg.write_text(cfg.read_text().replace("taxonomies: []", "taxonomies:\n  - tags"))
+    _post(project_root, "one", 1, ["alpha", "beta"])
+    config = load_config(str(project_root))
+    result = run_pipeline(config, project_root=project_root, clean=True)
+    assert not result.errors
+    dist = project_root / "dist"
+    assert "one" in (dist / "tags" / "alpha" / "index.html").read_text()
+    assert "alpha</a> (1)" in (dist / "tags" / "index.html").read_text()
+
+    two = _post(project_root, "two", 2, ["beta", "gamma"])
+    result = run_pipeline(config, project_root=project_root)
+    assert not result.errors
+    assert str(dist / "tags" / "alpha" / "index.html") in result.skipped
+    for rel in ("tags/beta", "tags/gamma", "tags", "blog/two"):
+        assert str(dist / rel / "index.html") in result.written
+
+    two.unlink()
+    result = run_pipeline(config, project_root=project_root)
+    assert not result.errors
+    assert not (dist / "tags" / "gamma" / "index.html").exists()